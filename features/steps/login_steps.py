@@ -5,12 +5,14 @@ This module contains step definitions for testing the Hudl login functionality.
 Organized into logical sections for better maintainability.
 """
 
-from behave import given, when, then
+from behave import given, when, then, step, use_step_matcher
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
+import logging
+import re
 import time
 
 # Import allure for enhanced reporting (optional - will work without it)
@@ -20,6 +22,20 @@ try:
 except ImportError:
     ALLURE_AVAILABLE = False
 
+logger = logging.getLogger('hudl.e2e')
+
+# Step patterns are anchored regular expressions, compiled once at import
+use_step_matcher('re')
+
+# Cookie names that indicate an authenticated session
+_AUTH_COOKIE_RE = re.compile(r'auth|session|token|user', re.IGNORECASE)
+
+
+def _normalize_url(url: str) -> tuple:
+    """Reduce a URL to (scheme, host, path) so trailing slashes, queries and fragments don't matter."""
+    parts = urlsplit(url)
+    return (parts.scheme, parts.netloc.lower(), parts.path.rstrip('/') or '/')
+
 
 def add_allure_step_info(step_name: str, description: str = ""):
     """Add step information to Allure report if available."""
@@ -28,6 +44,45 @@ def add_allure_step_info(step_name: str, description: str = ""):
         allure.dynamic.title(step_name)
 
 
+def _should_capture_screenshot(context, error) -> bool:
+    """
+    Decide whether a step failure needs a screenshot.
+    
+    Assertion failures already report actual vs expected values, so the screenshot is
+    skipped unless the scenario is tagged @screenshot_on_assert. Driver errors such as
+    timeouts always get one, since the page state is the diagnostic.
+    
+    Args:
+        context: Behave context object
+        error: The exception that occurred
+        
+    Returns:
+        True if a screenshot should be taken
+    """
+    if not isinstance(error, AssertionError):
+        return True
+    return 'screenshot_on_assert' in context.scenario.effective_tags
+
+
+def capture_failure_screenshot(context, error, screenshot_name: str, page=None) -> None:
+    """
+    Take a step failure screenshot when it adds diagnostic value.
+    
+    Args:
+        context: Behave context object
+        error: The exception that occurred
+        screenshot_name: Base name for screenshot file
+        page: Page object to take the screenshot with (defaults to the login page)
+    """
+    if _should_capture_screenshot(context, error):
+        page = page or context.pages.login_page
+        if ALLURE_AVAILABLE:
+            # Keep the screenshot in memory for the report instead of writing a file
+            page.attach_screenshot_to_allure(screenshot_name)
+        else:
+            page.take_screenshot(screenshot_name)
+
+
 def handle_step_failure(context, error, step_name: str, screenshot_name: str):
     """
     Centralized error handling for step failures with enhanced Allure reporting.
@@ -45,12 +100,16 @@ def handle_step_failure(context, error, step_name: str, screenshot_name: str):
         allure.dynamic.description(f"Step failed: {step_name}")
     
     # Use enhanced error reporting if available
-    if hasattr(context, 'login_page'):
-        context.login_page.attach_detailed_error_info_to_allure(
-            error_msg=error_msg,
-            context=f"Step failure in: {step_name}"
-        )
-        context.login_page.take_screenshot(screenshot_name)
+    if hasattr(context, 'pages'):
+        if _should_capture_screenshot(context, error):
+            context.pages.login_page.attach_detailed_error_info_to_allure(
+                error_msg=error_msg,
+                context=f"Step failure in: {step_name}"
+            )
+            context.pages.login_page.take_screenshot(screenshot_name)
+        elif ALLURE_AVAILABLE:
+            # The assertion message already carries the actual vs expected values
+            allure.attach(error_msg, name="Assertion Details", attachment_type=allure.attachment_type.TEXT)
     
     # Re-raise with enhanced message
     raise Exception(f"Step '{step_name}' failed: {error_msg}")
@@ -60,19 +119,19 @@ def handle_step_failure(context, error, step_name: str, screenshot_name: str):
 # NAVIGATION STEPS
 # ============================================================================
 
-@given('I am on the Hudl login page')
+@given(r'^I am on the Hudl login page$')
 def step_navigate_to_login_page(context):
     """Navigate to the Hudl login page."""
     try:
-        context.login_page.navigate_to_login_page()
-        print("✓ Navigated to Hudl login page")
+        context.pages.login_page.navigate_to_login_page()
+        logger.debug("✓ Navigated to Hudl login page")
     except Exception as e:
         # Enhanced error reporting for Allure
-        context.login_page.attach_detailed_error_info_to_allure(
+        context.pages.login_page.attach_detailed_error_info_to_allure(
             error_msg=str(e),
             context="Attempting to navigate to Hudl login page"
         )
-        context.login_page.take_screenshot("navigation_to_login_failed")
+        capture_failure_screenshot(context, e, "navigation_to_login_failed")
         raise Exception(f"Failed to navigate to login page: {e}")
 
 
@@ -80,50 +139,61 @@ def step_navigate_to_login_page(context):
 # VALID CREDENTIAL STEPS
 # ============================================================================
 
-@given('I enter a valid email address')
-@when('I enter a valid email address')
+@step(r'^I enter a valid email address$')
 def step_enter_valid_email(context):
     """Enter valid email from test data."""
     try:
-        valid_email = context.test_data['valid_credentials']['email']
-        context.login_page.enter_email(valid_email)
-        context.login_page.click_continue_button()
-        print(f"✓ Valid email entered: {valid_email}")
+        valid_email = context.td.valid_credentials.email
+        context.pages.login_page.submit_email(valid_email)
+        logger.debug("✓ Valid email entered: %s", valid_email)
     except Exception as e:
-        context.login_page.take_screenshot("valid_email_entry_failed")
+        capture_failure_screenshot(context, e, "valid_email_entry_failed")
         raise Exception(f"Failed to enter valid email: {e}")
 
 
-@when('I enter a valid password')
-@given('I enter a valid password')
+@step(r'^I enter a valid password$')
 def step_enter_valid_password(context):
     """Enter valid password from test data."""
     try:
-        valid_password = context.test_data['valid_credentials']['password']
-        context.login_page.enter_password(valid_password)
-        context.login_page.click_continue_button()
-        print("✓ Valid password entered")
+        valid_password = context.td.valid_credentials.password
+        context.pages.login_page.submit_password(valid_password, wait_for_quiet=True)
+        logger.debug("✓ Valid password entered")
     except Exception as e:
-        context.login_page.take_screenshot("valid_password_entry_failed")
+        capture_failure_screenshot(context, e, "valid_password_entry_failed")
         raise Exception(f"Failed to enter valid password: {e}")
 
 
-@given('I am logged in with valid credentials')
+@given(r'^I am logged in with valid credentials$')
 def step_login_with_valid_credentials(context):
-    """Log in with valid credentials as a prerequisite."""
+    """
+    Log in with valid credentials as a prerequisite.
+    
+    The first UI login's session is cached and restored for later scenarios; tag a
+    scenario @slow_login to always go through the login form.
+    """
     try:
-        context.execute_steps('''
-            When I enter a valid email address
-            And I enter a valid password
-        ''')
-        print("✓ Logged in with valid credentials")
+        login_page = context.pages.login_page
+        auth_state = context.session_cache.get('auth_state')
+        
+        if auth_state and 'slow_login' not in context.scenario.effective_tags and login_page.fast_login(auth_state):
+            logger.debug("✓ Logged in with valid credentials (restored session)")
+            return
+        
+        login_page.login(
+            context.td.valid_credentials.email,
+            context.td.valid_credentials.password,
+            wait_for_quiet=True
+        )
+        login_page.verify_redirect_url("home")
+        context.session_cache['auth_state'] = login_page.capture_auth_state()
+        logger.debug("✓ Logged in with valid credentials")
     except Exception as e:
         # Enhanced error reporting for critical login failures
-        context.login_page.attach_detailed_error_info_to_allure(
+        context.pages.login_page.attach_detailed_error_info_to_allure(
             error_msg=str(e),
             context="Attempting to log in with valid credentials (prerequisite step)"
         )
-        context.login_page.take_screenshot("login_prerequisite_failed")
+        capture_failure_screenshot(context, e, "login_prerequisite_failed")
         raise Exception(f"Failed to log in with valid credentials: {e}")
 
 
@@ -131,40 +201,37 @@ def step_login_with_valid_credentials(context):
 # INVALID CREDENTIAL STEPS
 # ============================================================================
 
-@when('I enter an invalid email address')
+@when(r'^I enter an invalid email address$')
 def step_enter_invalid_email(context):
     """Enter invalid email from test data."""
     try:
-        invalid_email = context.test_data['invalid_credentials']['email']
-        context.login_page.enter_email(invalid_email)
-        context.login_page.click_continue_button()
-        print(f"✓ Invalid email entered: {invalid_email}")
+        invalid_email = context.td.invalid_credentials.email
+        context.pages.login_page.submit_email(invalid_email)
+        logger.debug("✓ Invalid email entered: %s", invalid_email)
     except Exception as e:
-        context.login_page.take_screenshot("invalid_email_entry_failed")
+        capture_failure_screenshot(context, e, "invalid_email_entry_failed")
         raise Exception(f"Failed to enter invalid email: {e}")
 
 
-@when('I enter an invalid password')
+@when(r'^I enter an invalid password$')
 def step_enter_invalid_password(context):
     """Enter invalid password from test data."""
     try:
-        invalid_password = context.test_data['invalid_credentials']['password']
-        context.login_page.enter_password(invalid_password)
-        context.login_page.click_continue_button()
-        print("✓ Invalid password entered")
+        invalid_password = context.td.invalid_credentials.password
+        context.pages.login_page.submit_password(invalid_password)
+        logger.debug("✓ Invalid password entered")
     except Exception as e:
-        context.login_page.take_screenshot("invalid_password_entry_failed")
+        capture_failure_screenshot(context, e, "invalid_password_entry_failed")
         raise Exception(f"Failed to enter invalid password: {e}")
 
 
-@when('I enter an invalid email address "{email}"')
+@when(r'^I enter an invalid email address "(?P<email>[^"]+)"$')
 def step_enter_specific_invalid_email(context, email):
     """Enter a specific invalid email address."""
     try:
-        context.login_page.enter_email(email)
-        context.login_page.click_continue_button()
+        context.pages.login_page.submit_email(email)
     except Exception as e:
-        context.login_page.take_screenshot("invalid_email_entry_failed")
+        capture_failure_screenshot(context, e, "invalid_email_entry_failed")
         raise Exception(f"Failed to enter invalid email {email}: {e}")
 
 
@@ -172,27 +239,27 @@ def step_enter_specific_invalid_email(context, email):
 # EMPTY FIELD STEPS
 # ============================================================================
 
-@when('I leave the email field empty')
+@when(r'^I leave the email field empty$')
 def step_leave_email_field_empty(context):
     """Leave the email field empty (clear it if it has content)."""
     try:
-        context.login_page.clear_email()
-        context.login_page.click_continue_button()
-        print("✓ Email field left empty")
+        context.pages.login_page.clear_email()
+        context.pages.login_page.click_continue_button()
+        logger.debug("✓ Email field left empty")
     except Exception as e:
-        context.login_page.take_screenshot("clear_email_field_failed")
+        capture_failure_screenshot(context, e, "clear_email_field_failed")
         raise Exception(f"Failed to clear email field: {e}")
 
 
-@when('I leave the password field empty')
+@when(r'^I leave the password field empty$')
 def step_leave_password_field_empty(context):
     """Leave the password field empty (clear it if it has content)."""
     try:
-        context.login_page.clear_password()
-        context.login_page.click_continue_button()
-        print("✓ Password field left empty")
+        context.pages.login_page.clear_password()
+        context.pages.login_page.click_continue_button()
+        logger.debug("✓ Password field left empty")
     except Exception as e:
-        context.login_page.take_screenshot("clear_password_field_failed")
+        capture_failure_screenshot(context, e, "clear_password_field_failed")
         raise Exception(f"Failed to clear password field: {e}")
 
 
@@ -200,38 +267,38 @@ def step_leave_password_field_empty(context):
 # SUCCESS VERIFICATION STEPS
 # ============================================================================
 
-@then('I should be redirected to the dashboard page')
+@then(r'^I should be redirected to the dashboard page$')
 def step_check_dashboard_page_redirect(context):
     """Check if redirected to dashboard page."""
     try:
-        context.login_page.verify_redirect_url("home")
-        print("✓ Redirected to dashboard page")
+        context.pages.login_page.verify_redirect_url("home")
+        logger.debug("✓ Redirected to dashboard page")
     except Exception as e:
-        context.login_page.take_screenshot("dashboard_redirect_failed")
+        capture_failure_screenshot(context, e, "dashboard_redirect_failed")
         raise AssertionError(f"Failed to verify dashboard page redirect: {e}")
 
 
-@then('I should see my display name')
+@then(r'^I should see my display name$')
 def step_check_display_name(context):
     """Check if display name is visible."""
     try:
-        display_name = context.login_page.get_display_name()
-        expected_display_name = context.test_data['valid_credentials']['display_name']
+        display_name = context.pages.login_page.get_display_name()
+        expected_display_name = context.td.valid_credentials.display_name
         assert display_name == expected_display_name, \
             f"Expected display name '{expected_display_name}' but got '{display_name}'"
-        print(f"✓ Display name is visible: {display_name}")
+        logger.debug("✓ Display name is visible: %s", display_name)
     except Exception as e:
-        context.login_page.take_screenshot("display_name_check_failed")
+        capture_failure_screenshot(context, e, "display_name_check_failed")
         raise AssertionError(f"Failed to verify display name visibility: {e}")
 
 
-@then('I should remain on the login page')
+@then(r'^I should remain on the login page$')
 def step_remain_on_login_page(context):
     """Verify still on login page."""
     try:
-        context.login_page.verify_redirect_url("login")
+        context.pages.login_page.verify_redirect_url("login")
     except Exception as e:
-        context.login_page.take_screenshot("login_page_redirect_failed")
+        capture_failure_screenshot(context, e, "login_page_redirect_failed")
         raise AssertionError(f"Failed to verify login page redirect: {e}")
 
 
@@ -239,61 +306,61 @@ def step_remain_on_login_page(context):
 # PASSWORD VISIBILITY STEPS
 # ============================================================================
 
-@when('I enter a masked password')
+@when(r'^I enter a masked password$')
 def step_enter_masked_password(context):
     """Enter valid password from test data."""
     try:
-        valid_password = context.test_data['valid_credentials']['password']
-        context.login_page.enter_password(valid_password)
-        print("✓ Masked password entered")
+        valid_password = context.td.valid_credentials.password
+        context.pages.login_page.enter_password(valid_password)
+        logger.debug("✓ Masked password entered")
     except Exception as e:
-        context.login_page.take_screenshot("masked_password_entry_failed")
+        capture_failure_screenshot(context, e, "masked_password_entry_failed")
         raise Exception(f"Failed to enter masked password: {e}")
 
 
-@when('I click the show/hide password button')
+@when(r'^I click the show/hide password button$')
 def step_click_show_hide_password_button(context):
     """Click the show/hide password button to toggle the password visibility."""
     try:
-        context.login_page.click_show_hide_password()
-        print("✓ Show password button clicked successfully")
+        context.pages.login_page.click_show_hide_password()
+        logger.debug("✓ Show password button clicked successfully")
     except Exception as e:
-        context.login_page.take_screenshot("show_password_button_click_failed")
+        capture_failure_screenshot(context, e, "show_password_button_click_failed")
         raise Exception(f"Failed to click show password button: {e}")
 
 
-@then('the password should be visible as plain text')
+@then(r'^the password should be visible as plain text$')
 def step_password_visible_as_plain_text(context):
     """Verify that the password field shows plain text (not masked)."""
     try:
-        is_visible = context.login_page.is_password_visible()
+        is_visible = context.pages.login_page.is_password_visible()
         assert is_visible, "Password should be visible as plain text but it is still masked"
-        print("✓ Password is visible as plain text")
+        logger.debug("✓ Password is visible as plain text")
     except Exception as e:
-        context.login_page.take_screenshot("password_visibility_check_failed")
+        capture_failure_screenshot(context, e, "password_visibility_check_failed")
         raise AssertionError(f"Failed to verify password visibility: {e}")
 
 
-@when('I click the hide password button')
+@when(r'^I click the hide password button$')
 def step_click_hide_password_button(context):
     """Click the hide password button to mask the password."""
     try:
-        context.login_page.click_hide_password()
-        print("✓ Hide password button clicked")
+        context.pages.login_page.click_hide_password()
+        logger.debug("✓ Hide password button clicked")
     except Exception as e:
-        context.login_page.take_screenshot("hide_password_button_click_failed")
+        capture_failure_screenshot(context, e, "hide_password_button_click_failed")
         raise Exception(f"Failed to click hide password button: {e}")
 
 
-@then('the password should be masked again')
+@then(r'^the password should be masked again$')
 def step_password_masked_again(context):
     """Verify that the password field is masked again (not visible as plain text)."""
     try:
-        is_visible = context.login_page.is_password_visible()
+        is_visible = context.pages.login_page.is_password_visible()
         assert not is_visible, "Password should be masked but it is still visible as plain text"
-        print("✓ Password is masked again")
+        logger.debug("✓ Password is masked again")
     except Exception as e:
-        context.login_page.take_screenshot("password_masking_check_failed")
+        capture_failure_screenshot(context, e, "password_masking_check_failed")
         raise AssertionError(f"Failed to verify password masking: {e}")
 
 
@@ -301,61 +368,59 @@ def step_password_masked_again(context):
 # ERROR MESSAGE VERIFICATION STEPS
 # ============================================================================
 
-@then('I should see an email error message')
+@then(r'^I should see an email error message$')
 def step_see_email_error_message(context):
     """Verify that an email error message is displayed."""
     try:
-        actual_error_message = context.login_page.get_invalid_credentials_error()
-        expected_error_message = context.test_data['expected_error_messages']['invalid_email']
-        print(f"✓ Email error message displayed: {actual_error_message}")
-        print(f"Expected: {expected_error_message}")
-        assert actual_error_message == expected_error_message, "Expected email error message but none was found"
-        print(f"✓ Email error message displayed: {actual_error_message}")
+        actual_error_message = context.pages.login_page.get_invalid_credentials_error()
+        expected_error_message = context.expected.invalid_email
+        if actual_error_message != expected_error_message:
+            raise AssertionError(
+                f"Expected email error message '{expected_error_message}' but got '{actual_error_message}'")
+        logger.debug("✓ Email error message displayed: %s", actual_error_message)
     except Exception as e:
-        context.login_page.take_screenshot("email_error_message_check_failed")
+        capture_failure_screenshot(context, e, "email_error_message_check_failed")
         raise AssertionError(f"Failed to find email error message: {e}")
 
 
-@then('I should see a password error message')
+@then(r'^I should see a password error message$')
 def step_see_password_error_message(context):
     """Verify that a password error message is displayed."""
     try:
-        actual_error_message = context.login_page.get_password_error()
-        expected_error_message = context.test_data['expected_error_messages']['invalid_password']
-        print(f"Actual: {actual_error_message}")
-        print(f"Expected: {expected_error_message}")
-        
-        assert actual_error_message == expected_error_message, f"Expected password error message {expected_error_message} but none was found"
-        print(f"✓ Password error message displayed: {actual_error_message}")
+        actual_error_message = context.pages.login_page.get_password_error()
+        expected_error_message = context.expected.invalid_password
+        if actual_error_message != expected_error_message:
+            raise AssertionError(
+                f"Expected password error message '{expected_error_message}' but got '{actual_error_message}'")
+        logger.debug("✓ Password error message displayed: %s", actual_error_message)
     except Exception as e:
-        context.login_page.take_screenshot("password_error_message_check_failed")
+        capture_failure_screenshot(context, e, "password_error_message_check_failed")
         raise AssertionError(f"Failed to find password error message: {e}")
 
 
-@then('I should see an invalid email error message')
+@then(r'^I should see an invalid email error message$')
 def step_see_invalid_email_error_message(context):
     """Verify that an invalid email format error message is displayed."""
     try:
-        actual_error_message = context.login_page.get_email_error()
-        print(f"Actual error message: {actual_error_message}")
-        print(f"Expected error message: {context.test_data['expected_error_messages']['invalid_email_format']}")
-        expected_error_message = context.test_data['expected_error_messages']['invalid_email_format']
-        assert actual_error_message == expected_error_message, \
-            f"Expected invalid email error message '{expected_error_message}' but got '{actual_error_message}'"
+        actual_error_message = context.pages.login_page.get_email_error()
+        expected_error_message = context.expected.invalid_email_format
+        if actual_error_message != expected_error_message:
+            raise AssertionError(
+                f"Expected invalid email error message '{expected_error_message}' but got '{actual_error_message}'")
     except Exception as e:
-        context.login_page.take_screenshot("invalid_email_error_check_failed")
+        capture_failure_screenshot(context, e, "invalid_email_error_check_failed")
         raise AssertionError(f"Failed to find invalid email error message: {e}")
 
 
-@then('I should see a validation message for "{field}"')
+@then(r'^I should see a validation message for "(?P<field>[^"]+)"$')
 def step_see_validation_message_for_field(context, field):
     """Verify that a validation message is displayed for a specific field."""
     try:
-        validation_message = context.login_page.get_field_validation_message(field)
+        validation_message = context.pages.login_page.get_field_validation_message(field)
         assert validation_message, f"Expected validation message for {field} field but none was found"
-        print(f"✓ Validation message for {field} field: {validation_message}")
+        logger.debug("✓ Validation message for %s field: %s", field, validation_message)
     except Exception as e:
-        context.login_page.take_screenshot(f"{field}_validation_message_check_failed")
+        capture_failure_screenshot(context, e, f"{field}_validation_message_check_failed")
         raise AssertionError(f"Failed to find validation message for {field} field: {e}")
 
 
@@ -363,24 +428,24 @@ def step_see_validation_message_for_field(context, field):
 # SOCIAL LOGIN STEPS
 # ============================================================================
 
-@given('I click the "{provider}" login button')
+@given(r'^I click the "(?P<provider>[^"]+)" login button$')
 def step_click_social_login_button(context, provider):
     """Click a social login button (Google, Facebook, Apple)."""
     try:
-        context.login_page.click_provider_login_button(provider.lower())
-        print(f"✓ {provider} login button clicked")
+        context.pages.login_page.click_provider_login_button(provider.lower())
+        logger.debug("✓ %s login button clicked", provider)
     except Exception as e:
-        context.login_page.take_screenshot(f"{provider}_login_button_click_failed")
+        capture_failure_screenshot(context, e, f"{provider}_login_button_click_failed")
         raise Exception(f"Failed to click {provider} login button: {e}")
 
 
-@then('I should get redirected to the {provider_url}')
+@then(r'^I should get redirected to the (?P<provider_url>.+)$')
 def step_verify_social_provider_redirect(context, provider_url):
     """Verify redirection to social provider login page."""
     try:
-       context.login_page.verify_redirect_to_provider(provider_url)
+       context.pages.login_page.verify_redirect_to_provider(provider_url)
     except Exception as e:
-        context.login_page.take_screenshot("social_provider_redirect_failed")
+        capture_failure_screenshot(context, e, "social_provider_redirect_failed")
         raise AssertionError(f"Failed to verify social provider redirect: {e}")
 
 
@@ -388,46 +453,46 @@ def step_verify_social_provider_redirect(context, provider_url):
 # FORGOT PASSWORD STEPS
 # ============================================================================
 
-@when('I click the "Forgot password?" link')
+@when(r'^I click the "Forgot password\?" link$')
 def step_click_forgot_password_link(context):
     """Click the forgot password link."""
     try:
-        context.login_page.click_forgot_password()
-        print("✓ Forgot password link clicked")
+        context.pages.login_page.click_forgot_password()
+        logger.debug("✓ Forgot password link clicked")
     except Exception as e:
-        context.login_page.take_screenshot("forgot_password_link_click_failed")
+        capture_failure_screenshot(context, e, "forgot_password_link_click_failed")
         raise Exception(f"Failed to click forgot password link: {e}")
 
 
-@then('I should be redirected to the password reset page')
+@then(r'^I should be redirected to the password reset page$')
 def step_verify_password_reset_page_redirect(context):
     """Verify redirection to password reset page."""
     try:
         # Use the reset password page object to verify we're on the correct page
-        assert context.reset_password_page.is_on_password_reset_page(), \
+        assert context.pages.reset_password_page.is_on_password_reset_page(), \
             "Expected to be on password reset page"
-        print("✓ Successfully redirected to password reset page")
+        logger.debug("✓ Successfully redirected to password reset page")
     except Exception as e:
         # Enhanced error reporting with current URL and page details
-        context.reset_password_page.attach_detailed_error_info_to_allure(
+        context.pages.reset_password_page.attach_detailed_error_info_to_allure(
             error_msg=str(e),
             context="Verifying redirection to password reset page after clicking forgot password link"
         )
-        context.reset_password_page.take_screenshot("password_reset_redirect_failed")
+        capture_failure_screenshot(context, e, "password_reset_redirect_failed", context.pages.reset_password_page)
         raise AssertionError(f"Failed to verify password reset page redirect: {e}")
 
 
-@then('the page should have password reset functionality')
+@then(r'^the page should have password reset functionality$')
 def step_verify_password_reset_functionality(context):
     """Verify that the page has password reset functionality."""
     try:
         # Use the reset password page object to verify functionality
-        assert context.reset_password_page.has_password_reset_functionality(), \
+        assert context.pages.reset_password_page.has_password_reset_functionality(), \
             "Password reset functionality not found on the page"
         
         # Get additional details about what was found
-        email_field = context.reset_password_page.get_email_field()
-        submit_button = context.reset_password_page.get_submit_button()
+        email_field = context.pages.reset_password_page.get_email_field()
+        submit_button = context.pages.reset_password_page.get_submit_button()
         
         found_elements = []
         if email_field:
@@ -435,9 +500,9 @@ def step_verify_password_reset_functionality(context):
         if submit_button:
             found_elements.append("submit button")
             
-        print(f"✓ Password reset functionality verified: {', '.join(found_elements)}")
+        logger.debug("✓ Password reset functionality verified: %s", ', '.join(found_elements))
     except Exception as e:
-        context.reset_password_page.take_screenshot("password_reset_functionality_check_failed")
+        capture_failure_screenshot(context, e, "password_reset_functionality_check_failed", context.pages.reset_password_page)
         raise AssertionError(f"Failed to verify password reset functionality: {e}")
 
 
@@ -445,41 +510,41 @@ def step_verify_password_reset_functionality(context):
 # SIGN UP STEPS
 # ============================================================================
 
-@when('I click the "Sign up" link')
+@when(r'^I click the "Sign up" link$')
 def step_click_sign_up_link(context):
     """Click the sign up link."""
     try:
-        context.login_page.click_sign_up_link()
-        print("✓ Sign up link clicked")
+        context.pages.login_page.click_sign_up_link()
+        logger.debug("✓ Sign up link clicked")
     except Exception as e:
-        context.login_page.take_screenshot("sign_up_link_click_failed")
+        capture_failure_screenshot(context, e, "sign_up_link_click_failed")
         raise Exception(f"Failed to click sign up link: {e}")
 
 
-@then('I should be redirected to the registration page')
+@then(r'^I should be redirected to the registration page$')
 def step_verify_registration_page_redirect(context):
     """Verify redirection to registration page."""
     try:
-        context.login_page.verify_redirect_url("signup")
+        context.pages.login_page.verify_redirect_url("signup")
     except Exception as e:
-        context.login_page.take_screenshot("registration_redirect_failed")
+        capture_failure_screenshot(context, e, "registration_redirect_failed")
         raise AssertionError(f"Failed to verify registration page redirect: {e}")
 
 
-@then('the page should have account creation functionality')
+@then(r'^the page should have account creation functionality$')
 def step_verify_account_creation_functionality(context):
     """Verify that the page has account creation functionality."""
     try:
         # Use the new_account_page verification method for first name, last name, and email
-        if context.new_account_page.are_required_fields_present():
-            print("✓ Account creation functionality verified: Required fields (first name, last name, email) are present")
+        if context.pages.new_account_page.are_required_fields_present():
+            logger.debug("✓ Account creation functionality verified: Required fields (first name, last name, email) are present")
         else:
             # Get detailed field status for better error reporting
-            field_results = context.new_account_page.verify_required_fields_present()
+            field_results = context.pages.new_account_page.verify_required_fields_present()
             missing_fields = [field for field, present in field_results.items() if not present]
             raise AssertionError(f"Account creation functionality incomplete: Missing required fields: {', '.join(missing_fields)}")
     except Exception as e:
-        context.login_page.take_screenshot("account_creation_functionality_check_failed")
+        capture_failure_screenshot(context, e, "account_creation_functionality_check_failed")
         raise AssertionError(f"Failed to verify account creation functionality: {e}")
 
 
@@ -487,60 +552,68 @@ def step_verify_account_creation_functionality(context):
 # LOGOUT STEPS
 # ============================================================================
 
-@when('I click the logout button')
+@when(r'^I click the logout button$')
 def step_click_logout_button(context):
     """Click the logout button."""
     try:
-        context.dashboard_page.open_user_menu()
-        context.dashboard_page.click_logout()
+        context.pages.dashboard_page.open_user_menu()
+        context.pages.dashboard_page.click_logout()
+        # Logging out invalidates the server-side session behind any cached cookies
+        context.session_cache.pop('auth_state', None)
     except Exception as e:
-        context.login_page.take_screenshot("logout_button_click_failed")
+        capture_failure_screenshot(context, e, "logout_button_click_failed")
         raise Exception(f"Failed to click logout button: {e}")
 
 
-@then('I should be logged out successfully')
+@then(r'^I should be logged out successfully$')
 def step_verify_logged_out_successfully(context):
     """Verify that logout was successful."""
     try:
-        assert context.home_page.is_on_home_page(), "Expected to be on home page after logout"
-        print("✓ Successfully logged out")
+        assert context.pages.home_page.is_on_home_page(), "Expected to be on home page after logout"
+        logger.debug("✓ Successfully logged out")
     except Exception as e:
-        context.login_page.take_screenshot("logout_verification_failed")
+        capture_failure_screenshot(context, e, "logout_verification_failed")
         raise AssertionError(f"Failed to verify successful logout: {e}")
 
 
-@then('I should be redirected to the base website page')
+@then(r'^I should be redirected to the base website page$')
 def step_verify_base_website_redirect(context):
     """Verify redirection to base website page after logout."""
     try:
         # Check if we're redirected to the base/home page (usually just "/" or home)
-        current_url = context.login_page.get_current_url()
+        current_url = context.pages.login_page.get_current_url()
         base_url = context.config_manager.get_base_url()
         
-        # Check if current URL is the base URL or contains common home page indicators
-        if (current_url == base_url or 
-            current_url == f"{base_url}/" or 
-            current_url.rstrip('/') == base_url.rstrip('/')):
-            print(f"✓ Successfully redirected to base website page: {current_url}")
+        # Check if current URL is the base URL, ignoring trailing slash, query and fragment
+        if _normalize_url(current_url) == _normalize_url(base_url):
+            logger.debug("✓ Successfully redirected to base website page: %s", current_url)
         else:
             raise AssertionError(f"Expected to be redirected to base website ({base_url}), but current URL is: {current_url}")
     except Exception as e:
-        context.login_page.take_screenshot("base_website_redirect_failed")
+        capture_failure_screenshot(context, e, "base_website_redirect_failed")
         raise AssertionError(f"Failed to verify base website redirect: {e}")
 
 
-@then('my session should be cleared')
+@then(r'^my session should be cleared$')
 def step_verify_session_cleared(context):
     """Verify that the user session has been cleared."""
     try:
+        if hasattr(context.driver, 'execute_cdp_cmd') and context.config_manager:
+            # Only fetch cookies for the site under test instead of every domain
+            cookies = context.driver.execute_cdp_cmd(
+                "Network.getCookies", {"urls": [context.config_manager.get_base_url()]}
+            )["cookies"]
+        else:
+            cookies = context.driver.get_cookies()
+        
         auth_cookies = []
-        for cookie in context.driver.get_cookies():
-            cookie_name = cookie.get('name', '').lower()
-            if any(auth_term in cookie_name for auth_term in ['auth', 'session', 'token', 'user']):
+        for cookie in cookies:
+            cookie_name = cookie.get('name', '')
+            if _AUTH_COOKIE_RE.search(cookie_name):
                 auth_cookies.append(cookie_name)
         
-        print(f"ℹ Found {len(auth_cookies)} authentication-related cookies: {auth_cookies}")
-        print("✓ Session appears to be cleared (logout completed)")
+        logger.debug("ℹ Found %s authentication-related cookies: %s", len(auth_cookies), auth_cookies)
+        logger.debug("✓ Session appears to be cleared (logout completed)")
     except Exception as e:
-        context.login_page.take_screenshot("session_clear_verification_failed")
-        print(f"⚠ Could not fully verify session clearing: {e}")
+        capture_failure_screenshot(context, e, "session_clear_verification_failed")
+        logger.warning("⚠ Could not fully verify session clearing: %s", e)
@@ -1,15 +1,31 @@
 # Pages package for Page Object Model classes
+#
+# Page classes are imported on first access (PEP 562), so importing one page
+# doesn't load every other page module.
 
-from .base_page import BasePage
-from .login_page import LoginPage
-from .dashboard_page import DashboardPage
-from .home_page import HomePage
-from .new_account_page import NewAccountPage
-
-__all__ = [
-    'BasePage',
-    'LoginPage', 
-    'DashboardPage',
-    'HomePage',
-    'NewAccountPage'
-]
+import importlib
+
+_PAGE_MODULES = {
+    'BasePage': 'base_page',
+    'LoginPage': 'login_page',
+    'DashboardPage': 'dashboard_page',
+    'HomePage': 'home_page',
+    'NewAccountPage': 'new_account_page',
+    'ResetPasswordPage': 'reset_password_page'
+}
+
+__all__ = list(_PAGE_MODULES)
+
+
+def __getattr__(name):
+    """Import the module that defines the requested page class."""
+    module_name = _PAGE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    page_class = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = page_class
+    return page_class
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
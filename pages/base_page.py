@@ -3,8 +3,17 @@ Base page class for Page Object Model implementation.
 Contains common functionality shared across all page objects.
 """
 
+import logging
+import math
+import os
+import sys
 import time
-from typing import List, Optional, Tuple, Any, Dict
+import base64
+import io
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from functools import cached_property
+from typing import List, Optional, Tuple, Any, Dict, Callable, Iterator
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
@@ -16,12 +25,250 @@ from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
     StaleElementReferenceException,
-    ElementNotInteractableException
+    ElementNotInteractableException,
+    WebDriverException
 )
 
+# Import allure for enhanced reporting (optional - will work without it)
+try:
+    import allure
+    PNG_ATTACHMENT = allure.attachment_type.PNG
+    HTML_ATTACHMENT = allure.attachment_type.HTML
+    TEXT_ATTACHMENT = allure.attachment_type.TEXT
+except ImportError:
+    allure = None
+    PNG_ATTACHMENT = HTML_ATTACHMENT = TEXT_ATTACHMENT = None
+
+logger = logging.getLogger(__name__)
+
+# Locator tuple with named fields; compares and unpacks exactly like a (By, value) tuple
+Locator = namedtuple('Locator', ['by', 'value'])
+
+_LOCATOR_STRATEGIES = frozenset({
+    By.ID, By.NAME, By.XPATH, By.CSS_SELECTOR, By.CLASS_NAME,
+    By.TAG_NAME, By.LINK_TEXT, By.PARTIAL_LINK_TEXT
+})
+
+
+def css_union(*locators: Tuple[str, str]) -> Locator:
+    """
+    Combine CSS-expressible locators into one selector list the browser resolves in a single lookup.
+    
+    The browser returns the first match in document order, not in argument order.
+    
+    Args:
+        locators: ID, NAME, CLASS_NAME, TAG_NAME or CSS_SELECTOR locator tuples
+        
+    Returns:
+        CSS selector locator
+        
+    Raises:
+        ValueError: If a locator has no CSS equivalent
+    """
+    selectors = []
+    for locator in locators:
+        spec = BasePage._to_js_locator(locator)
+        if spec is None or spec[0] != 'css':
+            raise ValueError(f"Locator has no CSS equivalent: {locator}")
+        selectors.append(spec[1])
+    return Locator(By.CSS_SELECTOR, ", ".join(selectors))
+
 
 class BasePage:
-    """Base page class implementing common page functionality."""
+    """
+    Base page class implementing common page functionality.
+    
+    All lookups use explicit waits. DriverManager sets the driver's implicit wait from
+    timeouts.implicit_wait (0 by default) so it can't multiply the explicit timeouts.
+    """
+    
+    # Poll interval for explicit waits (WebDriverWait defaults to 0.5s)
+    POLL_FREQUENCY = 0.05
+    
+    # Number of (timeout, poll_frequency) waits kept per page object, least recently used evicted
+    MAX_CACHED_WAITS = 8
+    
+    # Transient errors that explicit waits retry instead of failing on
+    IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+    
+    # Resolves true once the URL contains arguments[0] without a page load (history API or hash
+    # change); a real navigation unloads the document and interrupts the script instead.
+    # pushState/replaceState fire no event, so the URL is also polled every arguments[2] ms.
+    NAVIGATION_SCRIPT = """
+        const fragment = arguments[0];
+        const timeoutMs = arguments[1];
+        const pollMs = arguments[2];
+        const done = arguments[arguments.length - 1];
+        if (window.location.href.includes(fragment)) { done(true); return; }
+        let finished = false;
+        const finish = (matched) => {
+            if (finished) return;
+            finished = true;
+            clearTimeout(timer);
+            clearInterval(poller);
+            window.removeEventListener('popstate', check);
+            window.removeEventListener('hashchange', check);
+            done(matched);
+        };
+        const check = () => {
+            if (window.location.href.includes(fragment)) finish(true);
+        };
+        const timer = setTimeout(() => finish(false), timeoutMs);
+        const poller = setInterval(check, pollMs);
+        window.addEventListener('popstate', check);
+        window.addEventListener('hashchange', check);
+    """
+    
+    # Network quiet period callers can ask wait_for_page_load for (e.g. after the login submit)
+    NETWORK_QUIET_MS = 500
+    
+    # Longest the quiet phase may add after the load event; pages that beacon or poll more
+    # often than the quiet period never go quiet, and count as ready once this passes
+    NETWORK_QUIET_LIMIT_MS = 1500
+    
+    # Resolves once the window 'load' event has fired and, if quietMs > 0, no resource request
+    # has completed for quietMs (a debounced PerformanceObserver) or quietLimitMs has passed
+    # since the load. Returns false if the load event doesn't happen within timeoutMs.
+    PAGE_LOAD_SCRIPT = """
+        const timeoutMs = arguments[0];
+        const quietMs = arguments[1];
+        const quietLimitMs = arguments[2];
+        const done = arguments[arguments.length - 1];
+        let finished = false;
+        let quietTimer = null;
+        let limitTimer = null;
+        let observer = null;
+        const finish = (loaded) => {
+            if (finished) return;
+            finished = true;
+            clearTimeout(deadline);
+            clearTimeout(quietTimer);
+            clearTimeout(limitTimer);
+            if (observer) observer.disconnect();
+            done(loaded);
+        };
+        const deadline = setTimeout(() => finish(false), timeoutMs);
+        const waitForQuiet = () => {
+            if (quietMs <= 0) { finish(true); return; }
+            const restart = () => {
+                clearTimeout(quietTimer);
+                quietTimer = setTimeout(() => finish(true), quietMs);
+            };
+            limitTimer = setTimeout(() => finish(true), quietLimitMs);
+            if (window.PerformanceObserver) {
+                observer = new PerformanceObserver(restart);
+                observer.observe({ type: 'resource' });
+            }
+            restart();
+        };
+        if (document.readyState === 'complete') {
+            waitForQuiet();
+        } else {
+            window.addEventListener('load', waitForQuiet, { once: true });
+        }
+    """
+    
+    # Evaluates an ordered list of [kind, query] locators in one round trip and
+    # returns the first element that matches (and is rendered/enabled, if requested).
+    FIND_FIRST_SCRIPT = """
+        const specs = arguments[0];
+        const requireVisible = arguments[1];
+        const requireEnabled = arguments[2];
+        for (const [kind, query] of specs) {
+            let el = null;
+            try {
+                el = kind === 'xpath'
+                    ? document.evaluate(query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+                    : document.querySelector(query);
+            } catch (e) {
+                continue;
+            }
+            if (!el || (requireEnabled && el.disabled)) continue;
+            if (!requireVisible) return el;
+            const style = window.getComputedStyle(el);
+            if (el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none') return el;
+        }
+        return null;
+    """
+    
+    # Checks a {key: [spec, ...]} map in one round trip and returns {key: bool}, true when any of
+    # the key's specs matches (and is rendered, if arguments[1] is true). A spec is
+    # ['css', selector], ['xpath', expression] or ['text', selector, pattern] (an element
+    # matching selector whose text matches pattern).
+    BATCH_PRESENCE_SCRIPT = """
+        const specs = arguments[0];
+        const requireVisible = !!arguments[1];
+        const accept = (el) => !!el && (!requireVisible ||
+            (el.getClientRects().length > 0 && window.getComputedStyle(el).visibility !== 'hidden'));
+        const matches = ([kind, query, pattern]) => {
+            try {
+                if (kind === 'xpath') {
+                    return accept(document.evaluate(query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue);
+                }
+                if (kind === 'text') {
+                    const re = new RegExp(pattern, 'i');
+                    return Array.from(document.querySelectorAll(query)).some(e => re.test(e.textContent) && accept(e));
+                }
+                if (!requireVisible) {
+                    return document.querySelector(query) !== null;
+                }
+                return Array.from(document.querySelectorAll(query)).some(accept);
+            } catch (e) {
+                return false;
+            }
+        };
+        const result = {};
+        for (const [key, alternatives] of Object.entries(specs)) {
+            result[key] = alternatives.some(matches);
+        }
+        return result;
+    """
+    
+    # Resolves true as soon as any of the [kind, query] specs in arguments[0] matches a rendered
+    # element, re-checking on DOM mutations instead of polling; false after arguments[1] ms.
+    VISIBLE_OBSERVER_SCRIPT = """
+        const specs = arguments[0];
+        const timeoutMs = arguments[1];
+        const done = arguments[arguments.length - 1];
+        const find = ([kind, query]) => {
+            try {
+                return kind === 'xpath'
+                    ? document.evaluate(query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+                    : document.querySelector(query);
+            } catch (e) {
+                return null;
+            }
+        };
+        const shown = (el) => !!el && el.getClientRects().length > 0 && window.getComputedStyle(el).visibility !== 'hidden';
+        const check = () => specs.some(spec => shown(find(spec)));
+        if (check()) { done(true); return; }
+        let timer = null;
+        const observer = new MutationObserver(() => { if (check()) finish(true); });
+        const finish = (found) => {
+            observer.disconnect();
+            clearTimeout(timer);
+            done(found);
+        };
+        timer = setTimeout(() => finish(false), timeoutMs);
+        observer.observe(document.documentElement, { childList: true, subtree: true, attributes: true });
+    """
+    
+    # Returns the first element matching the CSS selector in arguments[0] whose text matches
+    # the case-insensitive pattern in arguments[1]
+    FIND_BY_TEXT_SCRIPT = """
+        const re = new RegExp(arguments[1], 'i');
+        return Array.from(document.querySelectorAll(arguments[0])).find(e => re.test(e.textContent)) || null;
+    """
+    
+    # Page details attached to Allure error reports (browser details are cached separately)
+    ERROR_INFO_SCRIPT = "return {url: window.location.href, title: document.title};"
+    
+    VIEWPORT_SCRIPT = """
+        return {
+            window: {width: window.outerWidth, height: window.outerHeight},
+            viewport: {width: window.innerWidth, height: window.innerHeight}
+        };
+    """
     
     def __init__(self, driver, config=None):
         """
@@ -33,12 +280,46 @@ class BasePage:
         """
         self.driver = driver
         self.config = config
-        self.wait = WebDriverWait(
-            driver, 
-            config.get_explicit_wait() if config else 20
-        )
-        self.short_wait = WebDriverWait(driver, 5)
+        self.explicit_wait = config.get_explicit_wait() if config else 20
+        self._waits: "OrderedDict[Tuple[float, float], WebDriverWait]" = OrderedDict()
+        self.wait = self._get_wait(self.explicit_wait)
+        self.short_wait = self._get_wait(5)
         self.action_chains = ActionChains(driver)
+        self.element_cache_enabled = bool(config and config.is_element_cache_enabled())
+        self._element_cache: Dict[Tuple[str, str], WebElement] = {}
+        # Fallback locator group -> index of the locator that last matched
+        self._winning_locator: Dict[Tuple[Tuple[str, str], ...], int] = {}
+        self._screenshot_png: Optional[bytes] = None
+        self._window_metrics: Optional[Dict[str, Dict[str, int]]] = None
+        self._page_state: Optional[Dict[str, Any]] = None
+        # Extra diagnostics that cost WebDriver round trips (HUDL_VERBOSE=1 to enable)
+        self._verbose = os.getenv('HUDL_VERBOSE') == '1'
+    
+    def _get_wait(self, timeout: float = None, poll_frequency: float = None) -> WebDriverWait:
+        """
+        Return a shared WebDriverWait for the given timeout and poll interval (LRU of MAX_CACHED_WAITS).
+        
+        Waits ignore IGNORED_EXCEPTIONS, so a stale reference mid-poll is retried.
+        
+        Args:
+            timeout: Timeout in seconds; defaults to the configured explicit wait
+            poll_frequency: Poll interval in seconds; defaults to POLL_FREQUENCY
+            
+        Returns:
+            WebDriverWait instance
+        """
+        # A timeout of 0 means a single check, not the default wait
+        key = (timeout if timeout is not None else self.explicit_wait, poll_frequency or self.POLL_FREQUENCY)
+        wait = self._waits.get(key)
+        if wait is None:
+            if len(self._waits) >= self.MAX_CACHED_WAITS:
+                self._waits.popitem(last=False)
+            wait = self._waits[key] = WebDriverWait(
+                self.driver, key[0], poll_frequency=key[1], ignored_exceptions=self.IGNORED_EXCEPTIONS
+            )
+        else:
+            self._waits.move_to_end(key)
+        return wait
     
     # Element finding methods
     def find_element(self, locator: Tuple[str, str], timeout: int = None) -> WebElement:
@@ -55,7 +336,10 @@ class BasePage:
         Raises:
             TimeoutException: If element not found within timeout
         """
-        wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
+        element = self._find_now(locator)
+        if element is not None:
+            return element
+        wait = self._get_wait(timeout)
         return wait.until(EC.presence_of_element_located(locator))
     
     def find_elements(self, locator: Tuple[str, str], timeout: int = None) -> List[WebElement]:
@@ -69,7 +353,10 @@ class BasePage:
         Returns:
             List of WebElement instances
         """
-        wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
+        elements = self.driver.find_elements(*locator)
+        if elements:
+            return elements
+        wait = self._get_wait(timeout)
         wait.until(EC.presence_of_element_located(locator))
         return self.driver.find_elements(*locator)
     
@@ -87,7 +374,10 @@ class BasePage:
         Raises:
             TimeoutException: If element not clickable within timeout
         """
-        wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
+        element = self._find_now(locator, visible=True, enabled=True)
+        if element is not None:
+            return element
+        wait = self._get_wait(timeout)
         return wait.until(EC.element_to_be_clickable(locator))
     
     def find_visible_element(self, locator: Tuple[str, str], timeout: int = None) -> WebElement:
@@ -104,9 +394,34 @@ class BasePage:
         Raises:
             TimeoutException: If element not visible within timeout
         """
-        wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
+        element = self._find_now(locator, visible=True)
+        if element is not None:
+            return element
+        wait = self._get_wait(timeout)
         return wait.until(EC.visibility_of_element_located(locator))
     
+    def _find_now(self, locator: Tuple[str, str], visible: bool = False, enabled: bool = False) -> Optional[WebElement]:
+        """
+        Look an element up once without starting a wait.
+        
+        Args:
+            locator: Tuple of (By strategy, locator value)
+            visible: Require the element to be displayed
+            enabled: Require the element to be enabled
+            
+        Returns:
+            WebElement if it is already there (and in the required state), None otherwise
+        """
+        try:
+            element = self.driver.find_element(*locator)
+            if visible and not element.is_displayed():
+                return None
+            if enabled and not element.is_enabled():
+                return None
+            return element
+        except (NoSuchElementException, StaleElementReferenceException):
+            return None
+    
     # Element interaction methods
     def click_element(self, locator: Tuple[str, str], timeout: int = None) -> None:
         """
@@ -116,25 +431,30 @@ class BasePage:
             locator: Tuple of (By strategy, locator value)
             timeout: Custom timeout in seconds
         """
-        element = self.find_clickable_element(locator, timeout)
-        self._click_with_retry(element)
+        self._click_with_retry(locator, timeout)
     
-    def _click_with_retry(self, element: WebElement, max_attempts: int = 3) -> None:
+    def _click_with_retry(self, locator: Tuple[str, str], timeout: int = None) -> None:
         """
-        Click element with retry logic for stale element exceptions.
+        Click element, re-locating it straight away whenever the reference goes stale.
         
         Args:
-            element: WebElement to click
-            max_attempts: Maximum number of retry attempts
+            locator: Tuple of (By strategy, locator value)
+            timeout: Total time budget in seconds for locating and clicking
         """
-        for attempt in range(max_attempts):
+        deadline = time.monotonic() + (timeout or self.explicit_wait)
+        while True:
+            # Whole seconds keep the number of distinct cached waits small
+            remaining = max(math.ceil(deadline - time.monotonic()), 1)
+            element = self._get_cached_element(
+                locator, lambda: self.find_clickable_element(locator, remaining)
+            )
             try:
                 element.click()
                 return
             except StaleElementReferenceException:
-                if attempt == max_attempts - 1:
+                self.invalidate_element_cache(locator)
+                if time.monotonic() >= deadline:
                     raise
-                time.sleep(0.5)
             except ElementNotInteractableException:
                 # Try JavaScript click as fallback
                 self.driver.execute_script("arguments[0].click();", element)
@@ -149,10 +469,12 @@ class BasePage:
             text: Text to send
             clear_first: Whether to clear field before typing
         """
-        element = self.find_visible_element(locator)
-        if clear_first:
-            element.clear()
-        element.send_keys(text)
+        def type_text(element: WebElement) -> None:
+            if clear_first:
+                element.clear()
+            element.send_keys(text)
+        
+        self._run_on_element(locator, lambda: self.find_visible_element(locator), type_text)
     
     def get_element_text(self, locator: Tuple[str, str], timeout: int = None) -> str:
         """
@@ -165,8 +487,11 @@ class BasePage:
         Returns:
             Element text content
         """
-        element = self.find_visible_element(locator, timeout)
-        return element.text.strip()
+        return self._run_on_element(
+            locator,
+            lambda: self.find_visible_element(locator, timeout),
+            lambda element: element.text.strip()
+        )
     
     def get_element_attribute(self, locator: Tuple[str, str], attribute: str, timeout: int = None) -> str:
         """
@@ -180,8 +505,11 @@ class BasePage:
         Returns:
             Attribute value
         """
-        element = self.find_element(locator, timeout)
-        return element.get_attribute(attribute) or ""
+        return self._run_on_element(
+            locator,
+            lambda: self.find_element(locator, timeout),
+            lambda element: element.get_attribute(attribute) or ""
+        )
     
     def is_element_present(self, locator: Tuple[str, str], timeout: int = 5) -> bool:
         """
@@ -194,13 +522,7 @@ class BasePage:
         Returns:
             True if element is present, False otherwise
         """
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
-            return True
-        except TimeoutException:
-            return False
+        return self._probe_element(locator, timeout)
     
     def is_element_visible(self, locator: Tuple[str, str], timeout: int = 5) -> bool:
         """
@@ -213,13 +535,7 @@ class BasePage:
         Returns:
             True if element is visible, False otherwise
         """
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
-            return True
-        except TimeoutException:
-            return False
+        return self._probe_element(locator, timeout, visible=True)
     
     def is_element_clickable(self, locator: Tuple[str, str], timeout: int = 5) -> bool:
         """
@@ -232,11 +548,138 @@ class BasePage:
         Returns:
             True if element is clickable, False otherwise
         """
+        return self._probe_element(locator, timeout, visible=True, enabled=True)
+    
+    def is_element_present_nowait(self, locator: Tuple[str, str], visible: bool = False) -> bool:
+        """
+        Check for an element with a single lookup and no wait of any kind.
+        
+        Args:
+            locator: Tuple of (By strategy, locator value)
+            visible: Require the element to be displayed
+            
+        Returns:
+            True if the element is there right now, False otherwise
+        """
+        # The implicit wait is kept at 0, so an empty find_elements returns immediately
+        elements = self.driver.find_elements(*locator)
+        if not visible:
+            return bool(elements)
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
-            )
-            return True
+            return any(element.is_displayed() for element in elements)
+        except StaleElementReferenceException:
+            return False
+    
+    # Element cache methods
+    def _run_on_element(self, locator: Tuple[str, str], finder: Callable[[], WebElement],
+                        action: Callable[[WebElement], Any]) -> Any:
+        """
+        Run an action against a (possibly cached) element, re-locating it once if it went stale.
+        
+        Args:
+            locator: Tuple of (By strategy, locator value) used as the cache key
+            finder: Callable that locates the element when it isn't cached
+            action: Callable that receives the element
+            
+        Returns:
+            Whatever the action returns
+        """
+        if not self.element_cache_enabled:
+            return action(finder())
+        
+        try:
+            return action(self._get_cached_element(locator, finder))
+        except StaleElementReferenceException:
+            self.invalidate_element_cache(locator)
+            return action(self._get_cached_element(locator, finder))
+    
+    def _get_cached_element(self, locator: Tuple[str, str], finder: Callable[[], WebElement]) -> WebElement:
+        """
+        Return the cached element for a locator, locating and caching it on a miss.
+        
+        Args:
+            locator: Tuple of (By strategy, locator value) used as the cache key
+            finder: Callable that locates the element when it isn't cached
+            
+        Returns:
+            WebElement instance
+        """
+        if not self.element_cache_enabled:
+            return finder()
+        
+        element = self._element_cache.get(locator)
+        if element is None:
+            element = self._element_cache[locator] = finder()
+        return element
+    
+    def _clear_page_snapshot(self) -> None:
+        """Forget URL/title cached by an active page_snapshot() block."""
+        if self._page_state is not None:
+            self._page_state.clear()
+    
+    def invalidate_element_cache(self, locator: Tuple[str, str] = None) -> None:
+        """
+        Drop cached elements.
+        
+        Args:
+            locator: Only drop this locator's entry; drops everything when omitted
+        """
+        if locator is None:
+            self._element_cache.clear()
+            self._winning_locator.clear()
+        else:
+            self._element_cache.pop(locator, None)
+    
+    def _probe_element(self, locator: Tuple[str, str], timeout: float = 0,
+                       visible: bool = False, enabled: bool = False) -> bool:
+        """
+        Check for an element with a DOM query instead of a WebDriver element lookup.
+        
+        Timeouts of 0.1s or less answer with a single script call; longer timeouts
+        repeat the query until it matches or the timeout runs out.
+        
+        Args:
+            locator: Tuple of (By strategy, locator value)
+            timeout: Timeout in seconds
+            visible: Require the element to be rendered
+            enabled: Require the element not to be disabled
+            
+        Returns:
+            True if a matching element was found, False otherwise
+        """
+        spec = self._to_js_locator(locator)
+        if spec is None:
+            # No DOM-query equivalent (e.g. link text): use the WebDriver conditions
+            if timeout <= 0:
+                if not enabled:
+                    return self.is_element_present_nowait(locator, visible=visible)
+                try:
+                    return any(element.is_displayed() and element.is_enabled()
+                               for element in self.driver.find_elements(*locator))
+                except StaleElementReferenceException:
+                    return False
+            if enabled:
+                condition = EC.element_to_be_clickable(locator)
+            elif visible:
+                condition = EC.visibility_of_element_located(locator)
+            else:
+                condition = EC.presence_of_element_located(locator)
+            try:
+                self._get_wait(timeout).until(condition)
+                return True
+            except TimeoutException:
+                return False
+        
+        def probe(driver) -> bool:
+            try:
+                return driver.execute_script(self.FIND_FIRST_SCRIPT, [spec], visible, enabled) is not None
+            except WebDriverException:
+                return False
+        
+        if timeout <= 0.1:
+            return probe(self.driver)
+        try:
+            return self._get_wait(timeout).until(probe)
         except TimeoutException:
             return False
     
@@ -265,7 +708,7 @@ class BasePage:
         Returns:
             True if element becomes invisible, False otherwise
         """
-        wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
+        wait = self._get_wait(timeout)
         try:
             return wait.until(EC.invisibility_of_element_located(locator))
         except TimeoutException:
@@ -283,7 +726,7 @@ class BasePage:
         Returns:
             True if text appears, False otherwise
         """
-        wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
+        wait = self._get_wait(timeout)
         try:
             return wait.until(EC.text_to_be_present_in_element(locator, text))
         except TimeoutException:
@@ -300,23 +743,91 @@ class BasePage:
         Returns:
             True if URL contains fragment, False otherwise
         """
-        wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
+        wait = self._get_wait(timeout)
         try:
             return wait.until(EC.url_contains(url_fragment))
         except TimeoutException:
             return False
     
-    def wait_for_page_load(self, timeout: int = None) -> bool:
+    def wait_for_navigation(self, url_fragment: str, timeout: int = None) -> bool:
         """
-        Wait for page to fully load.
+        Wait for a navigation that ends on a URL containing a fragment.
+        
+        Instead of polling the URL from the start, an async script stays pending in
+        the current document until it unloads (or the URL changes in place), so the
+        navigation is noticed as soon as the browser starts it.
         
         Args:
+            url_fragment: URL fragment to wait for
             timeout: Custom timeout in seconds
             
+        Returns:
+            True if URL contains fragment, False otherwise
+        """
+        wait_seconds = timeout or self.explicit_wait
+        deadline = time.monotonic() + wait_seconds
+        try:
+            if self.driver.execute_async_script(
+                self.NAVIGATION_SCRIPT, url_fragment, int(wait_seconds * 1000), int(self.POLL_FREQUENCY * 1000)
+            ):
+                return True
+        except WebDriverException:
+            # The document unloaded while the script was pending: a navigation happened
+            pass
+        
+        # Redirect chains may pass through other URLs before reaching the target
+        remaining = max(math.ceil(deadline - time.monotonic()), 1)
+        return self.wait_for_url_contains(url_fragment, timeout=remaining)
+    
+    def wait_for_any_visible(self, locators: List[Tuple[str, str]], timeout: float = None) -> bool:
+        """
+        Wait until any of several elements is visible, watching DOM mutations in the page.
+        
+        The whole wait is one async script call, so an element that appears is noticed
+        straight away rather than at the next poll.
+        
+        Args:
+            locators: Locator tuples to watch
+            timeout: Custom timeout in seconds
+            
+        Returns:
+            True if one of the elements became visible, False otherwise
+        """
+        wait_seconds = timeout or self.explicit_wait
+        specs = [self._to_js_locator(locator) for locator in locators]
+        if None not in specs:
+            try:
+                return bool(self.driver.execute_async_script(
+                    self.VISIBLE_OBSERVER_SCRIPT, specs, int(wait_seconds * 1000)
+                ))
+            except WebDriverException:
+                # Navigation during the script or a script timeout: fall back to polling
+                pass
+        return self.is_element_visible_with_fallback(locators, timeout=wait_seconds)
+    
+    def wait_for_page_load(self, timeout: int = None, quiet_ms: int = 0) -> bool:
+        """
+        Wait for page to fully load and, optionally, for its network activity to settle.
+        
+        Args:
+            timeout: Custom timeout in seconds
+            quiet_ms: Network quiet period in milliseconds to wait for after the load event
+                (0 for none; the quiet phase never adds more than NETWORK_QUIET_LIMIT_MS)
+            
         Returns:
             True if page loaded, False otherwise
         """
-        wait = WebDriverWait(self.driver, timeout) if timeout else self.wait
+        wait_seconds = timeout or self.explicit_wait
+        try:
+            # A single async script returns once the load event and any quiet period have passed
+            return bool(self.driver.execute_async_script(
+                self.PAGE_LOAD_SCRIPT, int(wait_seconds * 1000), quiet_ms, self.NETWORK_QUIET_LIMIT_MS
+            ))
+        except WebDriverException:
+            # Navigation during the script or a script timeout: fall back to polling
+            pass
+        
+        wait = self._get_wait(wait_seconds)
         try:
             return wait.until(
                 lambda driver: driver.execute_script("return document.readyState") == "complete"
@@ -332,33 +843,98 @@ class BasePage:
         Args:
             url: URL to navigate to
         """
-        print(f"Navigating to URL: {url}")
+        logger.info("Navigating to URL: %s", url)
+        self.invalidate_element_cache()
+        self._clear_page_snapshot()
         self.driver.get(url)
         self.wait_for_page_load()
     
     def refresh_page(self) -> None:
         """Refresh the current page."""
+        self.invalidate_element_cache()
+        self._clear_page_snapshot()
         self.driver.refresh()
         self.wait_for_page_load()
     
     def go_back(self) -> None:
         """Navigate back in browser history."""
+        self.invalidate_element_cache()
+        self._clear_page_snapshot()
         self.driver.back()
         self.wait_for_page_load()
     
     def go_forward(self) -> None:
         """Navigate forward in browser history."""
+        self.invalidate_element_cache()
+        self._clear_page_snapshot()
         self.driver.forward()
         self.wait_for_page_load()
     
     # Utility methods
+    @cached_property
+    def user_agent(self) -> str:
+        """Browser user agent, fetched once per page object."""
+        return self.driver.execute_script("return navigator.userAgent;")
+    
+    @property
+    def window_metrics(self) -> Dict[str, Dict[str, int]]:
+        """Outer window and inner viewport sizes, cached until set_window_size() is called."""
+        if self._window_metrics is None:
+            self._window_metrics = self.driver.execute_script(self.VIEWPORT_SCRIPT)
+        return self._window_metrics
+    
+    def set_window_size(self, width: int, height: int) -> None:
+        """
+        Resize the browser window.
+        
+        Args:
+            width: Window width in pixels
+            height: Window height in pixels
+        """
+        self.driver.set_window_size(width, height)
+        self._window_metrics = None
+    
     def get_current_url(self) -> str:
-        """Get current page URL."""
-        return self.driver.current_url
+        """Get current page URL (read once per page_snapshot() block)."""
+        return self._snapshot_value('url', lambda: self.driver.current_url)
     
     def get_page_title(self) -> str:
-        """Get current page title."""
-        return self.driver.title
+        """Get current page title (read once per page_snapshot() block)."""
+        return self._snapshot_value('title', lambda: self.driver.title)
+    
+    @contextmanager
+    def page_snapshot(self) -> Iterator[None]:
+        """
+        Treat URL and title as fixed for the duration of a compound check.
+        
+        Nested blocks share the outermost snapshot; navigation through this page
+        object clears it.
+        """
+        if self._page_state is not None:
+            yield
+            return
+        self._page_state = {}
+        try:
+            yield
+        finally:
+            self._page_state = None
+    
+    def _snapshot_value(self, key: str, read: Callable[[], Any]) -> Any:
+        """
+        Return a value cached in the active page snapshot, reading it on a miss.
+        
+        Args:
+            key: Snapshot key
+            read: Callable that fetches the value from the driver
+            
+        Returns:
+            The cached or freshly read value
+        """
+        if self._page_state is None:
+            return read()
+        if key not in self._page_state:
+            self._page_state[key] = read()
+        return self._page_state[key]
     
     def get_page_source(self) -> str:
         """Get current page source."""
@@ -375,11 +951,72 @@ class BasePage:
             True if successful, False otherwise
         """
         try:
-            return self.driver.save_screenshot(filename)
+            png = self.capture_screenshot_bytes()
+            with open(filename, 'wb') as f:
+                f.write(png)
+            return True
         except Exception as e:
-            print(f"Error taking screenshot: {e}")
+            logger.warning("Error taking screenshot: %s", e)
             return False
 
+    def capture_screenshot_bytes(self) -> bytes:
+        """
+        Capture a PNG screenshot in memory, reusing one already taken during the current step.
+        
+        Returns:
+            PNG bytes
+        """
+        if self._screenshot_png is None:
+            self._screenshot_png = self.driver.get_screenshot_as_png()
+        return self._screenshot_png
+
+    def clear_screenshot_cache(self) -> None:
+        """Forget the screenshot captured during the previous step."""
+        self._screenshot_png = None
+
+    def capture_failure_bundle(self) -> Dict[str, bytes]:
+        """
+        Capture a screenshot and the page DOM for failure diagnostics.
+        
+        On Chromium both come straight from DevTools: a PNG screenshot and an MHTML
+        snapshot holding the DOM and its resources in one file. Other browsers, and any
+        DevTools command that fails (captureSnapshot is experimental and can fail on
+        crashed tabs or some frames), fall back to a WebDriver screenshot and the raw
+        page source. Each artifact is captured on its own, so one failure never costs the other.
+        
+        Returns:
+            Dictionary mapping file extension to file content (artifacts that could not be
+            captured at all are left out)
+        """
+        bundle: Dict[str, bytes] = {}
+        has_cdp = hasattr(self.driver, 'execute_cdp_cmd')
+        
+        try:
+            if has_cdp:
+                try:
+                    screenshot = self.driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "png"})
+                    bundle['.png'] = base64.b64decode(screenshot['data'])
+                except Exception as e:
+                    logger.warning("DevTools screenshot failed, using WebDriver screenshot: %s", e)
+            if '.png' not in bundle:
+                bundle['.png'] = self.driver.get_screenshot_as_png()
+        except Exception as e:
+            logger.error("Failed to capture failure screenshot: %s", e)
+        
+        try:
+            if has_cdp:
+                try:
+                    snapshot = self.driver.execute_cdp_cmd("Page.captureSnapshot", {"format": "mhtml"})
+                    bundle['.mhtml'] = snapshot['data'].encode('utf-8')
+                except Exception as e:
+                    logger.warning("DevTools DOM snapshot failed, using page source: %s", e)
+            if '.mhtml' not in bundle:
+                bundle['.html'] = self.driver.page_source.encode('utf-8')
+        except Exception as e:
+            logger.error("Failed to capture failure page source: %s", e)
+        
+        return bundle
+
     def attach_screenshot_to_allure(self, name: str = "Screenshot") -> None:
         """
         Take screenshot and attach to Allure report.
@@ -387,15 +1024,14 @@ class BasePage:
         Args:
             name: Name for the attachment in Allure
         """
-        try:
-            import allure
-            screenshot = self.driver.get_screenshot_as_png()
-            allure.attach(screenshot, name=name, attachment_type=allure.attachment_type.PNG)
-        except ImportError:
-            print("Allure not available, taking regular screenshot")
+        if allure is None:
+            logger.info("Allure not available, taking regular screenshot")
             self.take_screenshot(f"reports/{name.lower().replace(' ', '_')}.png")
+            return
+        try:
+            allure.attach(self.capture_screenshot_bytes(), name=name, attachment_type=PNG_ATTACHMENT)
         except Exception as e:
-            print(f"Error attaching screenshot to Allure: {e}")
+            logger.warning("Error attaching screenshot to Allure: %s", e)
 
     def attach_page_source_to_allure(self, name: str = "Page Source") -> None:
         """
@@ -405,16 +1041,24 @@ class BasePage:
             name: Name for the attachment in Allure
         """
         try:
-            import allure
+            if allure is None:
+                logger.info("Allure not available, saving page source to file")
+                timestamp = int(time.time())
+                with open(f"reports/page_source_{timestamp}.html", "w", encoding="utf-8") as f:
+                    f.write(self.driver.page_source)
+                return
+            if hasattr(self.driver, 'execute_cdp_cmd'):
+                try:
+                    # MHTML keeps styles and images, and is usually smaller than the serialized DOM
+                    snapshot = self.driver.execute_cdp_cmd("Page.captureSnapshot", {"format": "mhtml"})
+                    allure.attach(snapshot['data'], name=name, attachment_type="multipart/related", extension="mhtml")
+                    return
+                except WebDriverException:
+                    pass
             page_source = self.driver.page_source
-            allure.attach(page_source, name=name, attachment_type=allure.attachment_type.HTML)
-        except ImportError:
-            print("Allure not available, saving page source to file")
-            timestamp = int(time.time())
-            with open(f"reports/page_source_{timestamp}.html", "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
+            allure.attach(page_source, name=name, attachment_type=HTML_ATTACHMENT)
         except Exception as e:
-            print(f"Error attaching page source to Allure: {e}")
+            logger.warning("Error attaching page source to Allure: %s", e)
 
     def attach_browser_logs_to_allure(self, name: str = "Browser Logs") -> None:
         """
@@ -423,21 +1067,37 @@ class BasePage:
         Args:
             name: Name for the attachment in Allure
         """
+        if not self.has_browser_logs:
+            logger.info("Browser logs not available")
+            return
         try:
-            import allure
             logs = self.driver.get_log('browser')
-            log_text = "\n".join([f"{log['timestamp']}: {log['level']}: {log['message']}" for log in logs])
-            allure.attach(log_text, name=name, attachment_type=allure.attachment_type.TEXT)
-        except ImportError:
-            print("Allure not available, printing browser logs")
-            try:
-                logs = self.driver.get_log('browser')
-                for log in logs:
-                    print(f"Browser Log: {log['level']}: {log['message']}")
-            except:
-                print("Browser logs not available")
         except Exception as e:
-            print(f"Error attaching browser logs to Allure: {e}")
+            logger.warning("Error reading browser logs: %s", e)
+            return
+        if not logs:
+            return
+        
+        if allure is None:
+            logger.info("Allure not available, logging browser logs")
+            for log in logs:
+                logger.info("Browser Log: %s: %s", log['level'], log['message'])
+            return
+        try:
+            buffer = io.StringIO()
+            for log in logs:
+                buffer.write(f"{log['timestamp']}: {log['level']}: {log['message']}\n")
+            allure.attach(buffer.getvalue(), name=name, attachment_type=TEXT_ATTACHMENT)
+        except Exception as e:
+            logger.warning("Error attaching browser logs to Allure: %s", e)
+
+    @cached_property
+    def has_browser_logs(self) -> bool:
+        """Whether the driver exposes a 'browser' log (geckodriver and safaridriver don't)."""
+        try:
+            return 'browser' in self.driver.log_types
+        except Exception:
+            return False
 
     def attach_detailed_error_info_to_allure(self, error_msg: str, context: str = "") -> None:
         """
@@ -447,27 +1107,30 @@ class BasePage:
             error_msg: The error message
             context: Additional context about what was being attempted
         """
+        if allure is None:
+            logger.info("Allure not available, skipping detailed error report: %s", error_msg)
+            return
         try:
-            import allure
-            
-            # Get detailed environment info
+            # Only the page details change between reports; browser details are cached
+            info = self.driver.execute_script(self.ERROR_INFO_SCRIPT)
+            window_metrics = self.window_metrics
             error_details = f"""
 ERROR DETAILS:
 =============
 Error Message: {error_msg}
 Context: {context}
-Current URL: {self.driver.current_url}
-Page Title: {self.driver.title}
-Window Size: {self.driver.get_window_size()}
+Current URL: {info['url']}
+Page Title: {info['title']}
+Window Size: {window_metrics['window']}
 Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}
 
 BROWSER INFO:
 ============
-User Agent: {self.driver.execute_script('return navigator.userAgent;')}
-Viewport: {self.driver.execute_script('return {width: window.innerWidth, height: window.innerHeight};')}
+User Agent: {self.user_agent}
+Viewport: {window_metrics['viewport']}
 """
             
-            allure.attach(error_details, name="Error Details", attachment_type=allure.attachment_type.TEXT)
+            allure.attach(error_details, name="Error Details", attachment_type=TEXT_ATTACHMENT)
             
             # Also attach screenshot, page source, and logs
             self.attach_screenshot_to_allure("Error Screenshot")
@@ -475,7 +1138,155 @@ Viewport: {self.driver.execute_script('return {width: window.innerWidth, height:
             self.attach_browser_logs_to_allure("Error Browser Logs")
             
         except Exception as e:
-            print(f"Error creating detailed error report: {e}")
+            logger.warning("Error creating detailed error report: %s", e)
+
+    # ====================================================================
+    # BATCH QUERY METHODS
+    # ====================================================================
+
+    def batch_presence(self, locators: Dict[str, Tuple[str, str]]) -> Dict[str, bool]:
+        """
+        Check which of several elements are present right now, in a single script call.
+        
+        Locators without a CSS/XPath equivalent are checked individually.
+        
+        Args:
+            locators: Mapping of result key to locator tuple
+            
+        Returns:
+            Mapping of result key to presence
+        """
+        specs = {}
+        result = {}
+        for key, locator in locators.items():
+            spec = self._to_js_locator(locator)
+            if spec is None:
+                result[key] = self.is_element_present(locator, timeout=0)
+            else:
+                specs[key] = [spec]
+        
+        if specs:
+            result.update(self._run_presence_script(specs))
+        return {key: result[key] for key in locators}
+
+    def batch_visibility(self, locators: Dict[str, List[Tuple[str, str]]], timeout: float = 0,
+                         until: Callable[[Dict[str, bool]], bool] = None) -> Dict[str, bool]:
+        """
+        Check which of several elements are visible, each with its own fallback locators,
+        in a single script call per poll.
+        
+        Args:
+            locators: Mapping of result key to locator tuples (any of which may match)
+            timeout: Seconds to keep polling; 0 checks once
+            until: Stop polling once this returns True for the results (default: every key visible)
+            
+        Returns:
+            Mapping of result key to visibility, as of the last poll
+        """
+        specs = {}
+        result = {}
+        for key, alternatives in locators.items():
+            key_specs = [self._to_js_locator(locator) for locator in alternatives]
+            if None in key_specs and timeout <= 0:
+                result[key] = any(self.is_element_present_nowait(locator, visible=True) for locator in alternatives)
+            elif None in key_specs:
+                result[key] = self.is_element_visible_with_fallback(alternatives, key, timeout=timeout)
+            else:
+                specs[key] = key_specs
+        
+        if specs:
+            latest = {}
+            
+            done = until or (lambda results: all(results.values()))
+            
+            def poll(driver) -> bool:
+                latest.update(self._run_presence_script(specs, visible=True))
+                return done({**result, **latest})
+            
+            if timeout <= 0:
+                poll(self.driver)
+            else:
+                try:
+                    self._get_wait(timeout).until(poll)
+                except TimeoutException:
+                    pass
+            result.update(latest)
+        return {key: result[key] for key in locators}
+
+    def any_present(self, *locators: Tuple[str, str], timeout: float = 0) -> bool:
+        """
+        Check whether any of several elements is present with one lookup per strategy.
+        
+        CSS-expressible locators are joined into a single selector list and XPath
+        locators into a single union expression.
+        
+        Args:
+            locators: Locator tuples to check
+            timeout: Seconds to keep checking; 0 checks once
+            
+        Returns:
+            True if at least one element is present, False otherwise
+        """
+        css_selectors = []
+        xpaths = []
+        others = []
+        for locator in locators:
+            spec = self._to_js_locator(locator)
+            if spec is None:
+                others.append(locator)
+            elif spec[0] == 'xpath':
+                xpaths.append(spec[1])
+            else:
+                css_selectors.append(spec[1])
+        
+        def check(driver) -> bool:
+            if css_selectors and driver.find_elements(By.CSS_SELECTOR, ', '.join(css_selectors)):
+                return True
+            if xpaths and driver.find_elements(By.XPATH, ' | '.join(xpaths)):
+                return True
+            return any(driver.find_elements(*locator) for locator in others)
+        
+        if timeout <= 0:
+            return check(self.driver)
+        try:
+            return self._get_wait(timeout).until(check)
+        except TimeoutException:
+            return False
+
+    def find_element_by_text(self, css_selector: str, pattern: str) -> Optional[WebElement]:
+        """
+        Find an element by its text with a regular expression, evaluated in the page.
+        
+        Faster than an XPath contains(text(), ...) lookup and matches across child nodes.
+        
+        Args:
+            css_selector: Candidate elements (e.g. 'a')
+            pattern: JavaScript regular expression, matched case-insensitively
+            
+        Returns:
+            First matching WebElement, or None
+        """
+        try:
+            return self.driver.execute_script(self.FIND_BY_TEXT_SCRIPT, css_selector, pattern)
+        except WebDriverException:
+            return None
+
+    def _run_presence_script(self, specs: Dict[str, List[List[str]]], visible: bool = False) -> Dict[str, bool]:
+        """
+        Evaluate pre-translated specs with BATCH_PRESENCE_SCRIPT.
+        
+        Args:
+            specs: Mapping of result key to a list of alternative specs
+            visible: Only count elements that are rendered
+            
+        Returns:
+            Mapping of result key to presence (all False if the script fails)
+        """
+        try:
+            return self.driver.execute_script(self.BATCH_PRESENCE_SCRIPT, specs, visible)
+        except WebDriverException as e:
+            logger.warning("Batched presence check failed: %s", e)
+            return dict.fromkeys(specs, False)
 
     # ====================================================================
     # FALLBACK LOCATOR METHODS
@@ -486,80 +1297,173 @@ Viewport: {self.driver.execute_script('return {width: window.innerWidth, height:
         Try multiple locators until one finds an element.
         
         Args:
-            locators: List of locator tuples to try
-            timeout: Timeout for each locator attempt
+            locators: List of locator tuples to try, in priority order
+            timeout: Total timeout shared by all locators
             
         Returns:
             WebElement if found, None otherwise
         """
-        for locator in locators:
-            try:
-                return self.find_element(locator, timeout=timeout)
-            except Exception:
-                continue
-        return None
+        return self._find_first_matching(locators, timeout=timeout)
 
     def send_keys_with_fallback(self, locators: List[Tuple[str, str]], text: str, timeout: int = 3) -> bool:
         """
         Try multiple locators to find an element and send keys to it.
         
         Args:
-            locators: List of locator tuples to try
+            locators: List of locator tuples to try, in priority order
             text: Text to send to the element
-            timeout: Timeout for each locator attempt
+            timeout: Total timeout shared by all locators
             
         Returns:
             True if successful, False otherwise
         """
-        for locator in locators:
-            try:
-                element = self.find_element(locator, timeout=timeout)
-                element.clear()
-                element.send_keys(text)
-                return True
-            except Exception:
-                continue
-        return False
+        element = self._find_first_matching(locators, timeout=timeout)
+        if element is None:
+            return False
+        try:
+            element.clear()
+            element.send_keys(text)
+            return True
+        except Exception:
+            return False
 
     def click_with_fallback(self, locators: List[Tuple[str, str]], timeout: int = 3) -> bool:
         """
         Try multiple locators to find an element and click it.
         
         Args:
-            locators: List of locator tuples to try
-            timeout: Timeout for each locator attempt
+            locators: List of locator tuples to try, in priority order
+            timeout: Total timeout shared by all locators
             
         Returns:
             True if successful, False otherwise
         """
-        for locator in locators:
-            try:
-                element = self.find_element(locator, timeout=timeout)
-                element.click()
-                return True
-            except Exception:
-                continue
-        return False
+        element = self._find_first_matching(locators, timeout=timeout)
+        if element is None:
+            return False
+        try:
+            element.click()
+            return True
+        except Exception:
+            return False
 
     def is_element_visible_with_fallback(self, locators: List[Tuple[str, str]], element_name: str = "element", timeout: int = 2) -> bool:
         """
         Try multiple locators to check if any element is visible.
         
         Args:
-            locators: List of locator tuples to try
+            locators: List of locator tuples to try, in priority order
             element_name: Name of element for debugging (unused but kept for compatibility)
-            timeout: Timeout for each locator attempt
+            timeout: Total timeout shared by all locators
             
         Returns:
             True if any element is visible, False otherwise
         """
-        for locator in locators:
-            try:
-                if self.is_element_visible(locator, timeout=timeout):
-                    return True
-            except Exception:
-                continue
-        return False
+        return self._find_first_matching(locators, timeout=timeout, visible=True) is not None
+
+    def run_on_fallback(self, locators: List[Tuple[str, str]], action: Callable[[WebElement], Any],
+                        element_name: str = "element", timeout: int = 3) -> Any:
+        """
+        Run an action against the first element any of the locators finds.
+        
+        With the element cache enabled the element is cached under the whole locator list,
+        so later actions on the same field skip the fallback scan; a stale element is
+        re-resolved once.
+        
+        Args:
+            locators: List of locator tuples to try, in priority order
+            action: Callable that receives the element
+            element_name: Name of element for the error message
+            timeout: Total timeout shared by all locators
+            
+        Returns:
+            Whatever the action returns
+            
+        Raises:
+            NoSuchElementException: If none of the locators finds an element
+        """
+        def finder() -> WebElement:
+            element = self.find_element_with_fallback(locators, timeout=timeout)
+            if element is None:
+                raise NoSuchElementException(f"Could not find {element_name} with any of the available locators")
+            return element
+        
+        return self._run_on_element(tuple(locators), finder, action)
+
+    def _find_first_matching(self, locators: List[Tuple[str, str]], timeout: int = 3, visible: bool = False) -> Optional[WebElement]:
+        """
+        Resolve the first matching locator, checking every candidate in one script call per poll.
+        
+        Locators that have no CSS/XPath equivalent are tried one at a time instead, starting
+        with whichever one matched last time for the same group.
+        
+        Args:
+            locators: List of locator tuples to try, in priority order
+            timeout: Total timeout shared by all locators
+            visible: Only accept elements that are rendered
+            
+        Returns:
+            WebElement if found, None otherwise
+        """
+        specs = [self._to_js_locator(locator) for locator in locators]
+        try:
+            if None in specs:
+                finder = self.find_visible_element if visible else self.find_element
+                group = tuple(locators)
+                winner = self._winning_locator.get(group)
+                order = range(len(group))
+                if winner is not None:
+                    order = [winner] + [index for index in order if index != winner]
+                deadline = time.monotonic() + timeout
+                for index in order:
+                    # Locators share the timeout; once it is spent the rest get one immediate look.
+                    # Rounded so the cached waits aren't keyed on every distinct float.
+                    remaining = round(max(deadline - time.monotonic(), 0), 1)
+                    try:
+                        element = finder(group[index], timeout=remaining)
+                    except TimeoutException:
+                        continue
+                    self._winning_locator[group] = index
+                    return element
+                return None
+            
+            wait = self._get_wait(timeout)
+            return wait.until(lambda driver: driver.execute_script(self.FIND_FIRST_SCRIPT, specs, visible, False))
+        except Exception:
+            return None
+
+    @classmethod
+    def _intern_locators(cls) -> None:
+        """Replace the class's (By, value) tuples with Locator instances holding interned strings."""
+        for name, value in list(vars(cls).items()):
+            if (name.isupper() and isinstance(value, tuple) and len(value) == 2
+                    and value[0] in _LOCATOR_STRATEGIES and isinstance(value[1], str)):
+                setattr(cls, name, Locator(sys.intern(value[0]), sys.intern(value[1])))
+
+    @staticmethod
+    def _to_js_locator(locator: Tuple[str, str]) -> Optional[List[str]]:
+        """
+        Translate a locator tuple into a [kind, query] pair for FIND_FIRST_SCRIPT.
+        
+        Args:
+            locator: Locator tuple
+            
+        Returns:
+            ['css', selector] or ['xpath', expression], or None if the strategy has no equivalent
+        """
+        strategy, value = locator
+        if strategy == By.XPATH:
+            return ['xpath', value]
+        if strategy == By.CSS_SELECTOR:
+            return ['css', value]
+        if strategy in (By.ID, By.NAME):
+            escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+            return ['css', f'[{strategy}="{escaped}"]']
+        if strategy == By.CLASS_NAME:
+            return ['css', f'.{value}']
+        if strategy == By.TAG_NAME:
+            return ['css', value]
+        return None
 
     # ...existing code...
 
@@ -3,10 +3,119 @@ Dashboard page object for post-login verification.
 Contains elements and interactions for the Hudl dashboard page.
 """
 
+import json
+import logging
+from types import MappingProxyType
 from selenium.webdriver.common.by import By
-from typing import Dict, Any, List, Optional
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from typing import Dict, Any, List, Mapping, Optional
 from pages.base_page import BasePage
 
+logger = logging.getLogger(__name__)
+
+
+# Features each user role is expected to see on the dashboard
+_ROLE_FEATURES: Dict[str, frozenset] = {
+    'coach': frozenset({'upload_video', 'create_highlight', 'view_roster', 'highlights', 'tools', 'library'}),
+    'player': frozenset({'highlights', 'library'}),
+    'admin': frozenset({'upload_video', 'create_highlight', 'view_roster', 'highlights', 'tools', 'library'}),
+    'parent': frozenset({'highlights', 'library'})
+}
+
+
+# Returns the names in arguments[0] whose selector in arguments[1] matches an element
+AVAILABLE_FEATURES_SCRIPT = """
+    const [names, selectors] = arguments;
+    return names.filter((_, i) => document.querySelector(selectors[i]) !== null);
+"""
+
+
+# Clicks the first logout control matching arguments[0] (or a link whose text matches
+# arguments[2]). If there is none and a menu selector is given in arguments[1], opens that menu.
+LOGOUT_CLICK_SCRIPT = """
+    const byText = new RegExp(arguments[2], 'i');
+    const logout = document.querySelector(arguments[0]) ||
+        Array.from(document.querySelectorAll('a')).find(a => byText.test(a.textContent));
+    if (logout) { logout.click(); return 'clicked'; }
+    const menu = arguments[1] ? document.querySelector(arguments[1]) : null;
+    if (menu) { menu.click(); return 'menu'; }
+    return 'missing';
+"""
+
+
+# Returns [matched, texts] for every element matching the CSS list in arguments[0], plus every
+# element with a direct text node matching the pattern in arguments[1].
+ERROR_SCAN_SCRIPT = """
+    const elements = Array.from(document.querySelectorAll(arguments[0]));
+    const re = new RegExp(arguments[1]);
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    while (walker.nextNode()) {
+        const parent = walker.currentNode.parentElement;
+        if (parent && re.test(walker.currentNode.nodeValue) && !elements.includes(parent)) elements.push(parent);
+    }
+    return [elements.length > 0, elements.map(e => (e.innerText || '').trim()).filter(Boolean)];
+"""
+
+
+# Builds the whole get_dashboard_info() result in the page. %s is replaced with a JSON map of
+# locator key -> spec (see BasePage.BATCH_PRESENCE_SCRIPT).
+DASHBOARD_INFO_EXPRESSION = """
+(() => {
+    const specs = %s;
+    const el = {};
+    for (const [key, [kind, query, pattern]] of Object.entries(specs)) {
+        try {
+            if (kind === 'xpath') {
+                el[key] = document.evaluate(query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            } else if (kind === 'text') {
+                const re = new RegExp(pattern, 'i');
+                el[key] = Array.from(document.querySelectorAll(query)).find(e => re.test(e.textContent)) || null;
+            } else {
+                el[key] = document.querySelector(query);
+            }
+        } catch (e) {
+            el[key] = null;
+        }
+    }
+    const has = (key) => el[key] !== null;
+    const text = (key) => has(key) ? el[key].innerText.trim() : '';
+    const url = window.location.href;
+    const navigation = performance.getEntriesByType('navigation')[0];
+    const userMenu = has('user_menu') || has('user_menu_alt');
+    return JSON.stringify({
+        url: url,
+        title: document.title,
+        user_name: text('user_name') || text('user_name_alt'),
+        welcome_message: text('welcome_message'),
+        team_info: text('team_info'),
+        user_avatar_src: has('user_avatar') ? (el.user_avatar.getAttribute('src') || '') : '',
+        login_validation: {
+            on_dashboard_page: url.includes('/home') || url.includes('/dashboard') || has('dashboard_content'),
+            user_logged_in: userMenu,
+            user_menu_present: userMenu,
+            dashboard_content_present: has('dashboard_content'),
+            navigation_present: has('main_navigation'),
+            logout_available: has('logout_button') || has('logout_button_alt')
+        },
+        element_status: {
+            user_menu: userMenu,
+            user_avatar: has('user_avatar'),
+            user_name: has('user_name') || has('user_name_alt'),
+            main_navigation: has('main_navigation'),
+            dashboard_content: has('dashboard_content'),
+            welcome_message: has('welcome_message'),
+            team_info: has('team_info'),
+            recent_highlights: has('recent_highlights'),
+            upload_video_button: has('upload_video_button'),
+            create_highlight_button: has('create_highlight_button'),
+            view_roster_button: has('view_roster_button')
+        },
+        page_load_time: navigation ? navigation.duration : null
+    });
+})()
+"""
+
 
 class DashboardPage(BasePage):
     """Page object for Hudl dashboard page."""
@@ -14,11 +123,13 @@ class DashboardPage(BasePage):
     # Page URLs
     HOME_URL = "/home"
     DASHBOARD_URL = "/dashboard"
+    DASHBOARD_URLS = (HOME_URL, DASHBOARD_URL)
     
     # Header elements
     USER_MENU = (By.CLASS_NAME, "hui-globalusermenu")
     USER_AVATAR = (By.CSS_SELECTOR, ".user-avatar")
     DISPLAY_NAME = (By.CLASS_NAME, "hui-globaluseritem__display-name")
+    USER_NAME = DISPLAY_NAME
     LOGOUT_BUTTON = (By.CSS_SELECTOR, "[data-qa-id='webnav-usermenu-logout']")
     SETTINGS_LINK = (By.CSS_SELECTOR, "[data-qa-id='settings-link']")
     
@@ -44,11 +155,58 @@ class DashboardPage(BasePage):
     USER_MENU_ALT = (By.CSS_SELECTOR, ".user-dropdown")
     LOGOUT_BUTTON_ALT = (By.XPATH, "//a[contains(text(), 'Log Out') or contains(text(), 'Sign Out')]")
     USER_NAME_ALT = (By.CSS_SELECTOR, ".user-display-name")
+    LOGOUT_LINK_ALT = (By.CSS_SELECTOR, ".user-dropdown a[href*='logout']")
+    
+    # Text-based stand-ins evaluated in the page instead of the XPath locators of the same name:
+    # name -> (candidate CSS selector, case-insensitive pattern)
+    LOGOUT_TEXT_PATTERN = r"Log ?Out|Sign ?Out"
+    _TEXT_MATCHERS = {
+        'LOGOUT_BUTTON_ALT': ('a', LOGOUT_TEXT_PATTERN)
+    }
+    
+    # Error indicators
+    ERROR_SELECTORS = (".error-message", ".alert-error", "[data-qa-id='error']")
+    ERROR_TEXT_PATTERN = r"[Ee]rror"
     
     # Loading elements
     DASHBOARD_LOADING = (By.CSS_SELECTOR, ".dashboard-loading")
     CONTENT_LOADING = (By.CSS_SELECTOR, ".content-loading")
     
+    # Presence checks behind validate_successful_login() and get_page_elements_status():
+    # result key -> locator attribute name (a tuple means any of them)
+    _LOGIN_VALIDATION_LOCATORS = {
+        'user_menu': ('USER_MENU', 'USER_MENU_ALT'),
+        'dashboard_content': 'DASHBOARD_CONTENT',
+        'main_navigation': 'MAIN_NAVIGATION',
+        'logout_button': ('LOGOUT_BUTTON', 'LOGOUT_BUTTON_ALT')
+    }
+    _ELEMENT_STATUS_LOCATORS = {
+        'user_menu': ('USER_MENU', 'USER_MENU_ALT'),
+        'user_avatar': 'USER_AVATAR',
+        'user_name': ('USER_NAME', 'USER_NAME_ALT'),
+        'main_navigation': 'MAIN_NAVIGATION',
+        'dashboard_content': 'DASHBOARD_CONTENT',
+        'welcome_message': 'WELCOME_MESSAGE',
+        'team_info': 'TEAM_INFO',
+        'recent_highlights': 'RECENT_HIGHLIGHTS',
+        'upload_video_button': 'UPLOAD_VIDEO_BUTTON',
+        'create_highlight_button': 'CREATE_HIGHLIGHT_BUTTON',
+        'view_roster_button': 'VIEW_ROSTER_BUTTON'
+    }
+    
+    # Role-dependent feature -> locator attribute name of its control
+    _FEATURE_LOCATORS = {
+        'upload_video': 'UPLOAD_VIDEO_BUTTON',
+        'create_highlight': 'CREATE_HIGHLIGHT_BUTTON',
+        'view_roster': 'VIEW_ROSTER_BUTTON',
+        'highlights': 'HIGHLIGHTS_TAB',
+        'tools': 'TOOLS_TAB',
+        'library': 'LIBRARY_TAB'
+    }
+    
+    # Locator attribute name -> CSS selector, filled in by _build_css_map() at import
+    _CSS_MAP: Mapping[str, str] = MappingProxyType({})
+    
     def __init__(self, driver, config=None):
         """
         Initialize dashboard page.
@@ -59,6 +217,58 @@ class DashboardPage(BasePage):
         """
         super().__init__(driver, config)
     
+    @classmethod
+    def _build_css_map(cls) -> None:
+        """Translate every CSS-expressible locator on the class into a selector string once."""
+        css_map = {}
+        for name, value in vars(cls).items():
+            if name.isupper() and isinstance(value, tuple) and len(value) == 2:
+                spec = cls._to_js_locator(value)
+                if spec is not None and spec[0] == 'css':
+                    css_map[name] = spec[1]
+        cls._CSS_MAP = MappingProxyType(css_map)
+    
+    def _presence_by_name(self, names: Dict[str, Any]) -> Dict[str, bool]:
+        """
+        Check element presence for locators referenced by attribute name, in one script call.
+        
+        A tuple of names means "any of these".
+        
+        Args:
+            names: Mapping of result key to locator attribute name (or tuple of names)
+            
+        Returns:
+            Mapping of result key to presence
+        """
+        specs = {}
+        present = {}
+        for key, name in names.items():
+            alternatives = [self._spec_for(alt) for alt in (name if isinstance(name, tuple) else (name,))]
+            if None in alternatives:
+                present[key] = self.any_present(*(getattr(self, alt) for alt in
+                                                  (name if isinstance(name, tuple) else (name,))))
+            else:
+                specs[key] = alternatives
+        if specs:
+            present.update(self._run_presence_script(specs))
+        return {key: present[key] for key in names}
+    
+    def _spec_for(self, name: str) -> Optional[List[str]]:
+        """
+        Translate a locator attribute name into a BATCH_PRESENCE_SCRIPT spec.
+        
+        Args:
+            name: Locator attribute name
+            
+        Returns:
+            Spec list, or None if the locator can't be checked in the page
+        """
+        if name in self._TEXT_MATCHERS:
+            return ['text', *self._TEXT_MATCHERS[name]]
+        if name in self._CSS_MAP:
+            return ['css', self._CSS_MAP[name]]
+        return self._to_js_locator(getattr(self, name))
+    
     # Navigation verification methods
     def is_on_dashboard_page(self) -> bool:
         """
@@ -68,11 +278,16 @@ class DashboardPage(BasePage):
             True if on dashboard page, False otherwise
         """
         current_url = self.get_current_url()
-        print(f"Current URL: {current_url}")
-        print(f"Expected URLs: {self.HOME_URL}, {self.DASHBOARD_URL}")
-        return (self.HOME_URL in current_url or 
-                self.DASHBOARD_URL in current_url or
-                self.is_element_present(self.DASHBOARD_CONTENT, timeout=5))
+        logger.debug("Current URL: %s", current_url)
+        logger.debug("Expected URLs: %s", self.DASHBOARD_URLS)
+        if self._is_dashboard_url(current_url):
+            return True
+        # Only probe the DOM when the URL doesn't already tell us
+        return self.is_element_present(self.DASHBOARD_CONTENT, timeout=2)
+
+    def _is_dashboard_url(self, url: str) -> bool:
+        """Check whether a URL points at one of the dashboard paths."""
+        return any(path in url for path in self.DASHBOARD_URLS)
 
     def get_display_name(self) -> str:
 
@@ -97,15 +312,20 @@ class DashboardPage(BasePage):
         """
         try:
             # Wait for dashboard content or user menu to appear
-            self.wait.until(
-                lambda driver: self.is_element_present(self.DASHBOARD_CONTENT, timeout=2) or
-                               self.is_element_present(self.USER_MENU, timeout=2) or
-                               self.is_element_present(self.USER_MENU_ALT, timeout=2)
-            )
+            self._get_wait(timeout).until(EC.any_of(
+                EC.presence_of_element_located(self.DASHBOARD_CONTENT),
+                EC.presence_of_element_located(self.USER_MENU),
+                EC.presence_of_element_located(self.USER_MENU_ALT)
+            ))
             
-            # Wait for loading indicators to disappear
-            self.wait_for_element_invisible(self.DASHBOARD_LOADING, timeout=5)
-            self.wait_for_element_invisible(self.CONTENT_LOADING, timeout=5)
+            # Wait for both loading indicators to disappear under one shared timeout
+            try:
+                self._get_wait(5).until(EC.all_of(
+                    EC.invisibility_of_element_located(self.DASHBOARD_LOADING),
+                    EC.invisibility_of_element_located(self.CONTENT_LOADING)
+                ))
+            except TimeoutException:
+                pass
             
             return True
         except Exception:
@@ -134,8 +354,7 @@ class DashboardPage(BasePage):
         Returns:
             True if user is logged in, False otherwise
         """
-        return (self.is_element_present(self.USER_MENU, timeout=5) or
-                self.is_element_present(self.USER_MENU_ALT, timeout=5))
+        return self.any_present(self.USER_MENU, self.USER_MENU_ALT, timeout=5)
     
     def get_user_avatar_src(self) -> str:
         """
@@ -158,15 +377,31 @@ class DashboardPage(BasePage):
             self.click_element(self.USER_MENU_ALT)
     
     def click_logout(self) -> None:
-        """Click the logout button."""
-        # Open user menu if it's a dropdown
-        if not self.is_element_visible(self.LOGOUT_BUTTON, timeout=2):
-            self.open_user_menu()
+        """Click the logout button, opening the user menu first if the button isn't rendered."""
+        logout_css = ', '.join(self._CSS_MAP[name] for name in ('LOGOUT_BUTTON', 'LOGOUT_LINK_ALT'))
+        menu_css = ', '.join(self._CSS_MAP[name] for name in ('USER_MENU', 'USER_MENU_ALT'))
+        try:
+            outcome = self.driver.execute_script(LOGOUT_CLICK_SCRIPT, logout_css, menu_css, self.LOGOUT_TEXT_PATTERN)
+            if outcome == 'clicked':
+                return
+            if outcome == 'menu':
+                # The dropdown may render asynchronously after opening
+                self._get_wait(2).until(
+                    lambda driver: driver.execute_script(
+                        LOGOUT_CLICK_SCRIPT, logout_css, None, self.LOGOUT_TEXT_PATTERN
+                    ) == 'clicked'
+                )
+                return
+        except Exception:
+            pass
         
         try:
             self.click_element(self.LOGOUT_BUTTON)
         except Exception:
-            self.click_element(self.LOGOUT_BUTTON_ALT)
+            logout_link = self.find_element_by_text('a', self.LOGOUT_TEXT_PATTERN)
+            if logout_link is None:
+                raise
+            logout_link.click()
     
     def click_settings(self) -> None:
         """Click the settings link."""
@@ -241,61 +476,112 @@ class DashboardPage(BasePage):
         self.click_element(self.VIEW_ROSTER_BUTTON)
     
     # Validation methods
-    def validate_successful_login(self) -> Dict[str, bool]:
+    def validate_successful_login(self, snapshot: Optional[Dict[str, bool]] = None) -> Dict[str, bool]:
         """
         Validate successful login by checking key indicators.
         
+        Args:
+            snapshot: Presence map already fetched for _LOGIN_VALIDATION_LOCATORS
+            
         Returns:
             Dictionary with validation results
         """
+        if snapshot is None:
+            snapshot = self._presence_by_name(self._LOGIN_VALIDATION_LOCATORS)
+        current_url = self.get_current_url()
         return {
-            'on_dashboard_page': self.is_on_dashboard_page(),
-            'user_logged_in': self.is_user_logged_in(),
-            'user_menu_present': self.is_element_present(self.USER_MENU) or self.is_element_present(self.USER_MENU_ALT),
-            'dashboard_content_present': self.is_element_present(self.DASHBOARD_CONTENT),
-            'navigation_present': self.is_element_present(self.MAIN_NAVIGATION),
-            'logout_available': self.is_element_present(self.LOGOUT_BUTTON) or self.is_element_present(self.LOGOUT_BUTTON_ALT)
+            'on_dashboard_page': self._is_dashboard_url(current_url) or snapshot['dashboard_content'],
+            'user_logged_in': snapshot['user_menu'],
+            'user_menu_present': snapshot['user_menu'],
+            'dashboard_content_present': snapshot['dashboard_content'],
+            'navigation_present': snapshot['main_navigation'],
+            'logout_available': snapshot['logout_button']
         }
     
-    def get_page_elements_status(self) -> Dict[str, bool]:
+    def get_page_elements_status(self, snapshot: Optional[Dict[str, bool]] = None) -> Dict[str, bool]:
         """
         Get status of all major page elements.
         
+        Args:
+            snapshot: Presence map already fetched for _ELEMENT_STATUS_LOCATORS
+            
         Returns:
             Dictionary with element presence status
         """
-        return {
-            'user_menu': self.is_element_present(self.USER_MENU) or self.is_element_present(self.USER_MENU_ALT),
-            'user_avatar': self.is_element_present(self.USER_AVATAR),
-            'user_name': self.is_element_present(self.USER_NAME) or self.is_element_present(self.USER_NAME_ALT),
-            'main_navigation': self.is_element_present(self.MAIN_NAVIGATION),
-            'dashboard_content': self.is_element_present(self.DASHBOARD_CONTENT),
-            'welcome_message': self.is_element_present(self.WELCOME_MESSAGE),
-            'team_info': self.is_element_present(self.TEAM_INFO),
-            'recent_highlights': self.is_element_present(self.RECENT_HIGHLIGHTS),
-            'upload_video_button': self.is_element_present(self.UPLOAD_VIDEO_BUTTON),
-            'create_highlight_button': self.is_element_present(self.CREATE_HIGHLIGHT_BUTTON),
-            'view_roster_button': self.is_element_present(self.VIEW_ROSTER_BUTTON)
-        }
+        if snapshot is None:
+            snapshot = self._presence_by_name(self._ELEMENT_STATUS_LOCATORS)
+        return {key: snapshot[key] for key in self._ELEMENT_STATUS_LOCATORS}
     
     def get_dashboard_info(self) -> Dict[str, Any]:
         """
         Get comprehensive dashboard information.
         
+        Everything is collected by one expression evaluated in the page (through
+        DevTools Runtime.evaluate on Chromium); the per-field helpers are only used
+        if that fails.
+        
         Returns:
             Dictionary with dashboard information
         """
-        return {
-            'url': self.get_current_url(),
-            'title': self.get_page_title(),
-            'user_name': self.get_user_name(),
-            'welcome_message': self.get_welcome_message(),
-            'team_info': self.get_team_info(),
-            'user_avatar_src': self.get_user_avatar_src(),
-            'login_validation': self.validate_successful_login(),
-            'element_status': self.get_page_elements_status(),
-            'page_load_time': self.get_page_load_time()
+        names = {
+            'user_menu': 'USER_MENU',
+            'user_menu_alt': 'USER_MENU_ALT',
+            'user_avatar': 'USER_AVATAR',
+            'user_name': 'USER_NAME',
+            'user_name_alt': 'USER_NAME_ALT',
+            'main_navigation': 'MAIN_NAVIGATION',
+            'dashboard_content': 'DASHBOARD_CONTENT',
+            'welcome_message': 'WELCOME_MESSAGE',
+            'team_info': 'TEAM_INFO',
+            'recent_highlights': 'RECENT_HIGHLIGHTS',
+            'upload_video_button': 'UPLOAD_VIDEO_BUTTON',
+            'create_highlight_button': 'CREATE_HIGHLIGHT_BUTTON',
+            'view_roster_button': 'VIEW_ROSTER_BUTTON',
+            'logout_button': 'LOGOUT_BUTTON',
+            'logout_button_alt': 'LOGOUT_BUTTON_ALT'
         }
+        expression = DASHBOARD_INFO_EXPRESSION % json.dumps(
+            {key: self._spec_for(name) for key, name in names.items()}
+        )
+        try:
+            if hasattr(self.driver, 'execute_cdp_cmd'):
+                response = self.driver.execute_cdp_cmd(
+                    "Runtime.evaluate", {"expression": expression, "returnByValue": True}
+                )
+                return json.loads(response['result']['value'])
+            return json.loads(self.driver.execute_script(f"return {expression};"))
+        except Exception:
+            pass
+        
+        # Fetch the presence flags both validation dicts need in one call, and read URL/title once
+        with self.page_snapshot():
+            snapshot = self._presence_by_name({**self._LOGIN_VALIDATION_LOCATORS, **self._ELEMENT_STATUS_LOCATORS})
+            return {
+                'url': self.get_current_url(),
+                'title': self.get_page_title(),
+                'user_name': self.get_user_name(),
+                'welcome_message': self.get_welcome_message(),
+                'team_info': self.get_team_info(),
+                'user_avatar_src': self.get_user_avatar_src(),
+                'login_validation': self.validate_successful_login(snapshot),
+                'element_status': self.get_page_elements_status(snapshot),
+                'page_load_time': self.get_page_load_time()
+            }
+    
+    def get_page_load_time(self) -> Optional[float]:
+        """
+        Get how long the current document took to load.
+        
+        Returns:
+            Navigation duration in milliseconds, or None if the browser doesn't report it
+        """
+        try:
+            return self.driver.execute_script(
+                "const nav = performance.getEntriesByType('navigation')[0];"
+                "return nav ? nav.duration : null;"
+            )
+        except Exception:
+            return None
     
     # Role-specific content methods
     def get_available_features(self) -> List[str]:
@@ -305,27 +591,13 @@ class DashboardPage(BasePage):
         Returns:
             List of available feature names
         """
-        features = []
-        
-        if self.is_element_present(self.UPLOAD_VIDEO_BUTTON):
-            features.append('upload_video')
-        
-        if self.is_element_present(self.CREATE_HIGHLIGHT_BUTTON):
-            features.append('create_highlight')
-        
-        if self.is_element_present(self.VIEW_ROSTER_BUTTON):
-            features.append('view_roster')
-        
-        if self.is_element_present(self.HIGHLIGHTS_TAB):
-            features.append('highlights')
-        
-        if self.is_element_present(self.TOOLS_TAB):
-            features.append('tools')
-        
-        if self.is_element_present(self.LIBRARY_TAB):
-            features.append('library')
-        
-        return features
+        names = list(self._FEATURE_LOCATORS)
+        selectors = [self._CSS_MAP[name] for name in self._FEATURE_LOCATORS.values()]
+        try:
+            return self.driver.execute_script(AVAILABLE_FEATURES_SCRIPT, names, selectors)
+        except Exception:
+            present = self._presence_by_name(self._FEATURE_LOCATORS)
+            return [feature for feature, is_present in present.items() if is_present]
     
     def verify_user_role_features(self, expected_role: str) -> Dict[str, bool]:
         """
@@ -338,24 +610,15 @@ class DashboardPage(BasePage):
             Dictionary with role verification results
         """
         available_features = self.get_available_features()
+        expected_features = _ROLE_FEATURES.get(expected_role.lower(), frozenset())
+        present_features = expected_features & set(available_features)
         
-        # Define expected features by role
-        role_features = {
-            'coach': ['upload_video', 'create_highlight', 'view_roster', 'highlights', 'tools', 'library'],
-            'player': ['highlights', 'library'],
-            'admin': ['upload_video', 'create_highlight', 'view_roster', 'highlights', 'tools', 'library'],
-            'parent': ['highlights', 'library']
+        verification_results = {
+            f'has_{feature}': feature in present_features for feature in sorted(expected_features)
         }
-        
-        expected_features = role_features.get(expected_role.lower(), [])
-        
-        verification_results = {}
-        for feature in expected_features:
-            verification_results[f'has_{feature}'] = feature in available_features
-        
-        verification_results['role_match'] = all(verification_results.values())
+        verification_results['role_match'] = present_features == expected_features
         verification_results['available_features'] = available_features
-        verification_results['expected_features'] = expected_features
+        verification_results['expected_features'] = sorted(expected_features)
         
         return verification_results
     
@@ -371,7 +634,7 @@ class DashboardPage(BasePage):
             self.click_logout()
             
             # Wait for redirect or login page appearance
-            return self.wait_for_url_contains('/login', timeout=10)
+            return self.wait_for_navigation('/login', timeout=10)
         except Exception:
             return False
     
@@ -389,34 +652,28 @@ class DashboardPage(BasePage):
             'missing_elements': []
         }
         
-        # Check for error messages
-        error_selectors = [
-            (By.CSS_SELECTOR, ".error-message"),
-            (By.CSS_SELECTOR, ".alert-error"),
-            (By.CSS_SELECTOR, "[data-qa-id='error']"),
-            (By.XPATH, "//*[contains(text(), 'Error') or contains(text(), 'error')]")
-        ]
-        
-        for selector in error_selectors:
-            if self.is_element_present(selector, timeout=2):
-                errors['has_errors'] = True
-                try:
-                    error_text = self.get_element_text(selector)
-                    if error_text:
-                        errors['error_messages'].append(error_text)
-                except Exception:
-                    pass
+        # Check for error messages: one CSS union and one text scan, read in a single call
+        found, messages = self.driver.execute_script(
+            ERROR_SCAN_SCRIPT, ', '.join(self.ERROR_SELECTORS), self.ERROR_TEXT_PATTERN
+        )
+        if found:
+            errors['has_errors'] = True
+            errors['error_messages'].extend(messages)
         
         # Check for missing critical elements
         critical_elements = {
-            'user_menu': self.USER_MENU,
-            'dashboard_content': self.DASHBOARD_CONTENT,
-            'main_navigation': self.MAIN_NAVIGATION
+            'user_menu': 'USER_MENU',
+            'dashboard_content': 'DASHBOARD_CONTENT',
+            'main_navigation': 'MAIN_NAVIGATION'
         }
         
-        for element_name, locator in critical_elements.items():
-            if not self.is_element_present(locator, timeout=2):
+        for element_name, is_present in self._presence_by_name(critical_elements).items():
+            if not is_present:
                 errors['missing_elements'].append(element_name)
                 errors['has_errors'] = True
         
         return errors
+
+
+DashboardPage._intern_locators()
+DashboardPage._build_css_map()
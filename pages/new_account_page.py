@@ -4,11 +4,29 @@ Contains all account creation/registration page elements and interactions.
 """
 
 import time
+from functools import lru_cache
 from selenium.webdriver.common.by import By
 from typing import Dict, Any, List, Tuple, Optional
-from pages.base_page import BasePage
+from pages.base_page import BasePage, css_union
 from urllib.parse import urlparse
 
+# Used when the page object is created without configuration
+DEFAULT_BASE_URL = "https://www.hudl.com"
+
+
+@lru_cache(maxsize=None)
+def _registration_url_for(base_url: str) -> str:
+    """
+    Build the registration URL for a base URL, once per process.
+    
+    Args:
+        base_url: Site base URL from configuration
+        
+    Returns:
+        Absolute URL of the registration page
+    """
+    return base_url.rstrip('/') + NewAccountPage.REGISTRATION_URL
+
 
 class NewAccountPage(BasePage):
     """
@@ -33,6 +51,9 @@ class NewAccountPage(BasePage):
     LAST_NAME_FIELD_ALT = (By.ID, "last-name")
     LAST_NAME_FIELD_CSS = (By.CSS_SELECTOR, "input[name*='last' i]")
     
+    FULL_NAME_FIELD = (By.NAME, "ulp-full-name")
+    FULL_NAME_FIELD_ALT = (By.ID, "full-name")
+    FULL_NAME_FIELD_CSS = (By.CSS_SELECTOR, "input[name*='full' i]")
     
     # Email field locators
     EMAIL_FIELD = (By.NAME, "email")
@@ -41,6 +62,59 @@ class NewAccountPage(BasePage):
     EMAIL_FIELD_NAME_PATTERN = (By.CSS_SELECTOR, "input[name*='email' i]")
     EMAIL_FIELD_PLACEHOLDER = (By.CSS_SELECTOR, "input[placeholder*='email' i]")
     
+    # Password field locators
+    PASSWORD_FIELD = (By.NAME, "password")
+    PASSWORD_FIELD_ALT = (By.ID, "password")
+    PASSWORD_FIELD_TYPE = (By.CSS_SELECTOR, "input[type='password']")
+    PASSWORD_FIELD_NAME_PATTERN = (By.CSS_SELECTOR, "input[name*='password' i]")
+    
+    CONFIRM_PASSWORD_FIELD = (By.NAME, "confirm-password")
+    CONFIRM_PASSWORD_FIELD_ALT = (By.ID, "confirm-password")
+    CONFIRM_PASSWORD_FIELD_CSS = (By.CSS_SELECTOR, "input[name*='confirm' i]")
+    
+    # Submit button locators
+    CREATE_ACCOUNT_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
+    CREATE_ACCOUNT_BUTTON_ALT = (By.NAME, "action")
+    SIGNUP_BUTTON = (By.XPATH, "//button[contains(., 'Sign up') or contains(., 'Sign Up')]")
+    REGISTER_BUTTON = (By.XPATH, "//button[contains(., 'Register')]")
+    
+    # Each field's NAME/ID/CSS fallbacks as one selector list (one lookup instead of one per
+    # fallback); the individual locators above are kept for diagnostics
+    FIRST_NAME_FIELD_ANY = css_union(FIRST_NAME_FIELD, FIRST_NAME_FIELD_ALT, FIRST_NAME_FIELD_CSS)
+    LAST_NAME_FIELD_ANY = css_union(LAST_NAME_FIELD, LAST_NAME_FIELD_ALT, LAST_NAME_FIELD_CSS)
+    FULL_NAME_FIELD_ANY = css_union(FULL_NAME_FIELD, FULL_NAME_FIELD_ALT, FULL_NAME_FIELD_CSS)
+    EMAIL_FIELD_ANY = css_union(
+        EMAIL_FIELD, EMAIL_FIELD_ALT, EMAIL_FIELD_TYPE, EMAIL_FIELD_NAME_PATTERN, EMAIL_FIELD_PLACEHOLDER
+    )
+    PASSWORD_FIELD_ANY = css_union(
+        PASSWORD_FIELD, PASSWORD_FIELD_ALT, PASSWORD_FIELD_TYPE, PASSWORD_FIELD_NAME_PATTERN
+    )
+    CONFIRM_PASSWORD_FIELD_ANY = css_union(
+        CONFIRM_PASSWORD_FIELD, CONFIRM_PASSWORD_FIELD_ALT, CONFIRM_PASSWORD_FIELD_CSS
+    )
+    CREATE_ACCOUNT_BUTTON_ANY = css_union(CREATE_ACCOUNT_BUTTON, CREATE_ACCOUNT_BUTTON_ALT)
+    
+    # Fallback locator groups, built once and shared by every call
+    _FIRST_NAME_LOCATORS = (FIRST_NAME_FIELD, FIRST_NAME_FIELD_ALT, FIRST_NAME_FIELD_CSS)
+    _LAST_NAME_LOCATORS = (LAST_NAME_FIELD, LAST_NAME_FIELD_ALT, LAST_NAME_FIELD_CSS)
+    _EMAIL_LOCATORS = (
+        EMAIL_FIELD, EMAIL_FIELD_ALT, EMAIL_FIELD_TYPE, EMAIL_FIELD_NAME_PATTERN, EMAIL_FIELD_PLACEHOLDER
+    )
+    # Text-based XPath fallbacks can't join the CSS selector list
+    _CREATE_ACCOUNT_LOCATORS = (CREATE_ACCOUNT_BUTTON_ANY, SIGNUP_BUTTON, REGISTER_BUTTON)
+    
+    _REQUIRED_FIELD_LOCATORS = {
+        "first_name": _FIRST_NAME_LOCATORS,
+        "last_name": _LAST_NAME_LOCATORS,
+        "email": _EMAIL_LOCATORS
+    }
+    _FORM_ELEMENT_LOCATORS = {
+        "first_name_field": _FIRST_NAME_LOCATORS,
+        "last_name_field": _LAST_NAME_LOCATORS,
+        "email_field": (EMAIL_FIELD, EMAIL_FIELD_ALT, EMAIL_FIELD_TYPE),
+        "password_field": (PASSWORD_FIELD, PASSWORD_FIELD_ALT, PASSWORD_FIELD_TYPE),
+        "create_account_button": (CREATE_ACCOUNT_BUTTON, CREATE_ACCOUNT_BUTTON_ALT, SIGNUP_BUTTON)
+    }
     
     # Social registration buttons
     GOOGLE_SIGNUP_BUTTON = (By.CSS_SELECTOR, "button[data-provider='google']")
@@ -67,6 +141,7 @@ class NewAccountPage(BasePage):
         """
         super().__init__(driver, config)
         self._page_loaded: bool = False
+        self._registration_url = _registration_url_for(config.get_base_url() if config else DEFAULT_BASE_URL)
 
     # ====================================================================
     # NAVIGATION METHODS
@@ -78,19 +153,17 @@ class NewAccountPage(BasePage):
         print(f"Navigating to registration page: {registration_url}")
         self.navigate_to(registration_url)
         
-        # Check if we were redirected
-        final_url = self.get_current_url()
-        if final_url != registration_url:
-            print(f"Redirected from {registration_url} to {final_url}")
-        else:
-            print(f"Successfully navigated to: {final_url}")
+        # Reporting a redirect costs another URL read, so only do it when debugging
+        if self._verbose:
+            final_url = self.get_current_url()
+            if final_url != registration_url:
+                print(f"Redirected from {registration_url} to {final_url}")
+            else:
+                print(f"Successfully navigated to: {final_url}")
 
     def _get_registration_url(self) -> str:
-        """Get the full registration URL."""
-        if self.config:
-            base_url = self.config.get_base_url()
-            return f"{base_url.rstrip('/')}{self.REGISTRATION_URL}"
-        return f"https://www.hudl.com{self.REGISTRATION_URL}"
+        """Get the full registration URL (built once in __init__)."""
+        return self._registration_url
 
     # ====================================================================
     # PERSONAL INFORMATION METHODS
@@ -103,12 +176,7 @@ class NewAccountPage(BasePage):
         Args:
             first_name: First name to enter
         """
-        locators = [
-            self.FIRST_NAME_FIELD,
-            self.FIRST_NAME_FIELD_ALT,
-            self.FIRST_NAME_FIELD_CSS
-        ]
-        self.send_keys_with_fallback(locators, first_name, "first name field")
+        self._type_into([self.FIRST_NAME_FIELD_ANY], first_name, "first name field")
 
     def enter_last_name(self, last_name: str) -> None:
         """
@@ -117,12 +185,7 @@ class NewAccountPage(BasePage):
         Args:
             last_name: Last name to enter
         """
-        locators = [
-            self.LAST_NAME_FIELD,
-            self.LAST_NAME_FIELD_ALT,
-            self.LAST_NAME_FIELD_CSS
-        ]
-        self.send_keys_with_fallback(locators, last_name, "last name field")
+        self._type_into([self.LAST_NAME_FIELD_ANY], last_name, "last name field")
 
     def enter_full_name(self, full_name: str) -> None:
         """
@@ -131,12 +194,7 @@ class NewAccountPage(BasePage):
         Args:
             full_name: Full name to enter
         """
-        locators = [
-            self.FULL_NAME_FIELD,
-            self.FULL_NAME_FIELD_ALT,
-            self.FULL_NAME_FIELD_CSS
-        ]
-        self.send_keys_with_fallback(locators, full_name, "full name field")
+        self._type_into([self.FULL_NAME_FIELD_ANY], full_name, "full name field")
 
     def enter_email(self, email: str) -> None:
         """
@@ -145,14 +203,7 @@ class NewAccountPage(BasePage):
         Args:
             email: Email address to enter
         """
-        locators = [
-            self.EMAIL_FIELD,
-            self.EMAIL_FIELD_ALT,
-            self.EMAIL_FIELD_TYPE,
-            self.EMAIL_FIELD_NAME_PATTERN,
-            self.EMAIL_FIELD_PLACEHOLDER
-        ]
-        self.send_keys_with_fallback(locators, email, "email field")
+        self._type_into([self.EMAIL_FIELD_ANY], email, "email field")
 
     def enter_password(self, password: str) -> None:
         """
@@ -161,13 +212,7 @@ class NewAccountPage(BasePage):
         Args:
             password: Password to enter
         """
-        locators = [
-            self.PASSWORD_FIELD,
-            self.PASSWORD_FIELD_ALT,
-            self.PASSWORD_FIELD_TYPE,
-            self.PASSWORD_FIELD_NAME_PATTERN
-        ]
-        self.send_keys_with_fallback(locators, password, "password field")
+        self._type_into([self.PASSWORD_FIELD_ANY], password, "password field")
 
     def enter_confirm_password(self, password: str) -> None:
         """
@@ -176,12 +221,7 @@ class NewAccountPage(BasePage):
         Args:
             password: Password to confirm
         """
-        locators = [
-            self.CONFIRM_PASSWORD_FIELD,
-            self.CONFIRM_PASSWORD_FIELD_ALT,
-            self.CONFIRM_PASSWORD_FIELD_CSS
-        ]
-        self.send_keys_with_fallback(locators, password, "confirm password field")
+        self._type_into([self.CONFIRM_PASSWORD_FIELD_ANY], password, "confirm password field")
 
     # ====================================================================
     # BUTTON INTERACTION METHODS
@@ -189,55 +229,29 @@ class NewAccountPage(BasePage):
     
     def click_create_account_button(self) -> None:
         """Click the create account/submit button."""
-        locators = [
-            self.CREATE_ACCOUNT_BUTTON,
-            self.CREATE_ACCOUNT_BUTTON_ALT,
-            self.SIGNUP_BUTTON,
-            self.REGISTER_BUTTON
-        ]
-        self.click_with_fallback(locators, "create account button")
+        self.run_on_fallback(self._CREATE_ACCOUNT_LOCATORS, lambda element: element.click(), "create account button")
+        # Submitting replaces the form, so cached fields are no longer valid
+        self.invalidate_element_cache()
 
     def click_login_link(self) -> None:
         """Click the login link to go to login page."""
         self.click_element(self.LOGIN_LINK)
+        self.invalidate_element_cache()
         print("✓ Clicked login link")
 
-    def verify_required_fields_present(self) -> Dict[str, bool]:
+    def verify_required_fields_present(self, timeout: float = 2) -> Dict[str, bool]:
         """
         Verify that the required form fields (first name, last name, email) are present on the page.
         
+        Args:
+            timeout: Seconds to wait for the fields, shared by all of them; 0 checks once without waiting
+        
         Returns:
             Dictionary with field names as keys and boolean values indicating presence
         """
-        field_results = {}
-        
-        # Check first name field
-        first_name_locators = [
-            self.FIRST_NAME_FIELD,
-            self.FIRST_NAME_FIELD_ALT,
-            self.FIRST_NAME_FIELD_CSS
-        ]
-        field_results["first_name"] = self.is_element_visible_with_fallback(first_name_locators, "first name field")
-        
-        # Check last name field
-        last_name_locators = [
-            self.LAST_NAME_FIELD,
-            self.LAST_NAME_FIELD_ALT,
-            self.LAST_NAME_FIELD_CSS
-        ]
-        field_results["last_name"] = self.is_element_visible_with_fallback(last_name_locators, "last name field")
-        
-        # Check email field
-        email_locators = [
-            self.EMAIL_FIELD,
-            self.EMAIL_FIELD_ALT,
-            self.EMAIL_FIELD_TYPE,
-            self.EMAIL_FIELD_NAME_PATTERN,
-            self.EMAIL_FIELD_PLACEHOLDER
-        ]
-        field_results["email"] = self.is_element_visible_with_fallback(email_locators, "email field")
-        
-        return field_results
+        # All three fields (and their fallbacks) are checked together in one script call per poll,
+        # so a page missing every field costs one shared wait rather than one per field
+        return self.batch_visibility(self._REQUIRED_FIELD_LOCATORS, timeout=timeout)
 
     def are_required_fields_present(self) -> bool:
         """
@@ -257,32 +271,37 @@ class NewAccountPage(BasePage):
         
         return all_present
 
-    def verify_form_elements_visible(self) -> Dict[str, bool]:
+    def verify_form_elements_visible(self, timeout: float = 2) -> Dict[str, bool]:
         """
         Comprehensive verification of form elements visibility.
         
+        Args:
+            timeout: Seconds to wait for the elements, shared by all of them; 0 checks once without waiting
+        
         Returns:
             Dictionary with element names as keys and visibility status as values
         """
-        elements_to_check = {
-            "first_name_field": [self.FIRST_NAME_FIELD, self.FIRST_NAME_FIELD_ALT, self.FIRST_NAME_FIELD_CSS],
-            "last_name_field": [self.LAST_NAME_FIELD, self.LAST_NAME_FIELD_ALT, self.LAST_NAME_FIELD_CSS],
-            "email_field": [self.EMAIL_FIELD, self.EMAIL_FIELD_ALT, self.EMAIL_FIELD_TYPE],
-            "password_field": [self.PASSWORD_FIELD, self.PASSWORD_FIELD_ALT, self.PASSWORD_FIELD_TYPE],
-            "create_account_button": [self.CREATE_ACCOUNT_BUTTON, self.CREATE_ACCOUNT_BUTTON_ALT, self.SIGNUP_BUTTON]
-        }
-        
-        visibility_results = {}
-        
-        for element_name, locators in elements_to_check.items():
-            visibility_results[element_name] = self.is_element_visible_with_fallback(locators, element_name)
-        
-        return visibility_results
+        return self.batch_visibility(self._FORM_ELEMENT_LOCATORS, timeout=timeout)
 
     # ====================================================================
     # PRIVATE HELPER METHODS
     # ====================================================================
     
+    def _type_into(self, locators: List[Tuple[str, str]], text: str, field_name: str) -> None:
+        """
+        Clear a field and type into it, reusing the element found by an earlier call.
+        
+        Args:
+            locators: List of locator tuples to try
+            text: Text to type
+            field_name: Name of the field for error reporting
+        """
+        def type_text(element) -> None:
+            element.clear()
+            element.send_keys(text)
+        
+        self.run_on_fallback(locators, type_text, field_name)
+
     def _find_field_with_fallback(self, locators: List[Tuple[str, str]], field_name: str):
         """
         Find field using multiple locator strategies with fallback.
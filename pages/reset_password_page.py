@@ -3,13 +3,29 @@ Reset Password Page Object for Hudl.com password reset functionality.
 Implements the Page Object Model pattern for password reset interactions.
 """
 
-from typing import Optional
+import re
+from functools import lru_cache
+from typing import Callable, Optional, Sequence, Tuple
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from pages.base_page import BasePage
 
 
+@lru_cache(maxsize=None)
+def _reset_url_for(base_url: str) -> str:
+    """
+    Build the password reset URL for a base URL, once per process.
+    
+    Args:
+        base_url: Site base URL from configuration
+        
+    Returns:
+        Absolute URL of the password reset page
+    """
+    return base_url.rstrip('/') + ResetPasswordPage.RESET_PASSWORD_PATH
+
+
 class ResetPasswordPage(BasePage):
     """Page Object for Hudl password reset page."""
     
@@ -20,6 +36,10 @@ class ResetPasswordPage(BasePage):
         '/reset-password',
         '/forgot-password'
     ]
+    _URL_RE = re.compile('|'.join(map(re.escape, PASSWORD_RESET_URL_PATTERNS)))
+    
+    # Path of the page navigate_to_reset_password_page() opens
+    RESET_PASSWORD_PATH = '/u/login/password-reset-start'
     
     # Email input locators (most common to least common)
     EMAIL_FIELD = (By.NAME, "email")
@@ -40,6 +60,21 @@ class ResetPasswordPage(BasePage):
     # Back to login link
     BACK_TO_LOGIN_LINK = (By.CSS_SELECTOR, "a[href*='login']")
     
+    # Fallback locator groups, built once and shared by every call
+    _EMAIL_LOCATORS = (
+        EMAIL_FIELD, EMAIL_FIELD_ALT, EMAIL_FIELD_TYPE, EMAIL_FIELD_NAME_PATTERN, EMAIL_FIELD_PLACEHOLDER
+    )
+    _SUBMIT_LOCATORS = (SUBMIT_BUTTON, SUBMIT_BUTTON_ALT, SUBMIT_BUTTON_TEXT)
+    
+    # Specific controls plus broader form probes for has_password_reset_functionality()
+    _RESET_FORM_LOCATORS = {
+        'email_field': _EMAIL_LOCATORS,
+        'submit_button': _SUBMIT_LOCATORS,
+        'email_inputs': ((By.CSS_SELECTOR, "input[type='email'], input[name*='email'], input[placeholder*='email']"),),
+        'forms': ((By.TAG_NAME, "form"),),
+        'submit_elements': ((By.CSS_SELECTOR, "button, input[type='submit']"),)
+    }
+    
     def __init__(self, driver, config=None):
         """
         Initialize the Reset Password Page.
@@ -49,6 +84,7 @@ class ResetPasswordPage(BasePage):
             config: Configuration manager instance
         """
         super().__init__(driver, config)
+        self._reset_url: Optional[str] = _reset_url_for(config.get_base_url()) if config else None
     
     def is_on_password_reset_page(self) -> bool:
         """
@@ -58,8 +94,7 @@ class ResetPasswordPage(BasePage):
             bool: True if on password reset page, False otherwise
         """
         try:
-            current_url = self.get_current_url()
-            return any(pattern in current_url for pattern in self.PASSWORD_RESET_URL_PATTERNS)
+            return self._URL_RE.search(self.get_current_url()) is not None
         except Exception:
             return False
     
@@ -70,15 +105,7 @@ class ResetPasswordPage(BasePage):
         Returns:
             WebElement: Email input field if found, None otherwise
         """
-        locators = [
-            self.EMAIL_FIELD,
-            self.EMAIL_FIELD_ALT,
-            self.EMAIL_FIELD_TYPE,
-            self.EMAIL_FIELD_NAME_PATTERN,
-            self.EMAIL_FIELD_PLACEHOLDER
-        ]
-        
-        return self.find_element_with_fallback(locators)
+        return self._find_cached_with_fallback(self._EMAIL_LOCATORS)
     
     def enter_email(self, email: str) -> None:
         """
@@ -87,15 +114,11 @@ class ResetPasswordPage(BasePage):
         Args:
             email: Email address to enter
         """
-        email_field = self.get_email_field()
-        if email_field:
-            self.send_keys_with_fallback([
-                self.EMAIL_FIELD,
-                self.EMAIL_FIELD_ALT,
-                self.EMAIL_FIELD_TYPE
-            ], email)
-        else:
-            raise NoSuchElementException("Email field not found on password reset page")
+        def type_email(email_field: WebElement) -> None:
+            email_field.clear()
+            email_field.send_keys(email)
+        
+        self._act_on(self.get_email_field, type_email, "Email field not found on password reset page")
     
     def get_submit_button(self) -> Optional[WebElement]:
         """
@@ -104,25 +127,13 @@ class ResetPasswordPage(BasePage):
         Returns:
             WebElement: Submit button if found, None otherwise
         """
-        locators = [
-            self.SUBMIT_BUTTON,
-            self.SUBMIT_BUTTON_ALT,
-            self.SUBMIT_BUTTON_TEXT
-        ]
-        
-        return self.find_element_with_fallback(locators)
+        return self._find_cached_with_fallback(self._SUBMIT_LOCATORS)
     
     def click_submit(self) -> None:
         """Click the submit button to send password reset request."""
-        submit_button = self.get_submit_button()
-        if submit_button:
-            self.click_with_fallback([
-                self.SUBMIT_BUTTON,
-                self.SUBMIT_BUTTON_ALT,
-                self.SUBMIT_BUTTON_TEXT
-            ])
-        else:
-            raise NoSuchElementException("Submit button not found on password reset page")
+        self._act_on(self.get_submit_button, lambda button: button.click(),
+                     "Submit button not found on password reset page")
+        self.invalidate_element_cache()
     
     def has_password_reset_functionality(self) -> bool:
         """
@@ -132,34 +143,34 @@ class ResetPasswordPage(BasePage):
             bool: True if email field and submit button are present
         """
         try:
-            email_field = self.get_email_field()
-            submit_button = self.get_submit_button()
+            # The specific controls and the broader form probes are all evaluated in the
+            # page by one script call per poll, so no extra lookups follow the wait
+            found = self.batch_visibility(
+                self._RESET_FORM_LOCATORS, timeout=3,
+                until=lambda results: results['email_field'] and results['submit_button']
+            )
             
-            # Debug information
-            print(f"Debug - Email field found: {email_field is not None}")
-            print(f"Debug - Submit button found: {submit_button is not None}")
-            print(f"Debug - Current URL: {self.get_current_url()}")
+            # Debug information, written in one print so parallel output doesn't interleave
+            debug = [
+                f"Debug - Email field found: {found['email_field']}",
+                f"Debug - Submit button found: {found['submit_button']}",
+                f"Debug - Current URL: {self.get_current_url()}"
+            ]
             
             # More flexible check - if we can't find specific elements, 
             # check for any form or input elements that might indicate reset functionality
-            if email_field is None and submit_button is None:
-                # Try to find any form elements that might be password reset related
-                try:
-                    # Look for any email input or form
-                    email_inputs = self.find_elements((By.CSS_SELECTOR, "input[type='email'], input[name*='email'], input[placeholder*='email']"), timeout=3)
-                    form_elements = self.find_elements((By.TAG_NAME, "form"), timeout=3)
-                    submit_elements = self.find_elements((By.CSS_SELECTOR, "button, input[type='submit']"), timeout=3)
-                    
-                    print(f"Debug - Found {len(email_inputs)} email inputs")
-                    print(f"Debug - Found {len(form_elements)} forms")
-                    print(f"Debug - Found {len(submit_elements)} submit elements")
-                    
-                    return len(email_inputs) > 0 or (len(form_elements) > 0 and len(submit_elements) > 0)
-                except Exception as e:
-                    print(f"Debug - Error in fallback check: {e}")
-                    return False
+            if not found['email_field'] and not found['submit_button']:
+                debug += [
+                    f"Debug - Email inputs found: {found['email_inputs']}",
+                    f"Debug - Forms found: {found['forms']}",
+                    f"Debug - Submit elements found: {found['submit_elements']}"
+                ]
+                has_functionality = found['email_inputs'] or (found['forms'] and found['submit_elements'])
+            else:
+                has_functionality = found['email_field'] and found['submit_button']
             
-            return email_field is not None and submit_button is not None
+            print("\n".join(debug))
+            return has_functionality
         except Exception as e:
             print(f"Debug - Exception in has_password_reset_functionality: {e}")
             return False
@@ -190,11 +201,54 @@ class ResetPasswordPage(BasePage):
         except (TimeoutException, NoSuchElementException):
             return None
     
+    def _act_on(self, getter: Callable[[], Optional[WebElement]], action: Callable[[WebElement], None],
+                missing_message: str) -> None:
+        """
+        Run an action on the element a getter resolves, re-resolving once if it went stale.
+        
+        Args:
+            getter: Method that finds the element (or returns None)
+            action: Callable that receives the element
+            missing_message: Message for the exception raised when the element isn't found
+            
+        Raises:
+            NoSuchElementException: If the element isn't found
+        """
+        for attempt in range(2):
+            element = getter()
+            if element is None:
+                raise NoSuchElementException(missing_message)
+            try:
+                action(element)
+                return
+            except StaleElementReferenceException:
+                self.invalidate_element_cache()
+                if attempt:
+                    raise
+    
+    def _find_cached_with_fallback(self, locators: Sequence[Tuple[str, str]]) -> Optional[WebElement]:
+        """
+        Find an element with fallback locators, reusing a still-attached element from an earlier call.
+        
+        Args:
+            locators: List of locator tuples to try, in priority order
+            
+        Returns:
+            WebElement if found, None otherwise
+        """
+        try:
+            return self.run_on_fallback(locators, self._check_attached)
+        except NoSuchElementException:
+            return None
+    
+    @staticmethod
+    def _check_attached(element: WebElement) -> WebElement:
+        """Cheap call that raises StaleElementReferenceException for a detached element."""
+        element.is_enabled()
+        return element
+    
     def navigate_to_reset_password_page(self) -> None:
         """Navigate directly to the password reset page."""
-        if self.config:
-            base_url = self.config.get_base_url()
-            reset_url = f"{base_url.rstrip('/')}/u/login/password-reset-start"
-            self.navigate_to_url(reset_url)
-        else:
+        if self._reset_url is None:
             raise ValueError("Configuration not available for navigation")
+        self.navigate_to(self._reset_url)
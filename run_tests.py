@@ -6,11 +6,42 @@ Provides convenient commands for running different types of tests.
 
 import os
 import sys
+import json
 import argparse
+import importlib.util
+import shutil
 import subprocess
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 
+def stream_command(command, env=None):
+    """
+    Run a command, echoing its output line by line as it is produced.
+    
+    Args:
+        command: Shell command string, or argument list
+        env: Environment for the child process (defaults to the current one)
+        
+    Returns:
+        The command's return code
+    """
+    process = subprocess.Popen(
+        command,
+        shell=isinstance(command, str),
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    )
+    with process.stdout:
+        for line in process.stdout:
+            sys.stdout.write(line)
+    return process.wait()
+
+
 def run_command(command, description):
     """
     Run a command and handle errors.
@@ -23,16 +54,10 @@ def run_command(command, description):
     print(f"Running: {command}")
     print("-" * 50)
     
-    result = subprocess.run(command, shell=True, capture_output=True, text=True)
-    
-    if result.stdout:
-        print(result.stdout)
-    
-    if result.stderr:
-        print(f"Error: {result.stderr}")
+    returncode = stream_command(command)
     
-    if result.returncode != 0:
-        print(f"Command failed with return code: {result.returncode}")
+    if returncode != 0:
+        print(f"Command failed with return code: {returncode}")
         sys.exit(1)
     
     print(f"✓ {description} completed successfully")
@@ -45,7 +70,7 @@ def setup_environment():
     # Create .env file if it doesn't exist
     if not os.path.exists('.env'):
         print("Creating .env file from template...")
-        subprocess.run(['cp', '.env.example', '.env'])
+        shutil.copyfile('.env.example', '.env')
         print("Please update .env file with your test credentials")
     
     # Install dependencies
@@ -86,6 +111,70 @@ def run_security_tests():
     run_command("behave --tags=@security", "Running security tests")
 
 
+def start_metrics_run():
+    """
+    Give this run an id that its workers stamp into their metrics files.
+    
+    Worker and tag-group report directories outlive the run, so merge_worker_metrics()
+    uses the id to skip metrics left behind by earlier runs.
+    
+    Returns:
+        The run id (also exported as HUDL_RUN_ID for child processes)
+    """
+    run_id = uuid.uuid4().hex
+    os.environ['HUDL_RUN_ID'] = run_id
+    return run_id
+
+
+# Tag groups run_all_tag_groups_parallel() runs side by side
+TAG_GROUPS = ('smoke', 'positive', 'negative', 'ui', 'security')
+
+
+def run_tag_group(tag, reports_dir='reports'):
+    """
+    Run one tag group as a child Behave process, writing its output to a log file.
+    
+    Args:
+        tag: Tag to run (without the leading '@')
+        reports_dir: Root reports directory; the group writes to <reports_dir>/<tag>/
+        
+    Returns:
+        The Behave return code
+    """
+    group_dir = os.path.join(reports_dir, tag)
+    os.makedirs(group_dir, exist_ok=True)
+    
+    # The worker id shards this group's reports and metrics into reports/<tag>/
+    env = os.environ.copy()
+    env['BEHAVE_WORKER_ID'] = tag
+    
+    with open(os.path.join(group_dir, 'behave.log'), 'w') as log:
+        return subprocess.run(
+            ['behave', f'--tags=@{tag}'], env=env, stdout=log, stderr=subprocess.STDOUT
+        ).returncode
+
+
+def run_all_tag_groups_parallel():
+    """Run every tag group concurrently and exit with the worst return code."""
+    print(f"\nRunning tag groups in parallel: {', '.join(TAG_GROUPS)}")
+    print("-" * 50)
+    
+    run_id = start_metrics_run()
+    
+    # Threads only wait on the child processes, which do the actual work
+    codes = {}
+    with ThreadPoolExecutor(max_workers=len(TAG_GROUPS)) as executor:
+        futures = {executor.submit(run_tag_group, tag): tag for tag in TAG_GROUPS}
+        for future in as_completed(futures):
+            tag = futures[future]
+            codes[tag] = future.result()
+            status = "✓" if codes[tag] == 0 else f"✗ (return code {codes[tag]})"
+            print(f"{status} @{tag} finished, output in reports/{tag}/behave.log")
+    
+    merge_worker_metrics(run_id=run_id)
+    sys.exit(max(codes.values()))
+
+
 def run_with_html_report():
     """Run tests with HTML report."""
     run_command(
@@ -94,10 +183,16 @@ def run_with_html_report():
     )
 
 
+def clean_allure_results():
+    """Remove results from a previous Allure run."""
+    print("\nCleaning previous Allure results")
+    shutil.rmtree('reports/allure-results', ignore_errors=True)
+
+
 def run_with_allure_report():
     """Run tests with Allure report."""
     # Clean previous results
-    run_command("rm -rf reports/allure-results", "Cleaning previous Allure results")
+    clean_allure_results()
     
     # Run tests with Allure formatter
     run_command(
@@ -118,7 +213,7 @@ def run_with_allure_report():
 def run_smoke_tests_with_allure():
     """Run smoke tests with Allure report."""
     # Clean previous results
-    run_command("rm -rf reports/allure-results", "Cleaning previous Allure results")
+    clean_allure_results()
     
     # Run smoke tests with Allure formatter
     run_command(
@@ -136,12 +231,67 @@ def run_smoke_tests_with_allure():
     print("To serve the report, run: allure serve reports/allure-results")
 
 
-def run_parallel_tests():
-    """Run tests in parallel."""
+def run_parallel_tests(processes=None):
+    """
+    Run scenarios in parallel, one browser per worker process.
+    
+    Args:
+        processes: Number of worker processes (defaults to CPU count)
+    """
+    processes = processes or os.cpu_count() or 4
+    
+    # Workers shard their reports into reports/<worker-id>/ when this is set
+    os.environ['BEHAVE_PARALLEL'] = 'true'
+    run_id = start_metrics_run()
     run_command(
-        "behave --processes 4 --parallel-element scenario",
-        "Running tests in parallel"
+        f"behavex --parallel-processes {processes} --parallel-scheme scenario",
+        f"Running tests in parallel ({processes} processes)"
     )
+    merge_worker_metrics(run_id=run_id)
+
+
+def merge_worker_metrics(reports_dir='reports', run_id=None):
+    """
+    Merge per-worker test metrics into a single summary report.
+    
+    Args:
+        reports_dir: Root reports directory containing one sub-directory per worker
+        run_id: Only merge metrics stamped with this run id (see start_metrics_run)
+    """
+    totals = {'total_tests': 0, 'passed_tests': 0, 'failed_tests': 0, 'skipped_tests': 0}
+    workers = 0
+    
+    for metrics_file in sorted(Path(reports_dir).glob('*/test_metrics.json')):
+        try:
+            with open(metrics_file) as f:
+                worker_metrics = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Skipping unreadable metrics file {metrics_file}: {e}")
+            continue
+        if run_id is not None and worker_metrics.get('run_id') != run_id:
+            # Left behind by an earlier run
+            continue
+        for key in totals:
+            totals[key] += worker_metrics.get(key, 0)
+        workers += 1
+    
+    if not workers:
+        print("No worker metrics found to merge")
+        return
+    
+    with open(Path(reports_dir) / 'test_summary.txt', 'w') as f:
+        f.write("Test Execution Summary (parallel)\n")
+        f.write("=================================\n")
+        f.write(f"Workers: {workers}\n")
+        f.write(f"Total Tests: {totals['total_tests']}\n")
+        f.write(f"Passed: {totals['passed_tests']}\n")
+        f.write(f"Failed: {totals['failed_tests']}\n")
+        f.write(f"Skipped: {totals['skipped_tests']}\n")
+        if totals['total_tests'] > 0:
+            pass_rate = (totals['passed_tests'] / totals['total_tests']) * 100
+            f.write(f"Pass Rate: {pass_rate:.2f}%\n")
+    
+    print(f"✓ Merged metrics from {workers} workers into {reports_dir}/test_summary.txt")
 
 
 def run_headless_tests():
@@ -152,23 +302,12 @@ def run_headless_tests():
     print("\nRunning tests in headless mode")
     print("-" * 50)
     
-    result = subprocess.run(
-        ["behave"],
-        env=env,
-        capture_output=True,
-        text=True
-    )
+    returncode = stream_command(["behave"], env=env)
     
-    if result.stdout:
-        print(result.stdout)
-    
-    if result.stderr:
-        print(f"Error: {result.stderr}")
-    
-    if result.returncode == 0:
+    if returncode == 0:
         print("✓ Headless tests completed successfully")
     else:
-        print(f"Tests failed with return code: {result.returncode}")
+        print(f"Tests failed with return code: {returncode}")
         sys.exit(1)
 
 
@@ -192,6 +331,37 @@ def run_specific_scenario(scenario_name):
     )
 
 
+# Top-level packages validate_environment() checks for
+REQUIRED_PACKAGES = ('selenium', 'behave', 'yaml')
+
+
+def find_existing_files(file_paths):
+    """
+    Find which of the given files exist, listing each parent directory once.
+    
+    Args:
+        file_paths: Relative file paths (using '/' separators)
+        
+    Returns:
+        Set of the paths that exist as files
+    """
+    by_directory = {}
+    for file_path in file_paths:
+        directory, _, name = file_path.rpartition('/')
+        by_directory.setdefault(directory or '.', set()).add(name)
+    
+    found = set()
+    for directory, names in by_directory.items():
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name in names and entry.is_file():
+                        found.add(entry.name if directory == '.' else f"{directory}/{entry.name}")
+        except OSError:
+            continue
+    return found
+
+
 def validate_environment():
     """Validate that the environment is properly set up."""
     print("Validating test environment...")
@@ -212,41 +382,73 @@ def validate_environment():
         'config/test_data.yaml'
     ]
     
+    found = find_existing_files(required_files)
     for file_path in required_files:
-        if not os.path.exists(file_path):
+        if file_path in found:
+            print(f"✓ Found: {file_path}")
+    
+    missing = [file_path for file_path in required_files if file_path not in found]
+    if missing:
+        for file_path in missing:
             print(f"Error: Required file not found: {file_path}")
-            sys.exit(1)
-        print(f"✓ Found: {file_path}")
-    
-    # Check if dependencies are installed
-    try:
-        import selenium
-        import behave
-        import yaml
-        print("✓ Required packages are installed")
-    except ImportError as e:
-        print(f"Error: Missing required package: {e}")
+        sys.exit(1)
+    
+    # Check if dependencies are installed (locate them without importing)
+    missing_packages = [pkg for pkg in REQUIRED_PACKAGES if importlib.util.find_spec(pkg) is None]
+    if missing_packages:
+        print(f"Error: Missing required package(s): {', '.join(missing_packages)}")
         print("Run: pip install -r requirements.txt")
         sys.exit(1)
+    print("✓ Required packages are installed")
     
     print("✓ Environment validation completed successfully")
 
 
-def main():
-    """Main function to handle command line arguments."""
+# Subcommand name -> (handler taking the parsed args, help text)
+COMMANDS = {
+    'setup': (lambda args: setup_environment(), 'Set up the test environment'),
+    'validate': (lambda args: validate_environment(), 'Validate the test environment'),
+    'all': (lambda args: run_all_tests(), 'Run all tests'),
+    'smoke': (lambda args: run_smoke_tests(), 'Run smoke tests'),
+    'positive': (lambda args: run_positive_tests(), 'Run positive tests'),
+    'negative': (lambda args: run_negative_tests(), 'Run negative tests'),
+    'ui': (lambda args: run_ui_tests(), 'Run UI/UX tests'),
+    'security': (lambda args: run_security_tests(), 'Run security tests'),
+    'all-parallel': (lambda args: run_all_tag_groups_parallel(), 'Run every tag group concurrently'),
+    'html': (lambda args: run_with_html_report(), 'Run tests with HTML report'),
+    'allure': (lambda args: run_with_allure_report(), 'Run tests with Allure report'),
+    'smoke-allure': (lambda args: run_smoke_tests_with_allure(), 'Run smoke tests with Allure report'),
+    'parallel': (lambda args: run_parallel_tests(args.processes), 'Run scenarios in parallel'),
+    'headless': (lambda args: run_headless_tests(), 'Run tests in headless mode'),
+    'feature': (lambda args: run_specific_feature(args.file), 'Run a specific feature file'),
+    'scenario': (lambda args: run_specific_scenario(args.name), 'Run a specific scenario by name'),
+}
+
+
+def build_parser():
+    """Build the command line parser with one subcommand per entry in COMMANDS."""
+    # Shared options, accepted after any subcommand (e.g. "smoke --browser firefox")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--browser', help='Browser to use (chrome, firefox, edge, safari)')
+    common.add_argument('--env', help='Environment to test (local, staging, production)')
+    
     parser = argparse.ArgumentParser(description='Hudl Login Test Runner')
-    parser.add_argument('command', choices=[
-        'setup', 'validate', 'all', 'smoke', 'positive', 'negative',
-        'ui', 'security',
-        'html', 'allure', 'smoke-allure', 'parallel', 'headless', 'feature', 'scenario'
-    ], help='Command to run')
+    subparsers = parser.add_subparsers(dest='command', metavar='command', required=True)
     
-    parser.add_argument('--file', help='Feature file to run (for feature command)')
-    parser.add_argument('--name', help='Scenario name to run (for scenario command)')
-    parser.add_argument('--browser', help='Browser to use (chrome, firefox, edge, safari)')
-    parser.add_argument('--env', help='Environment to test (local, staging, production)')
+    subcommands = {
+        name: subparsers.add_parser(name, parents=[common], help=help_text)
+        for name, (_, help_text) in COMMANDS.items()
+    }
+    subcommands['feature'].add_argument('--file', required=True, help='Feature file to run')
+    subcommands['scenario'].add_argument('--name', required=True, help='Scenario name to run')
+    subcommands['parallel'].add_argument('--processes', type=int, help='Number of worker processes')
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main function to handle command line arguments."""
+    args = build_parser().parse_args()
     
     # Set environment variables from arguments
     if args.browser:
@@ -255,44 +457,8 @@ def main():
     if args.env:
         os.environ['TEST_ENV'] = args.env
     
-    # Execute the requested command
-    if args.command == 'setup':
-        setup_environment()
-    elif args.command == 'validate':
-        validate_environment()
-    elif args.command == 'all':
-        run_all_tests()
-    elif args.command == 'smoke':
-        run_smoke_tests()
-    elif args.command == 'positive':
-        run_positive_tests()
-    elif args.command == 'negative':
-        run_negative_tests()
-    elif args.command == 'ui':
-        run_ui_tests()
-    elif args.command == 'security':
-        run_security_tests()
-    elif args.command == 'html':
-        run_with_html_report()
-    elif args.command == 'allure':
-        run_with_allure_report()
-    elif args.command == 'smoke-allure':
-        run_smoke_tests_with_allure()
-    elif args.command == 'parallel':
-        run_parallel_tests()
-    elif args.command == 'headless':
-        run_headless_tests()
-    elif args.command == 'feature':
-        if not args.file:
-            print("Error: --file argument is required for feature command")
-            sys.exit(1)
-        run_specific_feature(args.file)
-    elif args.command == 'scenario':
-        if not args.name:
-            print("Error: --name argument is required for scenario command")
-            sys.exit(1)
-        run_specific_scenario(args.name)
-
+    handler, _ = COMMANDS[args.command]
+    handler(args)
 
 if __name__ == '__main__':
     main()
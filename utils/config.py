@@ -3,12 +3,115 @@ Configuration management for Hudl login testing.
 Handles environment variables, test settings, and browser configuration.
 """
 
+import copy
+import functools
 import os
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional, Tuple
 from dotenv import load_dotenv
 
+# libyaml's C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed YAML documents keyed by (resolved path, mtime), shared by every Config in the process
+_YAML_CACHE: Dict[Tuple[str, int], Any] = {}
+
+# .env only needs reading once per process
+_dotenv_loaded = False
+
+# Default config files, resolved once at import: the first existing main config and the test data file
+_CONFIG_DIR = Path(__file__).resolve().parent.parent / 'config'
+_DEFAULT_CONFIG_PATH = next(
+    (path for path in (_CONFIG_DIR / name for name in ('test_config.yaml', 'config.yaml', 'settings.yaml'))
+     if path.exists()),
+    None
+)
+_TEST_DATA_PATH = _CONFIG_DIR / 'test_data.yaml'
+_TEST_DATA_EXISTS = _TEST_DATA_PATH.exists()
+
+
+def _load_yaml(path: Path) -> Any:
+    """
+    Parse a YAML file, reusing the result while the file is unchanged.
+    
+    Args:
+        path: Path of the YAML file
+        
+    Returns:
+        A private copy of the parsed document (callers may mutate it)
+    """
+    key = (str(path.resolve()), path.stat().st_mtime_ns)
+    if key not in _YAML_CACHE:
+        # Binary handle: the parser detects the encoding and decodes the bytes itself
+        with open(path, 'rb') as f:
+            _YAML_CACHE[key] = yaml.load(f, Loader=_YAML_LOADER)
+    return copy.deepcopy(_YAML_CACHE[key])
+
+
+def _flatten(data: Dict[str, Any], prefix: str, out: Dict[str, Any]) -> None:
+    """
+    Record every value in a nested mapping under its dotted path.
+    
+    Sections are recorded as well as leaves, so get('test_data') still returns the whole section.
+    
+    Args:
+        data: Mapping to walk
+        prefix: Dotted path of data itself ('' at the top level)
+        out: Dictionary to fill with dotted path -> value
+    """
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        out[path] = value
+        if isinstance(value, dict):
+            _flatten(value, f"{path}.", out)
+
+
+def _as_bool(value: Any) -> bool:
+    """Interpret a YAML boolean or a 'true'/'false' string."""
+    return str(value).lower() == 'true'
+
+
+# Typed settings and their converters; config file values are converted once at load,
+# environment overrides (always strings) when they are read
+_TYPED: Dict[str, Callable[[Any], Any]] = {
+    'timeouts.implicit_wait': int,
+    'timeouts.explicit_wait': int,
+    'timeouts.page_load': int,
+    'timeouts.error_detection': int,
+    'timeouts.social_login': int,
+    'browser.headless': _as_bool,
+    'headless': _as_bool,
+    'browser.window_size.width': int,
+    'browser.window_size.height': int,
+    'window.width': int,
+    'window.height': int,
+    'reporting.screenshot_on_failure': _as_bool,
+    'performance.element_cache': _as_bool
+}
+
+
+def _memoized(accessor: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    Cache a no-argument Config accessor's result on the instance.
+    
+    Args:
+        accessor: Accessor method to wrap
+        
+    Returns:
+        Wrapped method that resolves the value on first call only
+    """
+    name = accessor.__name__
+    
+    @functools.wraps(accessor)
+    def wrapper(self):
+        try:
+            return self._resolved[name]
+        except KeyError:
+            value = self._resolved[name] = accessor(self)
+            return value
+    return wrapper
+
 
 class Config:
     """Configuration manager for test automation framework."""
@@ -21,7 +124,14 @@ class Config:
             config_file: Optional path to YAML config file
         """
         # Load environment variables from .env file
-        load_dotenv()
+        global _dotenv_loaded
+        if not _dotenv_loaded:
+            load_dotenv()
+            _dotenv_loaded = True
+        
+        # Overrides are read from a snapshot taken here (after .env is applied); a test run
+        # sets its environment up front, so later changes don't need to be seen
+        self._env: Dict[str, str] = dict(os.environ)
         
         # Load configuration from YAML file if provided
         self.config_data = {}
@@ -30,14 +140,29 @@ class Config:
         else:
             # Try to load default config files
             self._load_default_config()
+        
+        # Resolve every dotted key once so get() is a single lookup
+        self._flat: Dict[str, Any] = {}
+        if isinstance(self.config_data, dict):
+            _flatten(self.config_data, '', self._flat)
+        for key, convert in _TYPED.items():
+            if self._flat.get(key) is not None:
+                try:
+                    self._flat[key] = convert(self._flat[key])
+                except (TypeError, ValueError):
+                    pass  # left as-is; the accessor raises when it's used
+        # Environment variable name for every known key, including typed settings absent from the file
+        self._env_keys = {key: key.upper().replace('.', '_') for key in (*self._flat, *_TYPED)}
+        
+        # Results of the typed accessors, filled on first use (see _memoized)
+        self._resolved: Dict[str, Any] = {}
     
     def _load_config_file(self, config_file: str) -> None:
         """Load configuration from YAML file."""
         try:
             config_path = Path(config_file)
             if config_path.exists():
-                with open(config_path, 'r') as f:
-                    self.config_data = yaml.safe_load(f) or {}
+                self.config_data = _load_yaml(config_path) or {}
             else:
                 print(f"Warning: Config file {config_file} not found. Using defaults.")
         except Exception as e:
@@ -46,27 +171,19 @@ class Config:
     
     def _load_default_config(self) -> None:
         """Load default configuration files."""
-        # Look for config files in the config directory
-        config_dir = Path(__file__).parent.parent / 'config'
-        
-        # Load main config file
-        for config_file in ['test_config.yaml', 'config.yaml', 'settings.yaml']:
-            config_path = config_dir / config_file
-            if config_path.exists():
-                self._load_config_file(str(config_path))
-                break
+        # Load main config file (located at import)
+        if _DEFAULT_CONFIG_PATH is not None:
+            self._load_config_file(str(_DEFAULT_CONFIG_PATH))
         
         # Also load test data file if it exists
-        test_data_path = config_dir / 'test_data.yaml'
-        if test_data_path.exists():
+        if _TEST_DATA_EXISTS:
             try:
-                with open(test_data_path, 'r') as f:
-                    test_data = yaml.safe_load(f) or {}
-                    # Merge test data into config
-                    if 'test_data' not in self.config_data:
-                        self.config_data['test_data'] = test_data
-                    else:
-                        self.config_data['test_data'].update(test_data)
+                test_data = _load_yaml(_TEST_DATA_PATH) or {}
+                # Merge test data into config
+                if 'test_data' not in self.config_data:
+                    self.config_data['test_data'] = test_data
+                else:
+                    self.config_data['test_data'].update(test_data)
             except Exception as e:
                 print(f"Error loading test data file: {e}")
     
@@ -82,22 +199,30 @@ class Config:
             Configuration value or default
         """
         # First check environment variables
-        env_key = key.upper().replace('.', '_')
-        env_value = os.getenv(env_key)
+        env_key = self._env_keys.get(key) or key.upper().replace('.', '_')
+        env_value = self._env.get(env_key)
         if env_value is not None:
             return env_value
         
         # Then check config file data
-        keys = key.split('.')
-        value = self.config_data
+        return self._flat.get(key, default)
+    
+    def _get_typed(self, key: str, default: Any) -> Any:
+        """
+        Get a setting listed in _TYPED, converted to its type.
         
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        Args:
+            key: Configuration key (dot notation)
+            default: Default value (already typed) if key not found
+            
+        Returns:
+            Converted configuration value or default
+        """
+        value = self.get(key, default)
+        # Only strings (environment overrides, unconvertible file values) still need converting
+        return _TYPED[key](value) if isinstance(value, str) else value
     
+    @_memoized
     def get_browser(self) -> str:
         """Get browser name for testing."""
         # Check for browser.name in config file first
@@ -108,6 +233,7 @@ class Config:
         # Fall back to BROWSER env var or simple 'browser' config
         return self.get('browser', 'chrome').lower()
     
+    @_memoized
     def get_base_url(self) -> str:
         """Get base URL for testing."""
         # Check nested configuration first
@@ -118,6 +244,7 @@ class Config:
         # Fall back to simple config or env var
         return self.get('base_url', 'https://www.hudl.com')
     
+    @_memoized
     def get_base_url_path(self) -> str:
         """Get base URL path for the application."""
         # Check nested configuration first
@@ -128,6 +255,7 @@ class Config:
         # Fall back to simple config or default path
         return self.get('base_url_path', '/')
     
+    @_memoized
     def get_login_url(self) -> str:
         """Get login page URL."""
         # Check if full login URL is configured
@@ -140,45 +268,57 @@ class Config:
         login_path = self.get('login_path', '/login')
         return f"{base_url}{login_path}"
     
+    @_memoized
     def get_implicit_wait(self) -> int:
         """Get implicit wait timeout in seconds."""
-        return int(self.get('timeouts.implicit_wait', 10))
+        return self._get_typed('timeouts.implicit_wait', 0)
     
+    @_memoized
     def get_explicit_wait(self) -> int:
         """Get explicit wait timeout in seconds."""
-        return int(self.get('timeouts.explicit_wait', 20))
+        return self._get_typed('timeouts.explicit_wait', 20)
     
+    @_memoized
     def get_page_load_timeout(self) -> int:
         """Get page load timeout in seconds."""
-        return int(self.get('timeouts.page_load', 30))
+        return self._get_typed('timeouts.page_load', 30)
     
+    @_memoized
     def is_headless(self) -> bool:
         """Check if browser should run in headless mode."""
         # Check for browser.headless in config file first
-        headless = self.get('browser.headless', None)
+        headless = self._get_typed('browser.headless', None)
         if headless is not None:
-            return str(headless).lower() == 'true'
+            return headless
         
         # Fall back to HEADLESS env var or simple 'headless' config
-        return self.get('headless', 'false').lower() == 'true'
+        return self._get_typed('headless', False)
     
+    @_memoized
     def get_window_size(self) -> tuple:
         """Get browser window size."""
         # Check nested configuration first
-        width = self.get('browser.window_size.width', None)
-        height = self.get('browser.window_size.height', None)
+        width = self._get_typed('browser.window_size.width', None)
+        height = self._get_typed('browser.window_size.height', None)
         
         if width and height:
-            return (int(width), int(height))
+            return (width, height)
         
         # Fall back to simple config
-        width = int(self.get('window.width', 1920))
-        height = int(self.get('window.height', 1080))
-        return (width, height)
+        return (self._get_typed('window.width', 1920), self._get_typed('window.height', 1080))
     
     def get_screenshot_on_failure(self) -> bool:
         """Check if screenshots should be taken on failure."""
-        return self.get('reporting.screenshot_on_failure', 'true').lower() == 'true'
+        return self._get_typed('reporting.screenshot_on_failure', True)
+    
+    @_memoized
+    def is_element_cache_enabled(self) -> bool:
+        """Check if page objects should reuse located elements between calls."""
+        return self._get_typed('performance.element_cache', False)
+    
+    def get_browser_options(self) -> Dict[str, Any]:
+        """Get per-browser options for remote sessions (browser_options.<browser>.arguments)."""
+        return self.get('browser_options', None) or {}
     
     def get_test_data(self) -> Dict[str, Any]:
         """Get test data configuration."""
@@ -193,14 +333,16 @@ class Config:
             }
         })
     
+    @_memoized
     def get_error_timeout(self) -> int:
         """Get error detection timeout in seconds."""
-        return int(self.get('timeouts.error_detection', 3))
+        return self._get_typed('timeouts.error_detection', 3)
     
+    @_memoized
     def get_social_login_timeout(self) -> int:
         """Get social login element detection timeout in seconds."""
-        return int(self.get('timeouts.social_login', 2))
-
+        return self._get_typed('timeouts.social_login', 2)
+    
     def __str__(self) -> str:
         """String representation of configuration."""
         return f"Config(browser={self.get_browser()}, base_url={self.get_base_url()})"
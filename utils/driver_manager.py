@@ -3,24 +3,92 @@ WebDriver management for Hudl login testing.
 Handles browser initialization, configuration, and cleanup.
 """
 
+import functools
+import logging
 import os
-import platform
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+import selenium
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Launch flags shared by the Chromium-based browsers (the window size is added per driver)
+_CHROMIUM_ARGS = ('--no-sandbox', '--disable-dev-shm-usage')
+# Chrome without a config also disables the GPU
+_CHROME_DEFAULT_ARGS = _CHROMIUM_ARGS + ('--disable-gpu',)
+_CHROME_PREFS = {'profile.default_content_setting_values.notifications': 2}
+_FIREFOX_PREFS = {'dom.webnotifications.enabled': False}
+# Window size when no config is supplied
+_DEFAULT_WINDOW_SIZE = (1920, 1080)
+
+# Selenium 4.6+ resolves drivers itself (Selenium Manager); older releases need webdriver-manager
+_SELENIUM_MANAGER_AVAILABLE = tuple(int(part) for part in re.findall(r'\d+', selenium.__version__)[:2]) >= (4, 6)
+
+# Drivers Selenium Manager failed to resolve; later starts go straight to webdriver-manager
+_SELENIUM_MANAGER_FAILED: Set[str] = set()
+
+# Resolved driver binaries keyed by (driver name, pinned version), so each is looked up once per process
+_DRIVER_PATH_CACHE: Dict[Tuple[str, str], str] = {}
+
+
+def _cached_driver_path(driver_name: str, install: Callable[[], str]) -> str:
+    """
+    Resolve a driver binary once per process and reuse the path afterwards.
+    
+    Args:
+        driver_name: Driver executable name (chromedriver, geckodriver, edgedriver)
+        install: Callable that resolves the binary and returns its path
+        
+    Returns:
+        Path to the driver executable
+    """
+    # A pinned version (e.g. SE_CHROMEDRIVER_VERSION) gets its own entry
+    key = (driver_name, os.environ.get(f"SE_{driver_name.upper()}_VERSION", ''))
+    path = _DRIVER_PATH_CACHE.get(key)
+    if path is None:
+        path = _DRIVER_PATH_CACHE[key] = install()
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _chromium_arguments(base_args: Tuple[str, ...], width: int, height: int, headless: bool) -> Tuple[str, ...]:
+    """
+    Build the full launch argument list for a Chromium-based browser, once per combination.
+    
+    Args:
+        base_args: Fixed launch flags
+        width: Window width
+        height: Window height
+        headless: Whether to add --headless
+        
+    Returns:
+        Tuple of command line arguments
+    """
+    args = base_args + (f'--window-size={width},{height}',)
+    return args + ('--headless',) if headless else args
 
 
 class DriverManager:
     """Manages WebDriver instances for different browsers."""
     
+    # Browser name -> builder method
+    _BUILDERS = {
+        'chrome': '_get_chrome_driver',
+        'firefox': '_get_firefox_driver',
+        'edge': '_get_edge_driver',
+        'safari': '_get_safari_driver'
+    }
+    
     def __init__(self, config=None):
         """
         Initialize driver manager with configuration.
@@ -30,6 +98,9 @@ class DriverManager:
         """
         self.config = config
         self.driver = None
+        self._static_info: Optional[Dict[str, Any]] = None
+        # Resolved once; every browser builder and the window setup read it
+        self._headless = config.is_headless() if config else os.environ.get('HEADLESS', 'false').lower() == 'true'
         
     def get_driver(self, browser: Optional[str] = None) -> webdriver.Remote:
         """
@@ -46,163 +117,219 @@ class DriverManager:
         
         browser = browser.lower()
         
-        if browser == 'chrome':
-            self.driver = self._get_chrome_driver()
-        elif browser == 'firefox':
-            self.driver = self._get_firefox_driver()
-        elif browser == 'edge':
-            self.driver = self._get_edge_driver()
-        elif browser == 'safari':
-            self.driver = self._get_safari_driver()
-        else:
+        if browser not in self._BUILDERS:
             raise ValueError(f"Unsupported browser: {browser}")
         
+        self.driver = getattr(self, self._BUILDERS[browser])()
+        
         # Configure driver timeouts
         self._configure_timeouts()
         
-        # Set window size
-        self._configure_window()
+        # Set window size (only browsers without a launch-time size argument need this)
+        if browser == 'safari':
+            self._configure_window()
         
         return self.driver
     
+    def get_drivers(self, browsers: List[str]) -> Dict[str, webdriver.Remote]:
+        """
+        Start several browsers at once, for cross-browser runs.
+        
+        The browsers launch concurrently, so start-up takes about as long as the slowest one.
+        They aren't tracked as self.driver; the caller quits them.
+        
+        Args:
+            browsers: Browser names (chrome, firefox, edge, safari)
+            
+        Returns:
+            Dictionary of browser name -> WebDriver instance
+            
+        Raises:
+            ValueError: If a browser isn't supported
+        """
+        names = list(dict.fromkeys(browser.lower() for browser in browsers))
+        unsupported = [name for name in names if name not in self._BUILDERS]
+        if unsupported:
+            raise ValueError(f"Unsupported browser: {', '.join(unsupported)}")
+        if not names:
+            return {}
+        
+        # The work is in the browser processes, so threads overlap the launches
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            futures = {name: executor.submit(getattr(self, self._BUILDERS[name])) for name in names}
+        
+        drivers = {}
+        error = None
+        for name, future in futures.items():
+            try:
+                drivers[name] = future.result()
+            except Exception as e:
+                logger.error("Failed to start %s: %s", name, e)
+                error = error or e
+        
+        # All or nothing: don't leave the browsers that did start running
+        if error is not None:
+            for driver in drivers.values():
+                self._quit_quietly(driver)
+            raise error
+        
+        for name, driver in drivers.items():
+            self._configure_timeouts(driver)
+            if name == 'safari':
+                self._configure_window(driver)
+        return drivers
+    
     def _get_chrome_driver(self) -> webdriver.Chrome:
         """Get Chrome WebDriver instance."""
-        print("Initializing Chrome WebDriver...")
+        logger.debug("Initializing Chrome WebDriver")
         options = ChromeOptions()
         
         # Get browser options from config
         if self.config:
-            print(f"Using config - Headless mode: {self.config.is_headless()}")
-            
-            # Add default arguments
-            default_args = [
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--window-size=1920,1080'
-            ]
-            for arg in default_args:
-                print(f"Adding Chrome argument: {arg}")
-                options.add_argument(arg)
+            logger.debug("Using config - Headless mode: %s", self._headless)
+            width, height = self.config.get_window_size()
+            args = _CHROMIUM_ARGS
             
             # Set default preferences
-            default_prefs = {
-                'profile.default_content_setting_values.notifications': 2
-            }
-            print(f"Setting Chrome preferences: {default_prefs}")
-            options.add_experimental_option('prefs', default_prefs)
-            
-            # Headless mode
-            if self.config.is_headless():
-                print("Running in headless mode")
-                options.add_argument('--headless')
-            else:
-                print("Running in normal (visible) mode")
+            logger.debug("Setting Chrome preferences: %s", _CHROME_PREFS)
+            options.add_experimental_option('prefs', _CHROME_PREFS)
         else:
-            print("No config provided, using default options")
-            # Default options
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            if os.getenv('HEADLESS', 'false').lower() == 'true':
-                options.add_argument('--headless')
-        
-        # Set up service
-        print("Setting up Chrome service...")
-        try:
-            # Try to use webdriver-manager first
-            service = ChromeService(ChromeDriverManager().install())
-        except Exception as e:
-            print(f"WebDriver Manager failed: {e}")
-            print("Trying to use system ChromeDriver...")
-            # Fall back to system ChromeDriver
-            import shutil
-            chromedriver_path = shutil.which('chromedriver')
-            if chromedriver_path:
-                print(f"Found system ChromeDriver at: {chromedriver_path}")
-                service = ChromeService(chromedriver_path)
-            else:
-                raise Exception("No ChromeDriver found. Please install ChromeDriver manually.")
+            logger.debug("No config provided, using default options")
+            width, height = _DEFAULT_WINDOW_SIZE
+            args = _CHROME_DEFAULT_ARGS
         
-        print("Creating Chrome WebDriver instance...")
+        logger.debug("Running in %s mode", "headless" if self._headless else "normal (visible)")
+        for arg in _chromium_arguments(args, width, height, self._headless):
+            options.add_argument(arg)
+        logger.debug("Chrome arguments: %s", options.arguments)
+        
+        logger.debug("Creating Chrome WebDriver instance")
         try:
-            driver = webdriver.Chrome(service=service, options=options)
-            print("Chrome WebDriver created successfully!")
+            driver = self._start_local_driver(
+                webdriver.Chrome, ChromeService, options, 'chromedriver', self._install_chromedriver
+            )
+            logger.debug("Chrome WebDriver created")
             return driver
         except Exception as e:
-            print(f"Failed to create Chrome WebDriver: {e}")
+            logger.error("Failed to create Chrome WebDriver: %s", e)
             raise
     
+    @staticmethod
+    def _start_local_driver(driver_class: Callable[..., webdriver.Remote], service_class: Callable[[str], Any],
+                            options: Any, driver_name: str, install: Callable[[], str]) -> webdriver.Remote:
+        """
+        Start a local browser, letting Selenium Manager find the driver when it can.
+        
+        Args:
+            driver_class: WebDriver class to instantiate (e.g. webdriver.Chrome)
+            service_class: Matching Service class
+            options: Browser options
+            driver_name: Driver executable name (chromedriver, geckodriver, edgedriver)
+            install: Fallback that resolves the driver with webdriver-manager
+            
+        Returns:
+            WebDriver instance
+        """
+        if _SELENIUM_MANAGER_AVAILABLE and driver_name not in _SELENIUM_MANAGER_FAILED:
+            try:
+                return driver_class(options=options)
+            except WebDriverException as e:
+                logger.info("Selenium Manager could not start %s, using webdriver-manager: %s", driver_name, e)
+                _SELENIUM_MANAGER_FAILED.add(driver_name)
+        
+        service = service_class(_cached_driver_path(driver_name, install))
+        return driver_class(service=service, options=options)
+    
+    @staticmethod
+    def _install_chromedriver() -> str:
+        """
+        Resolve ChromeDriver through webdriver-manager, falling back to one on the PATH.
+        
+        Returns:
+            Path to the ChromeDriver executable
+        """
+        try:
+            # Try to use webdriver-manager first (imported here: it's only needed when no path is cached)
+            from webdriver_manager.chrome import ChromeDriverManager
+            return ChromeDriverManager().install()
+        except Exception as e:
+            logger.warning("WebDriver Manager failed: %s", e)
+            logger.info("Trying to use system ChromeDriver")
+            # Fall back to system ChromeDriver
+            chromedriver_path = shutil.which('chromedriver')
+            if chromedriver_path:
+                logger.info("Found system ChromeDriver at: %s", chromedriver_path)
+                return chromedriver_path
+            raise Exception("No ChromeDriver found. Please install ChromeDriver manually.")
+    
+    @staticmethod
+    def _install_geckodriver() -> str:
+        """Resolve GeckoDriver through webdriver-manager and return its path."""
+        from webdriver_manager.firefox import GeckoDriverManager
+        return GeckoDriverManager().install()
+    
+    @staticmethod
+    def _install_edgedriver() -> str:
+        """Resolve EdgeDriver through webdriver-manager and return its path."""
+        from webdriver_manager.microsoft import EdgeChromiumDriverManager
+        return EdgeChromiumDriverManager().install()
+    
     def _get_firefox_driver(self) -> webdriver.Firefox:
         """Get Firefox WebDriver instance."""
         options = FirefoxOptions()
         
         # Get browser options from config
         if self.config:
-            # Add default arguments
-            default_args = ['--width=1920', '--height=1080']
-            for arg in default_args:
-                options.add_argument(arg)
+            width, height = self.config.get_window_size()
             
             # Set default preferences
-            default_prefs = {'dom.webnotifications.enabled': False}
-            for key, value in default_prefs.items():
+            for key, value in _FIREFOX_PREFS.items():
                 options.set_preference(key, value)
-            
-            # Headless mode
-            if self.config.is_headless():
-                options.add_argument('--headless')
         else:
-            # Default options
-            if os.getenv('HEADLESS', 'false').lower() == 'true':
-                options.add_argument('--headless')
+            width, height = _DEFAULT_WINDOW_SIZE
+        
+        options.add_argument(f'--width={width}')
+        options.add_argument(f'--height={height}')
         
-        # Set up service
-        service = FirefoxService(GeckoDriverManager().install())
+        # Headless mode
+        if self._headless:
+            options.add_argument('--headless')
         
-        return webdriver.Firefox(service=service, options=options)
+        return self._start_local_driver(
+            webdriver.Firefox, FirefoxService, options, 'geckodriver', self._install_geckodriver
+        )
     
     def _get_edge_driver(self) -> webdriver.Edge:
         """Get Edge WebDriver instance."""
         options = EdgeOptions()
+        width, height = self.config.get_window_size() if self.config else _DEFAULT_WINDOW_SIZE
         
-        # Get browser options from config
-        if self.config:
-            # Add default arguments
-            default_args = [
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--window-size=1920,1080'
-            ]
-            for arg in default_args:
-                options.add_argument(arg)
-            
-            # Headless mode
-            if self.config.is_headless():
-                options.add_argument('--headless')
-        else:
-            # Default options
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            if os.getenv('HEADLESS', 'false').lower() == 'true':
-                options.add_argument('--headless')
-        
-        # Set up service
-        service = EdgeService(EdgeChromiumDriverManager().install())
+        for arg in _chromium_arguments(_CHROMIUM_ARGS, width, height, self._headless):
+            options.add_argument(arg)
         
-        return webdriver.Edge(service=service, options=options)
+        return self._start_local_driver(
+            webdriver.Edge, EdgeService, options, 'edgedriver', self._install_edgedriver
+        )
     
     def _get_safari_driver(self) -> webdriver.Safari:
         """Get Safari WebDriver instance."""
-        # Safari only available on macOS
-        if platform.system() != 'Darwin':
+        # Safari only available on macOS (platform is only needed here, so imported here)
+        import platform as _platform
+        if _platform.system() != 'Darwin':
             raise RuntimeError("Safari WebDriver is only available on macOS")
         
         # Safari doesn't support headless mode
         return webdriver.Safari()
     
-    def _configure_timeouts(self) -> None:
-        """Configure WebDriver timeouts."""
-        if not self.driver:
+    def _configure_timeouts(self, driver: Optional[webdriver.Remote] = None) -> None:
+        """
+        Configure WebDriver timeouts.
+        
+        Args:
+            driver: Driver to configure (defaults to the managed driver)
+        """
+        driver = driver or self.driver
+        if not driver:
             return
         
         if self.config:
@@ -211,26 +338,30 @@ class DriverManager:
             page_load_timeout = self.config.get_page_load_timeout()
         else:
             # Default timeouts
-            implicit_wait = 10
+            implicit_wait = 0
             page_load_timeout = 30
         
-        self.driver.implicitly_wait(implicit_wait)
-        self.driver.set_page_load_timeout(page_load_timeout)
+        driver.implicitly_wait(implicit_wait)
+        driver.set_page_load_timeout(page_load_timeout)
     
-    def _configure_window(self) -> None:
-        """Configure browser window."""
-        if not self.driver:
+    def _configure_window(self, driver: Optional[webdriver.Remote] = None) -> None:
+        """
+        Configure browser window.
+        
+        Args:
+            driver: Driver to configure (defaults to the managed driver)
+        """
+        driver = driver or self.driver
+        if not driver:
             return
         
         # Don't maximize in headless mode
-        headless = self.config.is_headless() if self.config else os.getenv('HEADLESS', 'false').lower() == 'true'
-        
-        if not headless:
+        if not self._headless:
             if self.config:
                 width, height = self.config.get_window_size()
-                self.driver.set_window_size(width, height)
+                driver.set_window_size(width, height)
             else:
-                self.driver.maximize_window()
+                driver.maximize_window()
     
     def get_mobile_driver(self, device_name: str) -> webdriver.Chrome:
         """
@@ -248,14 +379,15 @@ class DriverManager:
         options.add_experimental_option("mobileEmulation", mobile_emulation)
         
         # Add common mobile testing arguments
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
+        for arg in _CHROMIUM_ARGS:
+            options.add_argument(arg)
         
-        if self.config and self.config.is_headless():
+        if self._headless:
             options.add_argument('--headless')
         
-        service = ChromeService(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
+        return self._start_local_driver(
+            webdriver.Chrome, ChromeService, options, 'chromedriver', self._install_chromedriver
+        )
     
     def get_remote_driver(self, hub_url: str, browser: str, version: str = None, platform: str = None) -> webdriver.Remote:
         """
@@ -270,32 +402,28 @@ class DriverManager:
         Returns:
             Remote WebDriver instance
         """
-        capabilities = {
-            'browserName': browser,
-            'browserVersion': version or 'latest',
-            'platformName': platform or 'ANY'
+        options_classes = {
+            'chrome': ChromeOptions,
+            'firefox': FirefoxOptions,
+            'edge': EdgeOptions,
+            'safari': webdriver.SafariOptions
         }
+        browser = browser.lower()
+        if browser not in options_classes:
+            raise ValueError(f"Unsupported browser: {browser}")
         
-        # Add browser-specific options
-        if browser.lower() == 'chrome':
-            options = ChromeOptions()
-            if self.config:
-                browser_opts = self.config.get_browser_options().get('chrome', {})
-                for arg in browser_opts.get('arguments', []):
-                    options.add_argument(arg)
-            capabilities.update(options.to_capabilities())
-        elif browser.lower() == 'firefox':
-            options = FirefoxOptions()
-            if self.config:
-                browser_opts = self.config.get_browser_options().get('firefox', {})
-                for arg in browser_opts.get('arguments', []):
-                    options.add_argument(arg)
-            capabilities.update(options.to_capabilities())
-        
-        return webdriver.Remote(
-            command_executor=hub_url,
-            desired_capabilities=capabilities
-        )
+        # Options carry browserName; version and platform go on as extra capabilities
+        options = options_classes[browser]()
+        options.set_capability('browserVersion', version or 'latest')
+        options.set_capability('platformName', platform or 'ANY')
+        
+        # Add browser-specific arguments
+        if self.config and browser != 'safari':
+            browser_opts = self.config.get_browser_options().get(browser, {})
+            for arg in browser_opts.get('arguments', []):
+                options.add_argument(arg)
+        
+        return webdriver.Remote(command_executor=hub_url, options=options)
     
     def quit_driver(self) -> None:
         """Quit the WebDriver instance."""
@@ -303,7 +431,7 @@ class DriverManager:
             try:
                 self.driver.quit()
             except Exception as e:
-                print(f"Error quitting driver: {e}")
+                logger.error("Error quitting driver: %s", e)
             finally:
                 self.driver = None
     
@@ -320,6 +448,14 @@ class DriverManager:
         self.quit_driver()
         return self.get_driver(browser)
     
+    @staticmethod
+    def _quit_quietly(driver: webdriver.Remote) -> None:
+        """Quit a driver, ignoring errors from a browser that already went away."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
     def take_screenshot(self, filename: str) -> bool:
         """
         Take a screenshot and save to file.
@@ -336,7 +472,7 @@ class DriverManager:
         try:
             return self.driver.save_screenshot(filename)
         except Exception as e:
-            print(f"Error taking screenshot: {e}")
+            logger.error("Error taking screenshot: %s", e)
             return False
     
     def get_driver_info(self) -> Dict[str, Any]:
@@ -344,21 +480,54 @@ class DriverManager:
         Get information about the current driver.
         
         Returns:
-            Dictionary with driver information
+            Dictionary with driver information (static and dynamic fields)
+        """
+        static_info = self.get_driver_info_static()
+        if not static_info:
+            return {}
+        dynamic_info = self.get_driver_info_dynamic()
+        if not dynamic_info:
+            return {}
+        return {**static_info, **dynamic_info}
+    
+    def get_driver_info_static(self) -> Dict[str, Any]:
+        """
+        Get the driver details fixed for the life of the session, without any WebDriver calls.
+        
+        Returns:
+            Dictionary with browser name/version, platform and session id
+        """
+        if not self.driver:
+            return {}
+        
+        # Cached per session; capabilities don't change once the browser has started
+        session_id = self.driver.session_id
+        if self._static_info is None or self._static_info['session_id'] != session_id:
+            capabilities = self.driver.capabilities
+            self._static_info = {
+                'browser_name': capabilities.get('browserName'),
+                'browser_version': capabilities.get('browserVersion'),
+                'platform': capabilities.get('platformName'),
+                'session_id': session_id
+            }
+        return dict(self._static_info)
+    
+    def get_driver_info_dynamic(self) -> Dict[str, Any]:
+        """
+        Get the current page and window state (one WebDriver call per field).
+        
+        Returns:
+            Dictionary with current URL, window size and window position
         """
         if not self.driver:
             return {}
         
         try:
             return {
-                'browser_name': self.driver.capabilities.get('browserName'),
-                'browser_version': self.driver.capabilities.get('browserVersion'),
-                'platform': self.driver.capabilities.get('platformName'),
-                'session_id': self.driver.session_id,
                 'current_url': self.driver.current_url,
                 'window_size': self.driver.get_window_size(),
                 'window_position': self.driver.get_window_position()
             }
         except Exception as e:
-            print(f"Error getting driver info: {e}")
+            logger.error("Error getting driver info: %s", e)
             return {}
@@ -3,161 +3,462 @@ Test data management for Hudl login testing.
 Provides test data for different scenarios and user types.
 """
 
+import copy
 import json
 import random
 import string
-from typing import Dict, List, Any, Optional
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Any, Mapping, Optional, Set, Tuple
 from pathlib import Path
 
+# orjson parses and serializes test data files several times faster (optional - falls back to json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed test data files keyed by (absolute path, mtime_ns, size); a changed file gets a new key
+_FILE_CACHE: Dict[Tuple[str, int, int], Any] = {}
+
+# Write buffer for saved test data files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Directories save_test_data_to_file has already created or found
+_ENSURED_DIRS: Set[str] = set()
+
+# Generator for managers created without a seed: OS entropy rather than the seedable module-level generator
+_SECURE_RANDOM = random.SystemRandom()
+
+# Character sets for generated credentials, built once instead of on every call
+_UPPER = string.ascii_uppercase
+_LOWER = string.ascii_lowercase
+_DIGITS = string.digits
+_SPECIALS = '!@#$%^&*'
+_CHARS_NOSPECIAL = string.ascii_letters + _DIGITS
+_CHARS_SPECIAL = _CHARS_NOSPECIAL + _SPECIALS
+_EMAIL_USERNAME_CHARS = _LOWER + _DIGITS
+
+
+@lru_cache(maxsize=None)
+def _byte_translation(chars: str) -> Tuple[bytes, bytes]:
+    """
+    Build the byte lookup table used by _unbiased_choices for an ASCII character set.
+    
+    Args:
+        chars: Character set to pick from (ASCII, at most 256 characters)
+        
+    Returns:
+        Tuple of (256-entry table mapping each byte to chars[byte % len(chars)],
+        bytes at or above the largest multiple of len(chars), which are rejected)
+    """
+    size = len(chars)
+    limit = 256 - 256 % size
+    table = bytes(ord(chars[byte % size]) for byte in range(256))
+    return table, bytes(range(limit, 256))
+
+
+def _unbiased_choices(chars: str, k: int, rng: random.Random = _SECURE_RANDOM) -> List[str]:
+    """
+    Pick k characters uniformly from chars, drawing random bytes in batches.
+    
+    Bytes at or above the largest multiple of len(chars) are rejected, so the mapping
+    byte % len(chars) has no modulo bias. Mapping and rejection both happen in one
+    bytes.translate call through a lookup table built once per character set.
+    
+    Args:
+        chars: Character set to pick from (ASCII, at most 256 characters)
+        k: Number of characters to pick
+        rng: Generator supplying the random bits
+        
+    Returns:
+        List of k characters
+    """
+    table, rejected = _byte_translation(chars)
+    picked = ''
+    while len(picked) < k:
+        # Twice the shortfall covers the rejections in one draw almost always
+        needed = 2 * (k - len(picked))
+        raw = rng.getrandbits(8 * needed).to_bytes(needed, 'little')
+        picked += raw.translate(table, rejected).decode('ascii')
+    return list(picked[:k])
+
+
+def _shuffle(items: List[Any], rng: random.Random = _SECURE_RANDOM) -> None:
+    """
+    Shuffle items in place (Fisher-Yates), taking the randomness for every swap from one draw.
+    
+    Each index comes from its own 64-bit slice of the draw. For the list sizes used here the
+    modulo bias is below 2**-56, so it is not worth a rejection loop.
+    
+    Args:
+        items: List to shuffle
+        rng: Generator supplying the random bits
+    """
+    n = len(items)
+    if n < 2:
+        return
+    bits = rng.getrandbits(64 * (n - 1))
+    for i in range(n - 1, 0, -1):
+        j = (bits & 0xFFFFFFFFFFFFFFFF) % (i + 1)
+        bits >>= 64
+        items[i], items[j] = items[j], items[i]
+
+
+# Built-in test data by section, used by every TestDataManager without a config
+_DEFAULT_SECTION_BUILDERS: Dict[str, Callable[[], Any]] = {
+    'valid_credentials': lambda: {
+        'email': 'test.user@example.com',
+        'password': 'TestPassword123!'
+    },
+    'invalid_credentials': lambda: [
+        {'email': 'invalid.user@example.com', 'password': 'WrongPassword'},
+        {'email': 'nonexistent@example.com', 'password': 'AnotherWrongPassword'},
+        {'email': '', 'password': ''},
+        {'email': 'test.user@example.com', 'password': ''},
+        {'email': '', 'password': 'TestPassword123!'},
+        {'email': 'invalid-email-format', 'password': 'ValidPassword123!'},
+        {'email': 'test@', 'password': 'ValidPassword123!'},
+        {'email': '@example.com', 'password': 'ValidPassword123!'}
+    ],
+    'test_users': lambda: {
+        'coach': {
+            'email': 'coach@example.com',
+            'password': 'CoachPassword123!',
+            'role': 'coach',
+            'team': 'Eagles Football',
+            'permissions': ['view_team_data', 'manage_roster', 'create_highlights']
+        },
+        'player': {
+            'email': 'player@example.com',
+            'password': 'PlayerPassword123!',
+            'role': 'player',
+            'team': 'Eagles Football',
+            'permissions': ['view_personal_data', 'view_team_highlights']
+        },
+        'admin': {
+            'email': 'admin@example.com',
+            'password': 'AdminPassword123!',
+            'role': 'admin',
+            'permissions': ['manage_users', 'system_settings', 'view_analytics']
+        },
+        'parent': {
+            'email': 'parent@example.com',
+            'password': 'ParentPassword123!',
+            'role': 'parent',
+            'linked_players': ['player@example.com']
+        }
+    },
+    'security_test_data': lambda: {
+        'sql_injection_attempts': [
+            "'; DROP TABLE users; --",
+            "admin'--",
+            "admin'/*",
+            "' OR '1'='1",
+            "' OR '1'='1' --",
+            "' OR '1'='1' #",
+            "' OR '1'='1'/*",
+            "') OR '1'='1' --"
+        ],
+        'xss_attempts': [
+            "<script>alert('XSS')</script>",
+            "<img src=x onerror=alert('XSS')>",
+            "javascript:alert('XSS')",
+            "<svg onload=alert('XSS')>",
+            "';alert('XSS');//",
+            "\"><script>alert('XSS')</script>"
+        ],
+        'csrf_test_tokens': [
+            "invalid_token_12345",
+            "",
+            "expired_token_67890",
+            "malformed_token_!@#$%"
+        ]
+    }
+}
+
+
+@lru_cache(maxsize=None)
+def _default_section(name: str) -> Any:
+    """
+    Build a built-in test data section on first use and share it afterwards; treat as read-only.
+    
+    Args:
+        name: Section name (a key of _DEFAULT_SECTION_BUILDERS)
+        
+    Returns:
+        The section's data
+    """
+    return _DEFAULT_SECTION_BUILDERS[name]()
+
+
+def _invalid_credentials_view(section: Any) -> Tuple[Mapping[str, str], ...]:
+    """Freeze the invalid credentials section into a tuple of read-only views."""
+    # config/test_data.yaml holds a single invalid pair as a mapping rather than a list
+    if isinstance(section, Mapping):
+        section = [section]
+    return tuple(MappingProxyType(entry) for entry in section)
+
+
+def _test_users_view(section: Mapping[str, Any]) -> Mapping[str, Mapping[str, Any]]:
+    """Freeze the test users section into a read-only view of read-only views."""
+    return MappingProxyType({role: MappingProxyType(user) for role, user in section.items()})
+
+
+def _security_test_data_view(section: Mapping[str, Any]) -> Mapping[str, Tuple[str, ...]]:
+    """Freeze the security test data section into a read-only view of payload tuples."""
+    return MappingProxyType({test_type: tuple(values) for test_type, values in section.items()})
+
+
+# How each section is stored once loaded; sections not listed are stored as they are
+_SECTION_VIEWS: Dict[str, Callable[[Any], Any]] = {
+    'valid_credentials': MappingProxyType,
+    'invalid_credentials': _invalid_credentials_view,
+    'test_users': _test_users_view,
+    'security_test_data': _security_test_data_view
+}
+
+
+# Boundary inputs never change; built once at import and exposed read-only
+_BOUNDARY_TEST_DATA: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    'email_boundaries': MappingProxyType({
+        'min_length': 'a@b.co',  # Minimum valid email
+        'max_length': f"{'a' * 60}@{'b' * 60}.com",  # Very long email
+        'empty': '',
+        'whitespace_only': '   ',
+        'special_chars': 'test+user@example.com',
+        'unicode': 'tëst@ëxämplë.com'
+    }),
+    'password_boundaries': MappingProxyType({
+        'min_length': 'Ab1!',  # 4 characters
+        'max_length': 'A' * 128 + 'b1!',  # Very long password
+        'empty': '',
+        'whitespace_only': '    ',
+        'no_uppercase': 'password123!',
+        'no_lowercase': 'PASSWORD123!',
+        'no_digits': 'Password!',
+        'no_special': 'Password123',
+        'only_spaces': ' ' * 10,
+        'unicode': 'Pässwörd123!'
+    })
+})
+
+# Mobile device record; a tuple with named fields, so it is immutable and has no per-instance dict
+MobileDevice = namedtuple('MobileDevice', ['name', 'user_agent', 'viewport_width', 'viewport_height',
+                                           'device_scale_factor'])
+
+# Device and localization tables never change; built once and shared, so treat as read-only
+_MOBILE_TEST_DEVICES: Tuple[MobileDevice, ...] = (
+    MobileDevice('iPhone 12', 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15',
+                 390, 844, 3),
+    MobileDevice('iPhone SE', 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15',
+                 375, 667, 2),
+    MobileDevice('Pixel 5', 'Mozilla/5.0 (Linux; Android 11; Pixel 5) AppleWebKit/537.36',
+                 393, 851, 2.75),
+    MobileDevice('Galaxy S21', 'Mozilla/5.0 (Linux; Android 11; SM-G991B) AppleWebKit/537.36',
+                 384, 854, 2.75),
+    MobileDevice('iPad', 'Mozilla/5.0 (iPad; CPU OS 14_0 like Mac OS X) AppleWebKit/605.1.15',
+                 768, 1024, 2),
+    MobileDevice('iPad Pro', 'Mozilla/5.0 (iPad; CPU OS 14_0 like Mac OS X) AppleWebKit/605.1.15',
+                 1024, 1366, 2)
+)
+
+_LOCALIZATION_TEST_DATA: Dict[str, Dict[str, str]] = {
+    'en': {
+        'login_button': 'Sign In',
+        'email_placeholder': 'Email',
+        'password_placeholder': 'Password',
+        'remember_me': 'Remember me',
+        'forgot_password': 'Forgot Password?',
+        'invalid_credentials_error': 'Invalid email or password'
+    },
+    'es': {
+        'login_button': 'Iniciar Sesión',
+        'email_placeholder': 'Correo electrónico',
+        'password_placeholder': 'Contraseña',
+        'remember_me': 'Recordarme',
+        'forgot_password': '¿Olvidaste tu contraseña?',
+        'invalid_credentials_error': 'Correo electrónico o contraseña inválidos'
+    },
+    'fr': {
+        'login_button': 'Se connecter',
+        'email_placeholder': 'E-mail',
+        'password_placeholder': 'Mot de passe',
+        'remember_me': 'Se souvenir de moi',
+        'forgot_password': 'Mot de passe oublié?',
+        'invalid_credentials_error': 'E-mail ou mot de passe invalide'
+    }
+}
+
+# UTF-8 forms of the localization strings, for byte-level comparisons (page source, HTTP bodies)
+_LOCALIZATION_TEST_DATA_UTF8: Dict[str, Dict[str, bytes]] = {
+    language: {key: text.encode('utf-8') for key, text in strings.items()}
+    for language, strings in _LOCALIZATION_TEST_DATA.items()
+}
+
 
 class TestDataManager:
     """Manages test data for different testing scenarios."""
     
-    def __init__(self, config=None):
+    # Released scenario dicts kept for reuse; more than this are left to the garbage collector
+    SCENARIO_POOL_MAX_SIZE = 32
+    
+    def __init__(self, config=None, seed: Optional[int] = None):
         """
         Initialize test data manager.
         
         Args:
             config: Configuration manager instance
+            seed: Seed for reproducible random data (e.g. one per parallel worker); without one,
+                  random data comes from OS entropy
         """
         self.config = config
+        # A private generator keeps seeded runs reproducible whatever else draws from the random module
+        self._rng = random.Random(seed) if seed is not None else _SECURE_RANDOM
+        self._scenario_pool: List[Dict[str, Any]] = []
         self._load_test_data()
     
     def _load_test_data(self) -> None:
-        """Load test data from configuration or use defaults."""
-        if self.config:
-            self.test_data = self.config.get_test_data()
-        else:
-            self.test_data = self._get_default_test_data()
+        """Load test data from configuration or use defaults; sections are materialized on first use."""
+        self._source = self.config.get_test_data() if self.config else None
+        self._sections: Dict[str, Any] = {}
+    
+    @property
+    def test_data(self) -> Dict[str, Any]:
+        """Full test data (the configured data, or every built-in section)."""
+        return self._source if self._source is not None else self._get_default_test_data()
+    
+    def _get_section(self, name: str, default: Any) -> Any:
+        """
+        Get a test data section, loading and freezing it on first access.
+        
+        Args:
+            name: Section name
+            default: Value used when the section is missing
+            
+        Returns:
+            The section, in the form given by _SECTION_VIEWS
+        """
+        if name not in self._sections:
+            if self._source is not None:
+                section = self._source.get(name, default)
+            elif name in _DEFAULT_SECTION_BUILDERS:
+                section = _default_section(name)
+            else:
+                section = default
+            view = _SECTION_VIEWS.get(name)
+            self._sections[name] = view(section) if view else section
+        return self._sections[name]
     
     def _get_default_test_data(self) -> Dict[str, Any]:
-        """Get default test data."""
-        return {
-            'valid_credentials': {
-                'email': 'test.user@example.com',
-                'password': 'TestPassword123!'
-            },
-            'invalid_credentials': [
-                {'email': 'invalid.user@example.com', 'password': 'WrongPassword'},
-                {'email': 'nonexistent@example.com', 'password': 'AnotherWrongPassword'},
-                {'email': '', 'password': ''},
-                {'email': 'test.user@example.com', 'password': ''},
-                {'email': '', 'password': 'TestPassword123!'},
-                {'email': 'invalid-email-format', 'password': 'ValidPassword123!'},
-                {'email': 'test@', 'password': 'ValidPassword123!'},
-                {'email': '@example.com', 'password': 'ValidPassword123!'}
-            ],
-            'test_users': {
-                'coach': {
-                    'email': 'coach@example.com',
-                    'password': 'CoachPassword123!',
-                    'role': 'coach',
-                    'team': 'Eagles Football',
-                    'permissions': ['view_team_data', 'manage_roster', 'create_highlights']
-                },
-                'player': {
-                    'email': 'player@example.com',
-                    'password': 'PlayerPassword123!',
-                    'role': 'player',
-                    'team': 'Eagles Football',
-                    'permissions': ['view_personal_data', 'view_team_highlights']
-                },
-                'admin': {
-                    'email': 'admin@example.com',
-                    'password': 'AdminPassword123!',
-                    'role': 'admin',
-                    'permissions': ['manage_users', 'system_settings', 'view_analytics']
-                },
-                'parent': {
-                    'email': 'parent@example.com',
-                    'password': 'ParentPassword123!',
-                    'role': 'parent',
-                    'linked_players': ['player@example.com']
-                }
-            },
-            'security_test_data': {
-                'sql_injection_attempts': [
-                    "'; DROP TABLE users; --",
-                    "admin'--",
-                    "admin'/*",
-                    "' OR '1'='1",
-                    "' OR '1'='1' --",
-                    "' OR '1'='1' #",
-                    "' OR '1'='1'/*",
-                    "') OR '1'='1' --"
-                ],
-                'xss_attempts': [
-                    "<script>alert('XSS')</script>",
-                    "<img src=x onerror=alert('XSS')>",
-                    "javascript:alert('XSS')",
-                    "<svg onload=alert('XSS')>",
-                    "';alert('XSS');//",
-                    "\"><script>alert('XSS')</script>"
-                ],
-                'csrf_test_tokens': [
-                    "invalid_token_12345",
-                    "",
-                    "expired_token_67890",
-                    "malformed_token_!@#$%"
-                ]
-            }
-        }
+        """Get default test data (the shared sections, not copies)."""
+        return {name: _default_section(name) for name in _DEFAULT_SECTION_BUILDERS}
     
-    def get_valid_credentials(self) -> Dict[str, str]:
-        """Get valid login credentials."""
-        return self.test_data['valid_credentials'].copy()
+    def get_valid_credentials(self) -> Mapping[str, str]:
+        """Get valid login credentials (a read-only view)."""
+        return self._get_section('valid_credentials', {})
     
-    def get_invalid_credentials(self) -> List[Dict[str, str]]:
-        """Get list of invalid credential combinations."""
-        return self.test_data['invalid_credentials'].copy()
+    def get_valid_credentials_mutable(self) -> Dict[str, str]:
+        """Get a copy of the valid login credentials for callers that modify them."""
+        return dict(self._get_section('valid_credentials', {}))
     
-    def get_random_invalid_credentials(self) -> Dict[str, str]:
-        """Get random invalid credentials."""
-        invalid_creds = self.get_invalid_credentials()
-        return random.choice(invalid_creds)
+    def get_invalid_credentials(self) -> Tuple[Mapping[str, str], ...]:
+        """Get invalid credential combinations (read-only views)."""
+        return self._get_section('invalid_credentials', [])
     
-    def get_test_user(self, role: str) -> Optional[Dict[str, Any]]:
+    def get_invalid_credentials_mutable(self) -> List[Dict[str, str]]:
+        """Get copies of the invalid credential combinations for callers that modify them."""
+        return [dict(entry) for entry in self._get_section('invalid_credentials', [])]
+    
+    def get_random_invalid_credentials(self) -> Mapping[str, str]:
+        """Get random invalid credentials (a read-only view)."""
+        return self._rng.choice(self._get_section('invalid_credentials', []))
+    
+    def get_test_user(self, role: str) -> Optional[Mapping[str, Any]]:
         """
         Get test user data by role.
         
+        Args:
+            role: User role (coach, player, admin, parent)
+            
+        Returns:
+            Read-only view of the user data, or None if not found
+        """
+        return self._get_section('test_users', {}).get(role)
+    
+    def get_test_user_mutable(self, role: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a copy of test user data by role for callers that modify it.
+        
         Args:
             role: User role (coach, player, admin, parent)
             
         Returns:
             User data dictionary or None if not found
         """
-        test_users = self.test_data.get('test_users', {})
-        return test_users.get(role, {}).copy() if role in test_users else None
+        user = self._get_section('test_users', {}).get(role)
+        return copy.deepcopy(dict(user)) if user is not None else None
+    
+    def get_all_test_users(self) -> Mapping[str, Mapping[str, Any]]:
+        """Get all test users (a read-only view of read-only views)."""
+        return self._get_section('test_users', {})
     
-    def get_all_test_users(self) -> Dict[str, Dict[str, Any]]:
-        """Get all test users."""
-        return self.test_data.get('test_users', {}).copy()
+    def get_all_test_users_mutable(self) -> Dict[str, Dict[str, Any]]:
+        """Get copies of all test users for callers that modify them."""
+        return {role: copy.deepcopy(dict(user)) for role, user in self._get_section('test_users', {}).items()}
     
-    def get_security_test_data(self, test_type: str) -> List[str]:
+    def get_security_test_data(self, test_type: str) -> Tuple[str, ...]:
         """
         Get security test data by type.
         
+        Args:
+            test_type: Type of security test (sql_injection_attempts, xss_attempts, csrf_test_tokens)
+            
+        Returns:
+            Tuple of test values (shared, not a copy)
+        """
+        return self._get_section('security_test_data', {}).get(test_type, ())
+    
+    def get_security_test_data_mutable(self, test_type: str) -> List[str]:
+        """
+        Get security test data by type as a new list, for callers that modify it.
+        
         Args:
             test_type: Type of security test (sql_injection_attempts, xss_attempts, csrf_test_tokens)
             
         Returns:
             List of test values
         """
-        security_data = self.test_data.get('security_test_data', {})
-        return security_data.get(test_type, []).copy()
+        return list(self.get_security_test_data(test_type))
     
-    def get_sql_injection_payloads(self) -> List[str]:
+    def get_sql_injection_payloads(self) -> Tuple[str, ...]:
         """Get SQL injection test payloads."""
         return self.get_security_test_data('sql_injection_attempts')
     
-    def get_xss_payloads(self) -> List[str]:
+    def get_xss_payloads(self) -> Tuple[str, ...]:
         """Get XSS test payloads."""
         return self.get_security_test_data('xss_attempts')
     
-    def get_csrf_tokens(self) -> List[str]:
+    def get_csrf_tokens(self) -> Tuple[str, ...]:
         """Get CSRF test tokens."""
         return self.get_security_test_data('csrf_test_tokens')
     
+    def generate_security_scenarios(self, count: int) -> List[Dict[str, str]]:
+        """
+        Pair random SQL injection and XSS payloads, drawing each kind for all pairs in one call.
+        
+        Args:
+            count: Number of payload pairs
+            
+        Returns:
+            List of {'sql_injection': ..., 'xss': ...} dicts, shaped like a security scenario's payloads
+        """
+        sql_payloads = self._rng.choices(self.get_sql_injection_payloads(), k=count)
+        xss_payloads = self._rng.choices(self.get_xss_payloads(), k=count)
+        return [{'sql_injection': sql, 'xss': xss} for sql, xss in zip(sql_payloads, xss_payloads)]
+    
     def generate_random_email(self, domain: str = 'example.com') -> str:
         """
         Generate random email address.
@@ -168,8 +469,8 @@ class TestDataManager:
         Returns:
             Random email address
         """
-        username_length = random.randint(5, 15)
-        username = ''.join(random.choices(string.ascii_lowercase + string.digits, k=username_length))
+        username_length = self._rng.randint(5, 15)
+        username = ''.join(_unbiased_choices(_EMAIL_USERNAME_CHARS, username_length, self._rng))
         return f"{username}@{domain}"
     
     def generate_random_password(self, length: int = 12, include_special: bool = True) -> str:
@@ -183,107 +484,96 @@ class TestDataManager:
         Returns:
             Random password
         """
-        chars = string.ascii_letters + string.digits
-        if include_special:
-            chars += '!@#$%^&*'
+        chars = _CHARS_SPECIAL if include_special else _CHARS_NOSPECIAL
         
         # Ensure password has at least one uppercase, lowercase, digit, and special char
         password = [
-            random.choice(string.ascii_uppercase),
-            random.choice(string.ascii_lowercase),
-            random.choice(string.digits)
+            *_unbiased_choices(_UPPER, 1, self._rng),
+            *_unbiased_choices(_LOWER, 1, self._rng),
+            *_unbiased_choices(_DIGITS, 1, self._rng)
         ]
         
         if include_special:
-            password.append(random.choice('!@#$%^&*'))
+            password.extend(_unbiased_choices(_SPECIALS, 1, self._rng))
         
         # Fill remaining length with random characters
         remaining_length = length - len(password)
-        password.extend(random.choices(chars, k=remaining_length))
+        password.extend(_unbiased_choices(chars, max(remaining_length, 0), self._rng))
         
         # Shuffle the password
-        random.shuffle(password)
+        _shuffle(password, self._rng)
         return ''.join(password)
     
-    def generate_boundary_test_data(self) -> Dict[str, Any]:
-        """Generate boundary test data for input validation."""
-        return {
-            'email_boundaries': {
-                'min_length': 'a@b.co',  # Minimum valid email
-                'max_length': f"{'a' * 60}@{'b' * 60}.com",  # Very long email
-                'empty': '',
-                'whitespace_only': '   ',
-                'special_chars': 'test+user@example.com',
-                'unicode': 'tëst@ëxämplë.com'
-            },
-            'password_boundaries': {
-                'min_length': 'Ab1!',  # 4 characters
-                'max_length': 'A' * 128 + 'b1!',  # Very long password
-                'empty': '',
-                'whitespace_only': '    ',
-                'no_uppercase': 'password123!',
-                'no_lowercase': 'PASSWORD123!',
-                'no_digits': 'Password!',
-                'no_special': 'Password123',
-                'only_spaces': ' ' * 10,
-                'unicode': 'Pässwörd123!'
-            }
-        }
+    def generate_random_passwords(self, count: int, length: int = 12, include_special: bool = True) -> List[str]:
+        """
+        Generate many random passwords, drawing each character class for all of them in one call.
+        
+        Args:
+            count: Number of passwords
+            length: Password length
+            include_special: Include special characters
+            
+        Returns:
+            List of random passwords, each with the guarantees of generate_random_password
+        """
+        chars = _CHARS_SPECIAL if include_special else _CHARS_NOSPECIAL
+        required = [_UPPER, _LOWER, _DIGITS, _SPECIALS] if include_special else [_UPPER, _LOWER, _DIGITS]
+        
+        remaining_length = max(length - len(required), 0)
+        required_draws = [_unbiased_choices(charset, count, self._rng) for charset in required]
+        filler = _unbiased_choices(chars, count * remaining_length, self._rng)
+        
+        passwords = []
+        for index in range(count):
+            password = [draws[index] for draws in required_draws]
+            password.extend(filler[index * remaining_length:(index + 1) * remaining_length])
+            _shuffle(password, self._rng)
+            passwords.append(''.join(password))
+        return passwords
+    
+    def generate_boundary_test_data(self) -> Mapping[str, Mapping[str, str]]:
+        """Get boundary test data for input validation (a read-only view)."""
+        return _BOUNDARY_TEST_DATA
+    
+    def generate_boundary_test_data_mutable(self) -> Dict[str, Dict[str, str]]:
+        """Get a copy of the boundary test data for callers that modify it."""
+        return {group: dict(values) for group, values in _BOUNDARY_TEST_DATA.items()}
     
-    def get_mobile_test_devices(self) -> List[Dict[str, Any]]:
-        """Get mobile device configurations for testing."""
+    def get_mobile_test_devices(self) -> Tuple[MobileDevice, ...]:
+        """Get mobile device configurations for testing (the shared module constant, not a copy)."""
+        return _MOBILE_TEST_DEVICES
+    
+    def get_mobile_test_devices_mutable(self) -> List[Dict[str, Any]]:
+        """Get the mobile device configurations as new dicts, for callers that modify them."""
         return [
             {
-                'name': 'iPhone 12',
-                'user_agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15',
-                'viewport': {'width': 390, 'height': 844},
-                'device_scale_factor': 3
-            },
-            {
-                'name': 'iPhone SE',
-                'user_agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15',
-                'viewport': {'width': 375, 'height': 667},
-                'device_scale_factor': 2
-            },
-            {
-                'name': 'Pixel 5',
-                'user_agent': 'Mozilla/5.0 (Linux; Android 11; Pixel 5) AppleWebKit/537.36',
-                'viewport': {'width': 393, 'height': 851},
-                'device_scale_factor': 2.75
-            },
-            {
-                'name': 'Galaxy S21',
-                'user_agent': 'Mozilla/5.0 (Linux; Android 11; SM-G991B) AppleWebKit/537.36',
-                'viewport': {'width': 384, 'height': 854},
-                'device_scale_factor': 2.75
-            },
-            {
-                'name': 'iPad',
-                'user_agent': 'Mozilla/5.0 (iPad; CPU OS 14_0 like Mac OS X) AppleWebKit/605.1.15',
-                'viewport': {'width': 768, 'height': 1024},
-                'device_scale_factor': 2
-            },
-            {
-                'name': 'iPad Pro',
-                'user_agent': 'Mozilla/5.0 (iPad; CPU OS 14_0 like Mac OS X) AppleWebKit/605.1.15',
-                'viewport': {'width': 1024, 'height': 1366},
-                'device_scale_factor': 2
+                'name': device.name,
+                'user_agent': device.user_agent,
+                'viewport': {'width': device.viewport_width, 'height': device.viewport_height},
+                'device_scale_factor': device.device_scale_factor
             }
+            for device in _MOBILE_TEST_DEVICES
         ]
     
     def load_test_data_from_file(self, file_path: str) -> Dict[str, Any]:
         """
-        Load test data from JSON file.
+        Load test data from JSON file, reusing the parsed result while the file is unchanged.
         
         Args:
             file_path: Path to JSON file
             
         Returns:
-            Test data dictionary
+            Test data dictionary (a shallow copy; nested values are shared, treat them as read-only)
         """
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            path = Path(file_path).resolve()
+            stat = path.stat()
+            key = (str(path), stat.st_mtime_ns, stat.st_size)
+            if key not in _FILE_CACHE:
+                raw = path.read_bytes()
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one handler covers both
+                _FILE_CACHE[key] = orjson.loads(raw) if orjson else json.loads(raw)
+            return copy.copy(_FILE_CACHE[key])
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"Error loading test data from {file_path}: {e}")
             return {}
@@ -299,45 +589,67 @@ class TestDataManager:
         Returns:
             True if successful, False otherwise
         """
+        parent = str(Path(file_path).parent)
         try:
-            # Create directory if it doesn't exist
-            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+            # Create directory if it doesn't exist (once per directory per process)
+            if parent not in _ENSURED_DIRS:
+                Path(parent).mkdir(parents=True, exist_ok=True)
+                _ENSURED_DIRS.add(parent)
             
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            if orjson:
+                with open(file_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                # json.dump writes many small chunks; a large buffer turns them into few syscalls
+                with open(file_path, 'w', buffering=_WRITE_BUFFER_SIZE) as f:
+                    json.dump(data, f, indent=2)
             return True
         except Exception as e:
+            # The directory may have been removed since it was created; check it again next time
+            _ENSURED_DIRS.discard(parent)
             print(f"Error saving test data to {file_path}: {e}")
             return False
     
     def get_localization_test_data(self) -> Dict[str, Dict[str, str]]:
-        """Get localization test data for different languages."""
-        return {
-            'en': {
-                'login_button': 'Sign In',
-                'email_placeholder': 'Email',
-                'password_placeholder': 'Password',
-                'remember_me': 'Remember me',
-                'forgot_password': 'Forgot Password?',
-                'invalid_credentials_error': 'Invalid email or password'
-            },
-            'es': {
-                'login_button': 'Iniciar Sesión',
-                'email_placeholder': 'Correo electrónico',
-                'password_placeholder': 'Contraseña',
-                'remember_me': 'Recordarme',
-                'forgot_password': '¿Olvidaste tu contraseña?',
-                'invalid_credentials_error': 'Correo electrónico o contraseña inválidos'
-            },
-            'fr': {
-                'login_button': 'Se connecter',
-                'email_placeholder': 'E-mail',
-                'password_placeholder': 'Mot de passe',
-                'remember_me': 'Se souvenir de moi',
-                'forgot_password': 'Mot de passe oublié?',
-                'invalid_credentials_error': 'E-mail ou mot de passe invalide'
-            }
-        }
+        """Get localization test data for different languages (the shared module constant, not a copy)."""
+        return _LOCALIZATION_TEST_DATA
+    
+    def get_localization_test_data_encoded(self) -> Dict[str, Dict[str, bytes]]:
+        """Get localization test data encoded as UTF-8 (the shared module constant, not a copy)."""
+        return _LOCALIZATION_TEST_DATA_UTF8
+    
+    def get_localization_test_data_mutable(self) -> Dict[str, Dict[str, str]]:
+        """Get a deep copy of the localization test data for callers that modify it."""
+        return copy.deepcopy(_LOCALIZATION_TEST_DATA)
+    
+    def _acquire_scenario(self) -> Dict[str, Any]:
+        """Take an empty scenario dict from the pool, or create one if the pool is empty."""
+        return self._scenario_pool.pop() if self._scenario_pool else {}
+    
+    def _release_scenario(self, scenario_data: Dict[str, Any]) -> None:
+        """
+        Clear a scenario dict and return it to the pool.
+        
+        Args:
+            scenario_data: Dict returned by create_test_scenario_data; must not be used afterwards
+        """
+        if len(self._scenario_pool) < self.SCENARIO_POOL_MAX_SIZE:
+            scenario_data.clear()
+            self._scenario_pool.append(scenario_data)
+    
+    @contextmanager
+    def scenario(self, scenario_name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Create scenario data that is recycled when the block exits.
+        
+        Args:
+            scenario_name: Name of the test scenario
+        """
+        scenario_data = self.create_test_scenario_data(scenario_name)
+        try:
+            yield scenario_data
+        finally:
+            self._release_scenario(scenario_data)
     
     def create_test_scenario_data(self, scenario_name: str) -> Dict[str, Any]:
         """
@@ -349,29 +661,23 @@ class TestDataManager:
         Returns:
             Scenario-specific test data
         """
-        scenario_data = {
-            'scenario_name': scenario_name,
-            'timestamp': str(random.randint(1000000000, 9999999999)),
-            'test_id': f"TEST_{scenario_name.upper()}_{random.randint(1000, 9999)}"
-        }
+        scenario_data = self._acquire_scenario()
+        scenario_data['scenario_name'] = scenario_name
+        scenario_data['timestamp'] = str(self._rng.randint(1000000000, 9999999999))
+        scenario_data['test_id'] = f"TEST_{scenario_name.upper()}_{self._rng.randint(1000, 9999)}"
         
         # Add scenario-specific data based on scenario name
-        if 'login' in scenario_name.lower():
-            scenario_data.update({
-                'credentials': self.get_valid_credentials(),
-                'expected_redirect': '/dashboard'
-            })
-        elif 'invalid' in scenario_name.lower():
-            scenario_data.update({
-                'credentials': self.get_random_invalid_credentials(),
-                'expected_error': 'Invalid email or password'
-            })
-        elif 'security' in scenario_name.lower():
-            scenario_data.update({
-                'security_payloads': {
-                    'sql_injection': random.choice(self.get_sql_injection_payloads()),
-                    'xss': random.choice(self.get_xss_payloads())
-                }
-            })
+        lowered_name = scenario_name.lower()
+        if 'login' in lowered_name:
+            scenario_data['credentials'] = self.get_valid_credentials_mutable()
+            scenario_data['expected_redirect'] = '/dashboard'
+        elif 'invalid' in lowered_name:
+            scenario_data['credentials'] = dict(self.get_random_invalid_credentials())
+            scenario_data['expected_error'] = 'Invalid email or password'
+        elif 'security' in lowered_name:
+            scenario_data['security_payloads'] = {
+                'sql_injection': self._rng.choice(self.get_sql_injection_payloads()),
+                'xss': self._rng.choice(self.get_xss_payloads())
+            }
         
         return scenario_data